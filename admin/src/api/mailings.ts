@@ -55,6 +55,8 @@ export interface MailingsQueryParams {
   offset?: number;
   sort_by?: string | null;
   order?: string | null;
+  /** ID of the last mailing of the previous page; replaces ``offset``. */
+  after_id?: number | null;
 }
 
 /**
@@ -67,6 +69,7 @@ export async function getMailings(params: MailingsQueryParams = {}): Promise<Mai
   if (params.offset !== undefined) search.set('offset', String(params.offset));
   if (params.sort_by) search.set('sort_by', params.sort_by);
   if (params.order) search.set('order', params.order);
+  if (params.after_id != null) search.set('after_id', String(params.after_id));
   const query = search.toString();
   const url = `/api/v1/mailings/${query ? `?${query}` : ''}`;
   return apiFetch<Mailing[]>(url);
@@ -110,11 +113,12 @@ export async function sendMailing(id: number): Promise<number> {
 /** Retrieve delivery logs for a mailing.  Results may be paginated. */
 export async function getMailingLogs(
   id: number,
-  params: { limit?: number; offset?: number } = {},
+  params: { limit?: number; offset?: number; after_id?: number | null } = {},
 ): Promise<MailingLog[]> {
   const search = new URLSearchParams();
   if (params.limit !== undefined) search.set('limit', String(params.limit));
   if (params.offset !== undefined) search.set('offset', String(params.offset));
+  if (params.after_id != null) search.set('after_id', String(params.after_id));
   const query = search.toString();
   const url = `/api/v1/mailings/${id}/logs${query ? `?${query}` : ''}`;
   return apiFetch<MailingLog[]>(url);
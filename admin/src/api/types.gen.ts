@@ -545,7 +545,10 @@ export interface paths {
      * List mailings
      * @description List mailings.
      *
-     * Only super administrators may view the list.  Results are paginated.
+     * Only super administrators may view the list.  Results are paginated:
+     * pass the ``id`` of the last returned mailing as ``after_id`` (keeping
+     * ``sort_by`` and ``order``) to get the next page.  ``offset`` is still
+     * accepted for existing clients.
      */
     get: operations["list_mailings_api_v1_mailings__get"];
     /**
@@ -604,7 +607,9 @@ export interface paths {
      * Get mailing logs
      * @description Retrieve delivery logs for a mailing.
      *
-     * Only super administrators may view logs.  Results are paginated.
+     * Only super administrators may view logs.  Results are paginated by
+     * ``after_id`` (the ``id`` of the last returned entry) or, for existing
+     * clients, by ``offset``.
      */
     get: operations["get_logs_api_v1_mailings__mailing_id__logs_get"];
   };
@@ -753,7 +758,9 @@ export interface paths {
      * @description Retrieve audit logs with optional filters.
      *
      * Only users with role_id == 1 may access this endpoint.  Returns a
-     * list of audit records ordered by timestamp descending.
+     * list of audit records ordered by timestamp descending.  The body
+     * is encoded by the service and returned as is; ``response_model``
+     * only documents its shape.
      */
     get: operations["list_audit_logs_api_v1_audit_logs_get"];
   };
@@ -815,15 +822,37 @@ export type webhooks = Record<string, never>;
 
 export interface components {
   schemas: {
+    /**
+     * AuditLogRead
+     * @description Schema for reading a single audit log entry.
+     */
+    AuditLogRead: {
+      /** Id */
+      id: number;
+      /** User Id */
+      user_id?: number | null;
+      /** Action */
+      action: string;
+      /** Object Type */
+      object_type?: string | null;
+      /** Object Id */
+      object_id?: number | null;
+      /** Timestamp */
+      timestamp?: string | null;
+      /** Details */
+      details?: unknown;
+    };
     /**
      * BookingCreate
      * @description Schema for creating a booking.
+     * @example {
+     *   "group_size": 1
+     * }
      */
     BookingCreate: {
       /**
        * Group Size
        * @default 1
-       * @example 1
        */
       group_size?: number;
       /**
@@ -853,12 +882,12 @@ export interface components {
        * Is Paid
        * @default false
        */
-      is_paid?: boolean | null;
+      is_paid?: boolean;
       /**
        * Is Attended
        * @default false
        */
-      is_attended?: boolean | null;
+      is_attended?: boolean;
       /** Group Names */
       group_names?: string[] | null;
     };
@@ -888,38 +917,32 @@ export interface components {
     /**
      * EventCreate
      * @description Schema for creating an event.
+     * @example {
+     *   "description": "A relaxing yoga session",
+     *   "duration_minutes": 60,
+     *   "is_paid": false,
+     *   "max_participants": 15,
+     *   "start_time": "2025-09-01T10:00:00Z",
+     *   "title": "Yoga Class"
+     * }
      */
     EventCreate: {
-      /**
-       * Title
-       * @example Yoga Class
-       */
+      /** Title */
       title: string;
-      /**
-       * Description
-       * @example A relaxing yoga session
-       */
+      /** Description */
       description?: string | null;
       /**
        * Start Time
        * Format: date-time
-       * @example 2025-09-01T10:00:00Z
        */
       start_time: string;
-      /**
-       * Duration Minutes
-       * @example 60
-       */
+      /** Duration Minutes */
       duration_minutes: number;
-      /**
-       * Max Participants
-       * @example 15
-       */
+      /** Max Participants */
       max_participants: number;
       /**
        * Is Paid
        * @default false
-       * @example false
        */
       is_paid?: boolean;
     };
@@ -929,50 +952,46 @@ export interface components {
      *
      * Requires a new start time for the duplicated event.  Other fields
      * will be copied from the source event.
+     * @example {
+     *   "start_time": "2025-09-15T10:00:00Z"
+     * }
      */
     EventDuplicate: {
       /**
        * Start Time
        * Format: date-time
-       * @example 2025-09-15T10:00:00Z
        */
       start_time: string;
     };
     /**
      * EventRead
      * @description Schema for reading an event from the API.
+     * @example {
+     *   "description": "A relaxing yoga session",
+     *   "duration_minutes": 60,
+     *   "is_paid": false,
+     *   "max_participants": 15,
+     *   "start_time": "2025-09-01T10:00:00Z",
+     *   "title": "Yoga Class"
+     * }
      */
     EventRead: {
-      /**
-       * Title
-       * @example Yoga Class
-       */
+      /** Title */
       title: string;
-      /**
-       * Description
-       * @example A relaxing yoga session
-       */
+      /** Description */
       description?: string | null;
       /**
        * Start Time
        * Format: date-time
-       * @example 2025-09-01T10:00:00Z
        */
       start_time: string;
-      /**
-       * Duration Minutes
-       * @example 60
-       */
+      /** Duration Minutes */
       duration_minutes: number;
-      /**
-       * Max Participants
-       * @example 15
-       */
+      /** Max Participants */
       max_participants: number;
       /**
        * Is Paid
        * @default false
-       * @example false
        */
       is_paid?: boolean;
       /** Id */
@@ -1170,68 +1189,66 @@ export interface components {
     /**
      * PaymentCreate
      * @description Schema for creating a payment.
+     * @example {
+     *   "amount": 1000,
+     *   "currency": "RUB",
+     *   "description": "Оплата участия в мероприятии",
+     *   "event_id": 1,
+     *   "provider": "yookassa"
+     * }
      */
     PaymentCreate: {
-      /**
-       * Amount
-       * @example 1000
-       */
+      /** Amount */
       amount: number;
       /**
        * Currency
        * @default RUB
-       * @example RUB
        */
       currency?: string;
-      /**
-       * Description
-       * @example Оплата участия в мероприятии
-       */
+      /** Description */
       description?: string | null;
       /**
        * Event Id
        * @description ID мероприятия, если платеж связан с событием
-       * @example 1
        */
       event_id?: number | null;
       /**
        * Provider
        * @description Источник платежа: yookassa, support или cash
-       * @example yookassa
        */
       provider?: string | null;
     };
     /**
      * PaymentRead
      * @description Schema for reading a payment.
+     * @example {
+     *   "amount": 1000,
+     *   "currency": "RUB",
+     *   "description": "Оплата участия в мероприятии",
+     *   "event_id": 1,
+     *   "external_id": "2bcd42fa",
+     *   "provider": "yookassa",
+     *   "status": "pending"
+     * }
      */
     PaymentRead: {
-      /**
-       * Amount
-       * @example 1000
-       */
+      /** Amount */
       amount: number;
       /**
        * Currency
        * @default RUB
-       * @example RUB
        */
       currency?: string;
-      /**
-       * Description
-       * @example Оплата участия в мероприятии
-       */
+      /** Description */
       description?: string | null;
       /**
        * Event Id
        * @description ID мероприятия, если платеж связан с событием
-       * @example 1
        */
       event_id?: number | null;
       /**
        * Provider
        * @description Источник платежа: yookassa, support или cash
-       * @example yookassa
        */
       provider?: string | null;
       /** Id */
@@ -1241,15 +1258,9 @@ export interface components {
        * Format: date-time
        */
       created_at: string;
-      /**
-       * Status
-       * @example pending
-       */
+      /** Status */
       status?: string | null;
-      /**
-       * External Id
-       * @example 2bcd42fa
-       */
+      /** External Id */
       external_id?: string | null;
       /** Confirmed By */
       confirmed_by?: number | null;
@@ -1419,17 +1430,17 @@ export interface components {
      * SupportTicketUpdate
      * @description Schema for updating the status of an existing support ticket.
      *
-     * Only the ``status`` field may be updated.  Valid statuses include
-     * ``open``, ``in_progress``, ``resolved`` and ``closed``.  Validation
-     * of allowed values should be performed at the service or endpoint
-     * level.
+     * Only the ``status`` field may be updated.  Valid statuses are
+     * ``open``, ``in_progress``, ``resolved`` and ``closed``; any other
+     * value is rejected with 422 during request validation.
      */
     SupportTicketUpdate: {
       /**
        * Status
        * @description New status for the ticket
+       * @enum {string}
        */
-      status: string;
+      status: "open" | "in_progress" | "resolved" | "closed";
     };
     /**
      * TaskRead
@@ -1485,66 +1496,85 @@ export interface components {
      * Хотя поле ``password`` остаётся необязательным, рекомендуется не отправлять
      * его для пользователей Telegram/соцсетей.  Валидация осуществляется на
      * уровне сервисов.
+     * @example {
+     *   "disabled": false,
+     *   "email": "user@example.com",
+     *   "full_name": "Иван Иванов",
+     *   "password": "strongpassword",
+     *   "social_id": "123456789",
+     *   "social_provider": "telegram"
+     * }
      */
     UserCreate: {
-      /**
-       * Email
-       * @example user@example.com
-       */
+      /** Email */
       email?: string | null;
-      /**
-       * Full Name
-       * @example Иван Иванов
-       */
+      /** Full Name */
       full_name?: string | null;
       /**
        * Disabled
        * @default false
-       * @example false
        */
       disabled?: boolean;
-      /**
-       * Password
-       * @example strongpassword
-       */
+      /** Password */
       password?: string | null;
       /**
        * Social Provider
        * @description Краткий код социальной сети (telegram, vk, etc.)
-       * @example telegram
        */
       social_provider?: string | null;
       /**
        * Social Id
        * @description Идентификатор пользователя в социальной сети
-       * @example 123456789
        */
       social_id?: string | null;
     };
     /**
      * UserRead
      * @description Schema for reading a user from the API.
+     * @example {
+     *   "disabled": false,
+     *   "email": "user@example.com",
+     *   "full_name": "Иван Иванов"
+     * }
      */
     UserRead: {
-      /**
-       * Email
-       * @example user@example.com
-       */
+      /** Email */
       email?: string | null;
-      /**
-       * Full Name
-       * @example Иван Иванов
-       */
+      /** Full Name */
       full_name?: string | null;
       /**
        * Disabled
        * @default false
-       * @example false
        */
       disabled?: boolean;
       /** Id */
       id: number;
     };
+    /**
+     * UserUpdate
+     * @description Schema for partially updating a user (``PUT /users/{id}``).
+     *
+     * Все поля необязательны; изменяются только переданные.  ``role_id``
+     * может менять только супер‑администратор (проверяется в эндпоинте),
+     * в том числе при передаче ``null``.  Прочие поля (например, ``email``,
+     * который отправляет форма админ‑панели) игнорируются.
+     * @example {
+     *   "disabled": false,
+     *   "full_name": "Иван Иванов",
+     *   "password": "newstrongpassword",
+     *   "role_id": 3
+     * }
+     */
+    UserUpdate: {
+      /** Full Name */
+      full_name?: string | null;
+      /** Disabled */
+      disabled?: boolean | null;
+      /** Password */
+      password?: string | null;
+      /** Role Id */
+      role_id?: number | null;
+    };
     /** ValidationError */
     ValidationError: {
       /** Location */
@@ -1932,9 +1962,7 @@ export interface operations {
     };
     requestBody: {
       content: {
-        "application/json": {
-          [key: string]: unknown;
-        };
+        "application/json": components["schemas"]["UserUpdate"];
       };
     };
     responses: {
@@ -3186,7 +3214,10 @@ export interface operations {
    * List mailings
    * @description List mailings.
    *
-   * Only super administrators may view the list.  Results are paginated.
+   * Only super administrators may view the list.  Results are paginated:
+   * pass the ``id`` of the last returned mailing as ``after_id`` (keeping
+   * ``sort_by`` and ``order``) to get the next page.  ``offset`` is still
+   * accepted for existing clients.
    */
   list_mailings_api_v1_mailings__get: {
     parameters: {
@@ -3197,6 +3228,8 @@ export interface operations {
         sort_by?: string | null;
         /** @description Sort order 'asc' or 'desc' */
         order?: string | null;
+        /** @description ID of the last mailing of the previous page; replaces offset */
+        after_id?: number | null;
       };
     };
     responses: {
@@ -3367,13 +3400,17 @@ export interface operations {
    * Get mailing logs
    * @description Retrieve delivery logs for a mailing.
    *
-   * Only super administrators may view logs.  Results are paginated.
+   * Only super administrators may view logs.  Results are paginated by
+   * ``after_id`` (the ``id`` of the last returned entry) or, for existing
+   * clients, by ``offset``.
    */
   get_logs_api_v1_mailings__mailing_id__logs_get: {
     parameters: {
       query?: {
         limit?: number;
         offset?: number;
+        /** @description ID of the last log entry of the previous page; replaces offset */
+        after_id?: number | null;
       };
       path: {
         mailing_id: number;
@@ -3854,7 +3891,9 @@ export interface operations {
    * @description Retrieve audit logs with optional filters.
    *
    * Only users with role_id == 1 may access this endpoint.  Returns a
-   * list of audit records ordered by timestamp descending.
+   * list of audit records ordered by timestamp descending.  The body
+   * is encoded by the service and returned as is; ``response_model``
+   * only documents its shape.
    */
   list_audit_logs_api_v1_audit_logs_get: {
     parameters: {
@@ -3879,9 +3918,7 @@ export interface operations {
       /** @description Successful Response */
       200: {
         content: {
-          "application/json": {
-              [key: string]: unknown;
-            }[];
+          "application/json": components["schemas"]["AuditLogRead"][];
         };
       };
       /** @description Validation Error */
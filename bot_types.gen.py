@@ -1,6 +1,6 @@
 # generated by datamodel-codegen:
 #   filename:  openapi.json
-#   timestamp: 2025-09-13T04:54:54+00:00
+#   timestamp: 2026-10-16T13:05:08+00:00
 
 from __future__ import annotations
 
@@ -719,9 +719,7 @@ class Parameter6(BaseModel):
 
 
 class Schema33(BaseModel):
-    type: str
-    additionalProperties: bool
-    title: str
+    field_ref: str = Field(..., alias='$ref')
 
 
 class ApplicationJson26(BaseModel):
@@ -737,12 +735,8 @@ class RequestBody6(BaseModel):
     content: Content26
 
 
-class Schema34(BaseModel):
-    field_ref: str = Field(..., alias='$ref')
-
-
 class ApplicationJson27(BaseModel):
-    schema_: Schema34 = Field(..., alias='schema')
+    schema_: Schema33 = Field(..., alias='schema')
 
 
 class Content27(BaseModel):
@@ -755,7 +749,7 @@ class Field2007(BaseModel):
 
 
 class ApplicationJson28(BaseModel):
-    schema_: Schema34 = Field(..., alias='schema')
+    schema_: Schema33 = Field(..., alias='schema')
 
 
 class Content28(BaseModel):
@@ -3302,13 +3296,18 @@ class Post19(BaseModel):
     responses: Responses53
 
 
+class AnyOfItem6(BaseModel):
+    type: str
+    minimum: Optional[int] = None
+
+
 class Schema149(BaseModel):
     type: Optional[str] = None
     maximum: Optional[int] = None
     minimum: Optional[int] = None
     default: Optional[int] = None
     title: str
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem6]] = None
     description: Optional[str] = None
 
 
@@ -3616,11 +3615,13 @@ class FieldApiV1MailingsMailingIdSend(BaseModel):
 
 
 class Schema164(BaseModel):
-    type: str
+    type: Optional[str] = None
     title: str
     maximum: Optional[int] = None
     minimum: Optional[int] = None
     default: Optional[int] = None
+    anyOf: Optional[List[AnyOfItem6]] = None
+    description: Optional[str] = None
 
 
 class Parameter44(BaseModel):
@@ -3628,6 +3629,7 @@ class Parameter44(BaseModel):
     in_: str = Field(..., alias='in')
     required: bool
     schema_: Schema164 = Field(..., alias='schema')
+    description: Optional[str] = None
 
 
 class Schema165(BaseModel):
@@ -4428,8 +4430,12 @@ class FieldApiV1StatisticsEvents(BaseModel):
     get: Get27
 
 
+class AnyOfItem8(BaseModel):
+    type: str
+
+
 class Schema202(BaseModel):
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem8]] = None
     description: str
     title: str
     type: Optional[str] = None
@@ -4501,7 +4507,7 @@ class FieldApiV1StatisticsPayments(BaseModel):
 
 
 class Schema205(BaseModel):
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem8]] = None
     description: str
     title: str
     type: Optional[str] = None
@@ -4573,7 +4579,7 @@ class FieldApiV1StatisticsBookings(BaseModel):
 
 
 class Schema208(BaseModel):
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem8]] = None
     description: str
     title: str
     type: Optional[str] = None
@@ -4645,7 +4651,7 @@ class FieldApiV1StatisticsUsers(BaseModel):
 
 
 class Schema211(BaseModel):
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem8]] = None
     description: str
     title: str
     type: Optional[str] = None
@@ -4662,9 +4668,13 @@ class Parameter57(BaseModel):
     description: str
 
 
+class Items18(BaseModel):
+    field_ref: str = Field(..., alias='$ref')
+
+
 class Schema212(BaseModel):
     type: str
-    items: Items14
+    items: Items18
     title: str
 
 
@@ -4722,7 +4732,7 @@ class Schema214(BaseModel):
     pattern: Optional[str] = None
     description: str
     title: str
-    anyOf: Optional[List[AnyOfItem4]] = None
+    anyOf: Optional[List[AnyOfItem8]] = None
 
 
 class Parameter58(BaseModel):
@@ -4733,13 +4743,9 @@ class Parameter58(BaseModel):
     description: str
 
 
-class Items19(BaseModel):
-    field_ref: str = Field(..., alias='$ref')
-
-
 class Schema215(BaseModel):
     type: str
-    items: Items19
+    items: Items18
     title: str
 
 
@@ -4969,47 +4975,103 @@ class Paths(BaseModel):
     )
 
 
+class Id(BaseModel):
+    type: str
+    title: str
+
+
+class UserId(BaseModel):
+    anyOf: List[AnyOfItem8]
+    title: str
+
+
+class Action(BaseModel):
+    type: str
+    title: str
+
+
+class ObjectType(BaseModel):
+    anyOf: List[AnyOfItem8]
+    title: str
+
+
+class ObjectId(BaseModel):
+    anyOf: List[AnyOfItem8]
+    title: str
+
+
+class Timestamp(BaseModel):
+    anyOf: List[AnyOfItem8]
+    title: str
+
+
+class AnyOfItem17(BaseModel):
+    type: Optional[str] = None
+
+
+class Details(BaseModel):
+    anyOf: List[AnyOfItem17]
+    title: str
+
+
+class Properties(BaseModel):
+    id: Id
+    user_id: UserId
+    action: Action
+    object_type: ObjectType
+    object_id: ObjectId
+    timestamp: Timestamp
+    details: Details
+
+
+class AuditLogRead(BaseModel):
+    properties: Properties
+    type: str
+    required: List[str]
+    title: str
+    description: str
+
+
 class GroupSize(BaseModel):
     type: str
     minimum: float
     title: str
     default: int
-    example: int
 
 
 class Items20(BaseModel):
     type: str
 
 
-class AnyOfItem12(BaseModel):
+class AnyOfItem18(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class GroupNames(BaseModel):
-    anyOf: List[AnyOfItem12]
+    anyOf: List[AnyOfItem18]
     title: str
     description: str
 
 
-class Properties(BaseModel):
+class Properties1(BaseModel):
     group_size: GroupSize
     group_names: GroupNames
 
 
-class BookingCreate(BaseModel):
-    properties: Properties
-    type: str
-    title: str
-    description: str
+class Example(BaseModel):
+    group_size: int
 
 
-class Id(BaseModel):
+class BookingCreate(BaseModel):
+    properties: Properties1
     type: str
     title: str
+    description: str
+    example: Example
 
 
-class UserId(BaseModel):
+class UserId1(BaseModel):
     type: str
     title: str
 
@@ -5035,35 +5097,31 @@ class CreatedAt(BaseModel):
     title: str
 
 
-class AnyOfItem13(BaseModel):
-    type: str
-
-
 class IsPaid(BaseModel):
-    anyOf: List[AnyOfItem13]
+    type: str
     title: str
     default: bool
 
 
 class IsAttended(BaseModel):
-    anyOf: List[AnyOfItem13]
+    type: str
     title: str
     default: bool
 
 
-class AnyOfItem15(BaseModel):
+class AnyOfItem19(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class GroupNames1(BaseModel):
-    anyOf: List[AnyOfItem15]
+    anyOf: List[AnyOfItem19]
     title: str
 
 
-class Properties1(BaseModel):
+class Properties2(BaseModel):
     id: Id
-    user_id: UserId
+    user_id: UserId1
     event_id: EventId
     group_size: GroupSize1
     status: Status
@@ -5074,41 +5132,41 @@ class Properties1(BaseModel):
 
 
 class BookingRead(BaseModel):
-    properties: Properties1
+    properties: Properties2
     type: str
     required: List[str]
     title: str
 
 
-class AnyOfItem16(BaseModel):
+class AnyOfItem20(BaseModel):
     type: str
     minimum: Optional[float] = None
 
 
 class GroupSize2(BaseModel):
-    anyOf: List[AnyOfItem16]
+    anyOf: List[AnyOfItem20]
     title: str
     description: str
 
 
-class AnyOfItem17(BaseModel):
+class AnyOfItem21(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class GroupNames2(BaseModel):
-    anyOf: List[AnyOfItem17]
+    anyOf: List[AnyOfItem21]
     title: str
     description: str
 
 
-class Properties2(BaseModel):
+class Properties3(BaseModel):
     group_size: GroupSize2
     group_names: GroupNames2
 
 
 class BookingUpdate(BaseModel):
-    properties: Properties2
+    properties: Properties3
     type: str
     title: str
     description: str
@@ -5117,143 +5175,155 @@ class BookingUpdate(BaseModel):
 class Title(BaseModel):
     type: str
     title: str
-    example: str
 
 
-class AnyOfItem18(BaseModel):
+class AnyOfItem22(BaseModel):
     type: str
 
 
 class Description(BaseModel):
-    anyOf: List[AnyOfItem18]
+    anyOf: List[AnyOfItem22]
     title: str
-    example: str
 
 
 class StartTime(BaseModel):
     type: str
     format: str
     title: str
-    example: str
 
 
 class DurationMinutes(BaseModel):
     type: str
     title: str
-    example: int
 
 
 class MaxParticipants(BaseModel):
     type: str
     title: str
-    example: int
-
-
-class IsPaid1(BaseModel):
-    type: str
-    title: str
-    default: bool
-    example: bool
 
 
-class Properties3(BaseModel):
+class Properties4(BaseModel):
     title: Title
     description: Description
     start_time: StartTime
     duration_minutes: DurationMinutes
     max_participants: MaxParticipants
-    is_paid: IsPaid1
+    is_paid: IsPaid
+
+
+class Example1(BaseModel):
+    description: str
+    duration_minutes: int
+    is_paid: bool
+    max_participants: int
+    start_time: str
+    title: str
 
 
 class EventCreate(BaseModel):
-    properties: Properties3
+    properties: Properties4
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example1
 
 
-class Properties4(BaseModel):
+class Properties5(BaseModel):
     start_time: StartTime
 
 
+class Example2(BaseModel):
+    start_time: str
+
+
 class EventDuplicate(BaseModel):
-    properties: Properties4
+    properties: Properties5
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example2
 
 
 class Description1(BaseModel):
-    anyOf: List[AnyOfItem18]
+    anyOf: List[AnyOfItem22]
     title: str
-    example: str
 
 
-class Properties5(BaseModel):
+class Properties6(BaseModel):
     title: Title
     description: Description1
     start_time: StartTime
     duration_minutes: DurationMinutes
     max_participants: MaxParticipants
-    is_paid: IsPaid1
+    is_paid: IsPaid
     id: Id
 
 
+class Example3(BaseModel):
+    description: str
+    duration_minutes: int
+    is_paid: bool
+    max_participants: int
+    start_time: str
+    title: str
+
+
 class EventRead(BaseModel):
-    properties: Properties5
+    properties: Properties6
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example3
 
 
 class Title2(BaseModel):
-    anyOf: List[AnyOfItem18]
+    anyOf: List[AnyOfItem22]
     title: str
 
 
 class Description2(BaseModel):
-    anyOf: List[AnyOfItem18]
+    anyOf: List[AnyOfItem22]
     title: str
 
 
-class AnyOfItem22(BaseModel):
+class AnyOfItem26(BaseModel):
     type: str
     format: Optional[str] = None
 
 
 class StartTime3(BaseModel):
-    anyOf: List[AnyOfItem22]
+    anyOf: List[AnyOfItem26]
     title: str
 
 
-class AnyOfItem23(BaseModel):
+class AnyOfItem27(BaseModel):
     type: str
 
 
 class DurationMinutes2(BaseModel):
-    anyOf: List[AnyOfItem23]
+    anyOf: List[AnyOfItem27]
     title: str
 
 
 class MaxParticipants2(BaseModel):
-    anyOf: List[AnyOfItem23]
+    anyOf: List[AnyOfItem27]
     title: str
 
 
 class IsPaid3(BaseModel):
-    anyOf: List[AnyOfItem23]
+    anyOf: List[AnyOfItem27]
     title: str
 
 
 class Price(BaseModel):
-    anyOf: List[AnyOfItem23]
+    anyOf: List[AnyOfItem27]
     title: str
 
 
-class Properties6(BaseModel):
+class Properties7(BaseModel):
     title: Title2
     description: Description2
     start_time: StartTime3
@@ -5264,7 +5334,7 @@ class Properties6(BaseModel):
 
 
 class EventUpdate(BaseModel):
-    properties: Properties6
+    properties: Properties7
     type: str
     title: str
     description: str
@@ -5277,7 +5347,7 @@ class QuestionShort(BaseModel):
 
 
 class QuestionFull(BaseModel):
-    anyOf: List[AnyOfItem23]
+    anyOf: List[AnyOfItem27]
     title: str
     description: str
 
@@ -5288,29 +5358,29 @@ class Answer(BaseModel):
     description: str
 
 
-class AnyOfItem28(BaseModel):
+class AnyOfItem32(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class Attachments(BaseModel):
-    anyOf: List[AnyOfItem28]
+    anyOf: List[AnyOfItem32]
     title: str
     description: str
 
 
-class AnyOfItem29(BaseModel):
+class AnyOfItem33(BaseModel):
     type: str
 
 
 class Position(BaseModel):
-    anyOf: List[AnyOfItem29]
+    anyOf: List[AnyOfItem33]
     title: str
     description: str
     default: int
 
 
-class Properties7(BaseModel):
+class Properties8(BaseModel):
     question_short: QuestionShort
     question_full: QuestionFull
     answer: Answer
@@ -5319,7 +5389,7 @@ class Properties7(BaseModel):
 
 
 class FAQCreate(BaseModel):
-    properties: Properties7
+    properties: Properties8
     type: str
     required: List[str]
     title: str
@@ -5332,7 +5402,7 @@ class QuestionShort1(BaseModel):
 
 
 class QuestionFull1(BaseModel):
-    anyOf: List[AnyOfItem29]
+    anyOf: List[AnyOfItem33]
     title: str
 
 
@@ -5341,13 +5411,13 @@ class Answer1(BaseModel):
     title: str
 
 
-class AnyOfItem31(BaseModel):
+class AnyOfItem35(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class Attachments1(BaseModel):
-    anyOf: List[AnyOfItem31]
+    anyOf: List[AnyOfItem35]
     title: str
 
 
@@ -5366,7 +5436,7 @@ class UpdatedAt(BaseModel):
     title: str
 
 
-class Properties8(BaseModel):
+class Properties9(BaseModel):
     id: Id
     question_short: QuestionShort1
     question_full: QuestionFull1
@@ -5378,52 +5448,52 @@ class Properties8(BaseModel):
 
 
 class FAQRead(BaseModel):
-    properties: Properties8
+    properties: Properties9
     type: str
     required: List[str]
     title: str
     description: str
 
 
-class AnyOfItem32(BaseModel):
+class AnyOfItem36(BaseModel):
     type: str
 
 
 class QuestionShort2(BaseModel):
-    anyOf: List[AnyOfItem32]
+    anyOf: List[AnyOfItem36]
     title: str
 
 
 class QuestionFull2(BaseModel):
-    anyOf: List[AnyOfItem32]
+    anyOf: List[AnyOfItem36]
     title: str
 
 
 class Answer2(BaseModel):
-    anyOf: List[AnyOfItem32]
+    anyOf: List[AnyOfItem36]
     title: str
 
 
-class AnyOfItem35(BaseModel):
+class AnyOfItem39(BaseModel):
     items: Optional[Items20] = None
     type: str
 
 
 class Attachments2(BaseModel):
-    anyOf: List[AnyOfItem35]
+    anyOf: List[AnyOfItem39]
     title: str
 
 
-class AnyOfItem36(BaseModel):
+class AnyOfItem40(BaseModel):
     type: str
 
 
 class Position2(BaseModel):
-    anyOf: List[AnyOfItem36]
+    anyOf: List[AnyOfItem40]
     title: str
 
 
-class Properties9(BaseModel):
+class Properties10(BaseModel):
     question_short: QuestionShort2
     question_full: QuestionFull2
     answer: Answer2
@@ -5432,7 +5502,7 @@ class Properties9(BaseModel):
 
 
 class FAQUpdate(BaseModel):
-    properties: Properties9
+    properties: Properties10
     type: str
     title: str
     description: str
@@ -5448,12 +5518,12 @@ class Detail(BaseModel):
     title: str
 
 
-class Properties10(BaseModel):
+class Properties11(BaseModel):
     detail: Detail
 
 
 class HTTPValidationError(BaseModel):
-    properties: Properties10
+    properties: Properties11
     type: str
     title: str
 
@@ -5470,24 +5540,24 @@ class Content162(BaseModel):
     description: str
 
 
-class AnyOfItem37(BaseModel):
+class AnyOfItem41(BaseModel):
     additionalProperties: Optional[bool] = None
     type: str
 
 
 class Filters(BaseModel):
-    anyOf: List[AnyOfItem37]
+    anyOf: List[AnyOfItem41]
     title: str
     description: str
 
 
-class AnyOfItem38(BaseModel):
+class AnyOfItem42(BaseModel):
     type: str
     format: Optional[str] = None
 
 
 class ScheduledAt(BaseModel):
-    anyOf: List[AnyOfItem38]
+    anyOf: List[AnyOfItem42]
     title: str
     description: str
 
@@ -5496,18 +5566,18 @@ class Items27(BaseModel):
     type: str
 
 
-class AnyOfItem39(BaseModel):
+class AnyOfItem43(BaseModel):
     items: Optional[Items27] = None
     type: str
 
 
 class Messengers(BaseModel):
-    anyOf: List[AnyOfItem39]
+    anyOf: List[AnyOfItem43]
     title: str
     description: str
 
 
-class Properties11(BaseModel):
+class Properties12(BaseModel):
     title: Title3
     content: Content162
     filters: Filters
@@ -5516,7 +5586,7 @@ class Properties11(BaseModel):
 
 
 class MailingCreate(BaseModel):
-    properties: Properties11
+    properties: Properties12
     type: str
     required: List[str]
     title: str
@@ -5528,12 +5598,12 @@ class MailingId(BaseModel):
     title: str
 
 
-class AnyOfItem40(BaseModel):
+class AnyOfItem44(BaseModel):
     type: str
 
 
 class ErrorMessage(BaseModel):
-    anyOf: List[AnyOfItem40]
+    anyOf: List[AnyOfItem44]
     title: str
 
 
@@ -5542,17 +5612,17 @@ class SentAt(BaseModel):
     title: str
 
 
-class Properties12(BaseModel):
+class Properties13(BaseModel):
     id: Id
     mailing_id: MailingId
-    user_id: UserId
+    user_id: UserId1
     status: Status
     error_message: ErrorMessage
     sent_at: SentAt
 
 
 class MailingLogRead(BaseModel):
-    properties: Properties12
+    properties: Properties13
     type: str
     required: List[str]
     title: str
@@ -5574,36 +5644,36 @@ class Content163(BaseModel):
     title: str
 
 
-class AnyOfItem41(BaseModel):
+class AnyOfItem45(BaseModel):
     additionalProperties: Optional[bool] = None
     type: str
 
 
 class Filters1(BaseModel):
-    anyOf: List[AnyOfItem41]
+    anyOf: List[AnyOfItem45]
     title: str
 
 
-class AnyOfItem42(BaseModel):
+class AnyOfItem46(BaseModel):
     type: str
 
 
 class ScheduledAt1(BaseModel):
-    anyOf: List[AnyOfItem42]
+    anyOf: List[AnyOfItem46]
     title: str
 
 
-class AnyOfItem43(BaseModel):
+class AnyOfItem47(BaseModel):
     items: Optional[Items27] = None
     type: str
 
 
 class Messengers1(BaseModel):
-    anyOf: List[AnyOfItem43]
+    anyOf: List[AnyOfItem47]
     title: str
 
 
-class Properties13(BaseModel):
+class Properties14(BaseModel):
     id: Id
     created_by: CreatedBy
     title: Title4
@@ -5615,58 +5685,58 @@ class Properties13(BaseModel):
 
 
 class MailingRead(BaseModel):
-    properties: Properties13
+    properties: Properties14
     type: str
     required: List[str]
     title: str
     description: str
 
 
-class AnyOfItem44(BaseModel):
+class AnyOfItem48(BaseModel):
     type: str
 
 
 class Title5(BaseModel):
-    anyOf: List[AnyOfItem44]
+    anyOf: List[AnyOfItem48]
     title: str
 
 
 class Content164(BaseModel):
-    anyOf: List[AnyOfItem44]
+    anyOf: List[AnyOfItem48]
     title: str
 
 
-class AnyOfItem46(BaseModel):
+class AnyOfItem50(BaseModel):
     additionalProperties: Optional[bool] = None
     type: str
 
 
 class Filters2(BaseModel):
-    anyOf: List[AnyOfItem46]
+    anyOf: List[AnyOfItem50]
     title: str
 
 
-class AnyOfItem47(BaseModel):
+class AnyOfItem51(BaseModel):
     type: str
     format: Optional[str] = None
 
 
 class ScheduledAt2(BaseModel):
-    anyOf: List[AnyOfItem47]
+    anyOf: List[AnyOfItem51]
     title: str
 
 
-class AnyOfItem48(BaseModel):
+class AnyOfItem52(BaseModel):
     items: Optional[Items27] = None
     type: str
 
 
 class Messengers2(BaseModel):
-    anyOf: List[AnyOfItem48]
+    anyOf: List[AnyOfItem52]
     title: str
 
 
-class Properties14(BaseModel):
+class Properties15(BaseModel):
     title: Title5
     content: Content164
     filters: Filters2
@@ -5675,7 +5745,7 @@ class Properties14(BaseModel):
 
 
 class MailingUpdate(BaseModel):
-    properties: Properties14
+    properties: Properties15
     type: str
     title: str
 
@@ -5683,41 +5753,36 @@ class MailingUpdate(BaseModel):
 class Amount(BaseModel):
     type: str
     title: str
-    example: float
 
 
 class Currency(BaseModel):
     type: str
     title: str
     default: str
-    example: str
 
 
-class AnyOfItem49(BaseModel):
+class AnyOfItem53(BaseModel):
     type: str
 
 
 class Description3(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
-    example: str
 
 
 class EventId1(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
     description: str
-    example: int
 
 
 class Provider(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
     description: str
-    example: str
 
 
-class Properties15(BaseModel):
+class Properties16(BaseModel):
     amount: Amount
     currency: Currency
     description: Description3
@@ -5725,32 +5790,38 @@ class Properties15(BaseModel):
     provider: Provider
 
 
+class Example4(BaseModel):
+    amount: float
+    currency: str
+    description: str
+    event_id: int
+    provider: str
+
+
 class PaymentCreate(BaseModel):
-    properties: Properties15
+    properties: Properties16
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example4
 
 
 class Description4(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
-    example: str
 
 
 class EventId2(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
     description: str
-    example: int
 
 
 class Provider1(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
     description: str
-    example: str
 
 
 class CreatedAt3(BaseModel):
@@ -5760,33 +5831,31 @@ class CreatedAt3(BaseModel):
 
 
 class Status2(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
-    example: str
 
 
 class ExternalId(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
-    example: str
 
 
 class ConfirmedBy(BaseModel):
-    anyOf: List[AnyOfItem49]
+    anyOf: List[AnyOfItem53]
     title: str
 
 
-class AnyOfItem58(BaseModel):
+class AnyOfItem62(BaseModel):
     type: str
     format: Optional[str] = None
 
 
 class ConfirmedAt(BaseModel):
-    anyOf: List[AnyOfItem58]
+    anyOf: List[AnyOfItem62]
     title: str
 
 
-class Properties16(BaseModel):
+class Properties17(BaseModel):
     amount: Amount
     currency: Currency
     description: Description4
@@ -5800,12 +5869,23 @@ class Properties16(BaseModel):
     confirmed_at: ConfirmedAt
 
 
+class Example5(BaseModel):
+    amount: float
+    currency: str
+    description: str
+    event_id: int
+    external_id: str
+    provider: str
+    status: str
+
+
 class PaymentRead(BaseModel):
-    properties: Properties16
+    properties: Properties17
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example5
 
 
 class EventId3(BaseModel):
@@ -5822,24 +5902,25 @@ class Rating(BaseModel):
     description: str
 
 
-class AnyOfItem59(BaseModel):
+class AnyOfItem63(BaseModel):
     type: str
+    maxLength: Optional[int] = None
 
 
 class Comment(BaseModel):
-    anyOf: List[AnyOfItem59]
+    anyOf: List[AnyOfItem63]
     title: str
     description: str
 
 
-class Properties17(BaseModel):
+class Properties18(BaseModel):
     event_id: EventId3
     rating: Rating
     comment: Comment
 
 
 class ReviewCreate(BaseModel):
-    properties: Properties17
+    properties: Properties18
     type: str
     required: List[str]
     title: str
@@ -5852,12 +5933,12 @@ class Approved(BaseModel):
     description: str
 
 
-class Properties18(BaseModel):
+class Properties19(BaseModel):
     approved: Approved
 
 
 class ReviewModerate(BaseModel):
-    properties: Properties18
+    properties: Properties19
     type: str
     required: List[str]
     title: str
@@ -5874,8 +5955,12 @@ class Rating1(BaseModel):
     title: str
 
 
+class AnyOfItem64(BaseModel):
+    type: str
+
+
 class Comment1(BaseModel):
-    anyOf: List[AnyOfItem59]
+    anyOf: List[AnyOfItem64]
     title: str
 
 
@@ -5885,7 +5970,7 @@ class Approved1(BaseModel):
 
 
 class ModeratedBy(BaseModel):
-    anyOf: List[AnyOfItem59]
+    anyOf: List[AnyOfItem64]
     title: str
 
 
@@ -5894,9 +5979,9 @@ class CreatedAt4(BaseModel):
     title: str
 
 
-class Properties19(BaseModel):
+class Properties20(BaseModel):
     id: Id
-    user_id: UserId
+    user_id: UserId1
     event_id: EventId4
     rating: Rating1
     comment: Comment1
@@ -5906,7 +5991,7 @@ class Properties19(BaseModel):
 
 
 class ReviewRead(BaseModel):
-    properties: Properties19
+    properties: Properties20
     type: str
     required: List[str]
     title: str
@@ -5924,18 +6009,18 @@ class SocialId(BaseModel):
 
 
 class FullName(BaseModel):
-    anyOf: List[AnyOfItem59]
+    anyOf: List[AnyOfItem64]
     title: str
 
 
-class Properties20(BaseModel):
+class Properties21(BaseModel):
     social_provider: SocialProvider
     social_id: SocialId
     full_name: FullName
 
 
 class SocialLogin(BaseModel):
-    properties: Properties20
+    properties: Properties21
     type: str
     required: List[str]
     title: str
@@ -5948,24 +6033,24 @@ class Content165(BaseModel):
     description: str
 
 
-class AnyOfItem63(BaseModel):
+class AnyOfItem67(BaseModel):
     items: Optional[Items27] = None
     type: str
 
 
 class Attachments3(BaseModel):
-    anyOf: List[AnyOfItem63]
+    anyOf: List[AnyOfItem67]
     title: str
     description: str
 
 
-class Properties21(BaseModel):
+class Properties22(BaseModel):
     content: Content165
     attachments: Attachments3
 
 
 class SupportMessageCreate(BaseModel):
-    properties: Properties21
+    properties: Properties22
     type: str
     required: List[str]
     title: str
@@ -5987,43 +6072,43 @@ class SenderRole(BaseModel):
     title: str
 
 
-class AnyOfItem64(BaseModel):
+class AnyOfItem68(BaseModel):
     type: str
 
 
-class UserId3(BaseModel):
-    anyOf: List[AnyOfItem64]
+class UserId4(BaseModel):
+    anyOf: List[AnyOfItem68]
     title: str
 
 
 class AdminId(BaseModel):
-    anyOf: List[AnyOfItem64]
+    anyOf: List[AnyOfItem68]
     title: str
 
 
-class AnyOfItem66(BaseModel):
+class AnyOfItem70(BaseModel):
     items: Optional[Items27] = None
     type: str
 
 
 class Attachments4(BaseModel):
-    anyOf: List[AnyOfItem66]
+    anyOf: List[AnyOfItem70]
     title: str
 
 
-class Properties22(BaseModel):
+class Properties23(BaseModel):
     id: Id
     ticket_id: TicketId
     content: Content166
     created_at: CreatedAt4
     sender_role: SenderRole
-    user_id: UserId3
+    user_id: UserId4
     admin_id: AdminId
     attachments: Attachments4
 
 
 class SupportMessageRead(BaseModel):
-    properties: Properties22
+    properties: Properties23
     type: str
     required: List[str]
     title: str
@@ -6042,30 +6127,30 @@ class Content167(BaseModel):
     description: str
 
 
-class Properties23(BaseModel):
+class Properties24(BaseModel):
     subject: Subject
     content: Content167
 
 
 class SupportTicketCreate(BaseModel):
-    properties: Properties23
+    properties: Properties24
     type: str
     required: List[str]
     title: str
     description: str
 
 
-class UserId4(BaseModel):
+class UserId5(BaseModel):
     type: str
     title: str
 
 
-class AnyOfItem67(BaseModel):
+class AnyOfItem71(BaseModel):
     type: str
 
 
 class Subject1(BaseModel):
-    anyOf: List[AnyOfItem67]
+    anyOf: List[AnyOfItem71]
     title: str
 
 
@@ -6074,9 +6159,9 @@ class Status3(BaseModel):
     title: str
 
 
-class Properties24(BaseModel):
+class Properties25(BaseModel):
     id: Id
-    user_id: UserId4
+    user_id: UserId5
     subject: Subject1
     status: Status3
     created_at: CreatedAt4
@@ -6084,7 +6169,7 @@ class Properties24(BaseModel):
 
 
 class SupportTicketRead(BaseModel):
-    properties: Properties24
+    properties: Properties25
     type: str
     required: List[str]
     title: str
@@ -6093,16 +6178,17 @@ class SupportTicketRead(BaseModel):
 
 class Status4(BaseModel):
     type: str
+    enum: List[str]
     title: str
     description: str
 
 
-class Properties25(BaseModel):
+class Properties26(BaseModel):
     status: Status4
 
 
 class SupportTicketUpdate(BaseModel):
-    properties: Properties25
+    properties: Properties26
     type: str
     required: List[str]
     title: str
@@ -6115,26 +6201,26 @@ class Type(BaseModel):
 
 
 class Title6(BaseModel):
-    anyOf: List[AnyOfItem67]
+    anyOf: List[AnyOfItem71]
     title: str
 
 
 class Description5(BaseModel):
-    anyOf: List[AnyOfItem67]
+    anyOf: List[AnyOfItem71]
     title: str
 
 
-class AnyOfItem70(BaseModel):
+class AnyOfItem74(BaseModel):
     type: str
     format: Optional[str] = None
 
 
 class ScheduledAt3(BaseModel):
-    anyOf: List[AnyOfItem70]
+    anyOf: List[AnyOfItem74]
     title: str
 
 
-class Properties26(BaseModel):
+class Properties27(BaseModel):
     id: Id
     type: Type
     title: Title6
@@ -6143,7 +6229,7 @@ class Properties26(BaseModel):
 
 
 class TaskRead(BaseModel):
-    properties: Properties26
+    properties: Properties27
     type: str
     required: List[str]
     title: str
@@ -6164,63 +6250,57 @@ class Messages(BaseModel):
     title: str
 
 
-class Properties27(BaseModel):
+class Properties28(BaseModel):
     ticket: Ticket
     messages: Messages
 
 
 class TicketWithMessages(BaseModel):
-    properties: Properties27
+    properties: Properties28
     type: str
     required: List[str]
     title: str
     description: str
 
 
-class AnyOfItem71(BaseModel):
+class AnyOfItem75(BaseModel):
     type: str
 
 
 class Email(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
-    example: str
 
 
 class FullName1(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
-    example: str
 
 
 class Disabled(BaseModel):
     type: str
     title: str
     default: bool
-    example: bool
 
 
 class Password(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
-    example: str
 
 
 class SocialProvider1(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
     description: str
-    example: str
 
 
 class SocialId1(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
     description: str
-    example: str
 
 
-class Properties28(BaseModel):
+class Properties29(BaseModel):
     email: Email
     full_name: FullName1
     disabled: Disabled
@@ -6229,42 +6309,109 @@ class Properties28(BaseModel):
     social_id: SocialId1
 
 
+class Example6(BaseModel):
+    disabled: bool
+    email: str
+    full_name: str
+    password: str
+    social_id: str
+    social_provider: str
+
+
 class UserCreate(BaseModel):
-    properties: Properties28
+    properties: Properties29
     type: str
     title: str
     description: str
+    example: Example6
 
 
 class Email1(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
-    example: str
 
 
 class FullName2(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem75]
     title: str
-    example: str
 
 
-class Properties29(BaseModel):
+class Properties30(BaseModel):
     email: Email1
     full_name: FullName2
     disabled: Disabled
     id: Id
 
 
+class Example7(BaseModel):
+    disabled: bool
+    email: str
+    full_name: str
+
+
 class UserRead(BaseModel):
-    properties: Properties29
+    properties: Properties30
     type: str
     required: List[str]
     title: str
     description: str
+    example: Example7
+
+
+class FullName3(BaseModel):
+    anyOf: List[AnyOfItem75]
+    title: str
+
+
+class Disabled2(BaseModel):
+    anyOf: List[AnyOfItem75]
+    title: str
+
+
+class AnyOfItem84(BaseModel):
+    type: str
+    format: Optional[str] = None
+    writeOnly: Optional[bool] = None
+
+
+class Password1(BaseModel):
+    anyOf: List[AnyOfItem84]
+    title: str
+
+
+class AnyOfItem85(BaseModel):
+    type: str
+
+
+class RoleId(BaseModel):
+    anyOf: List[AnyOfItem85]
+    title: str
+
+
+class Properties31(BaseModel):
+    full_name: FullName3
+    disabled: Disabled2
+    password: Password1
+    role_id: RoleId
+
+
+class Example8(BaseModel):
+    disabled: bool
+    full_name: str
+    password: str
+    role_id: int
+
+
+class UserUpdate(BaseModel):
+    properties: Properties31
+    type: str
+    title: str
+    description: str
+    example: Example8
 
 
 class Items33(BaseModel):
-    anyOf: List[AnyOfItem71]
+    anyOf: List[AnyOfItem85]
 
 
 class Loc(BaseModel):
@@ -6278,14 +6425,14 @@ class Msg(BaseModel):
     title: str
 
 
-class Properties30(BaseModel):
+class Properties32(BaseModel):
     loc: Loc
     msg: Msg
     type: Type
 
 
 class ValidationError(BaseModel):
-    properties: Properties30
+    properties: Properties32
     type: str
     required: List[str]
     title: str
@@ -6298,12 +6445,12 @@ class Position3(BaseModel):
     description: str
 
 
-class Properties31(BaseModel):
+class Properties33(BaseModel):
     position: Position3
 
 
 class WaitlistUpdate(BaseModel):
-    properties: Properties31
+    properties: Properties33
     type: str
     required: List[str]
     title: str
@@ -6311,6 +6458,7 @@ class WaitlistUpdate(BaseModel):
 
 
 class Schemas(BaseModel):
+    AuditLogRead: AuditLogRead
     BookingCreate: BookingCreate
     BookingRead: BookingRead
     BookingUpdate: BookingUpdate
@@ -6341,6 +6489,7 @@ class Schemas(BaseModel):
     TicketWithMessages: TicketWithMessages
     UserCreate: UserCreate
     UserRead: UserRead
+    UserUpdate: UserUpdate
     ValidationError: ValidationError
     WaitlistUpdate: WaitlistUpdate
 
@@ -12,4 +12,12 @@ The application is designed for extensibility; additional versions or
 new domains can be added without breaking existing functionality.
 """
 
-from .main import app  # noqa: F401
\ No newline at end of file
+
+def __getattr__(name: str):
+    # ``app`` is resolved lazily so that importing a subpackage (services,
+    # schemas, core) does not build the FastAPI application.
+    if name == "app":
+        from .main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
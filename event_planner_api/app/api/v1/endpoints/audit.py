@@ -10,14 +10,16 @@ administrators (role_id == 1) should be allowed to view audit logs.
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 
 from event_planner_api.app.core.security import get_current_user
+from event_planner_api.app.schemas.audit import AuditLogRead
 from event_planner_api.app.services.audit_service import AuditService
 
 router = APIRouter()
 
 
-@router.get("/logs")
+@router.get("/logs", response_model=List[AuditLogRead])
 async def list_audit_logs(
     user_id: Optional[int] = Query(None, description="Filter by acting user ID"),
     object_type: Optional[str] = Query(None, description="Filter by object type (event, booking, payment, etc.)"),
@@ -27,15 +29,17 @@ async def list_audit_logs(
     limit: int = Query(100, ge=1, le=500, description="Maximum number of logs to return"),
     offset: int = Query(0, ge=0, description="Number of logs to skip"),
     current_user: dict = Depends(get_current_user),
-) -> List[dict]:
+) -> Response:
     """Retrieve audit logs with optional filters.
 
     Only users with role_id == 1 may access this endpoint.  Returns a
-    list of audit records ordered by timestamp descending.
+    list of audit records ordered by timestamp descending.  The body
+    is encoded by the service and returned as is; ``response_model``
+    only documents its shape.
     """
     if current_user.get("role_id") != 1:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
-    return await AuditService.list_logs(
+    content = await AuditService.list_logs_json(
         user_id=user_id,
         object_type=object_type,
         action=action,
@@ -43,4 +47,5 @@ async def list_audit_logs(
         end_date=end_date,
         limit=limit,
         offset=offset,
-    )
\ No newline at end of file
+    )
+    return Response(content=content, media_type="application/json")
\ No newline at end of file
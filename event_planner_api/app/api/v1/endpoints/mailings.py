@@ -54,11 +54,17 @@ async def list_mailings(
     offset: int = Query(0, ge=0),
     sort_by: str | None = Query(None, description="Sort by 'created_at' or 'scheduled_at'"),
     order: str | None = Query(None, description="Sort order 'asc' or 'desc'"),
+    after_id: int | None = Query(
+        None, ge=1, description="ID of the last mailing of the previous page; replaces offset"
+    ),
     current_user: dict = Depends(require_roles(1)),
 ) -> List[MailingRead]:
     """List mailings.
 
-    Only super administrators may view the list.  Results are paginated.
+    Only super administrators may view the list.  Results are paginated:
+    pass the ``id`` of the last returned mailing as ``after_id`` (keeping
+    ``sort_by`` and ``order``) to get the next page.  ``offset`` is still
+    accepted for existing clients.
     """
     return await MailingService.list_mailings(
         current_user,
@@ -66,6 +72,7 @@ async def list_mailings(
         offset=offset,
         sort_by=sort_by,
         order=order,
+        after_id=after_id,
     )
 
 
@@ -149,14 +156,21 @@ async def get_logs(
     mailing_id: int,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    after_id: int | None = Query(
+        None, ge=1, description="ID of the last log entry of the previous page; replaces offset"
+    ),
     current_user: dict = Depends(require_roles(1)),
 ) -> List[MailingLogRead]:
     """Retrieve delivery logs for a mailing.
 
-    Only super administrators may view logs.  Results are paginated.
+    Only super administrators may view logs.  Results are paginated by
+    ``after_id`` (the ``id`` of the last returned entry) or, for existing
+    clients, by ``offset``.
     """
     try:
-        return await MailingService.list_logs(mailing_id, current_user, limit=limit, offset=offset)
+        return await MailingService.list_logs(
+            mailing_id, current_user, limit=limit, offset=offset, after_id=after_id
+        )
     except ValueError as e:
         detail = str(e)
         if "Only administrators" in detail:
@@ -8,10 +8,11 @@ operation is controlled by the current user's role, as provided by
 the authentication dependency.
 
 All responses include escaped message content to protect clients from
-HTML injection.
+HTML injection.  Content is escaped once when a message is stored.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 
 from event_planner_api.app.core.security import get_current_user, require_roles
@@ -54,6 +55,8 @@ async def create_ticket(
 @router.get(
     "/tickets",
     response_model=List[SupportTicketRead],
+    response_model_exclude_none=True,
+    response_class=ORJSONResponse,
     summary="List support tickets",
 )
 async def list_tickets(
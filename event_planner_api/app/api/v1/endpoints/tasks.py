@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 
 from event_planner_api.app.schemas.task import TaskRead
 from event_planner_api.app.services.task_service import TaskService
@@ -25,6 +26,10 @@ router = APIRouter()
 @router.get(
     "/tasks",
     response_model=List[TaskRead],
+    # Fields the service did not set (e.g. title/description of unknown
+    # task types) are omitted to keep the polling payload small.
+    response_model_exclude_unset=True,
+    response_class=ORJSONResponse,
     summary="Get pending tasks for a messenger",
     tags=["tasks"],
 )
@@ -7,12 +7,12 @@ algorithm and proper authentication in production.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List
 
-from event_planner_api.app.schemas.user import UserCreate, UserRead
+from event_planner_api.app.schemas.user import UserCreate, UserRead, UserUpdate
 from event_planner_api.app.services.user_service import UserService
 from event_planner_api.app.core.security import create_access_token, get_current_user, require_roles
-from fastapi import Body
 from pydantic import BaseModel
 from typing import Optional as OptionalType
 
@@ -111,7 +111,12 @@ async def social_login(payload: SocialLogin) -> dict:
     return {"access_token": token, "token_type": "bearer"}
 
 
-@router.get("/", response_model=List[UserRead])
+@router.get(
+    "/",
+    response_model=List[UserRead],
+    response_model_exclude_none=True,
+    response_class=ORJSONResponse,
+)
 async def list_users(current_user: dict = Depends(require_roles(1, 2))) -> List[UserRead]:
     """Получить список всех пользователей.
 
@@ -124,7 +129,7 @@ async def list_users(current_user: dict = Depends(require_roles(1, 2))) -> List[
 @router.put("/{user_id}", response_model=UserRead)
 async def update_user(
     user_id: int,
-    body: dict = Body(...),
+    body: UserUpdate,
     current_user: dict = Depends(get_current_user),
 ) -> UserRead:
     """Update a user's profile, status or password.
@@ -137,28 +142,34 @@ async def update_user(
     is_admin = current_user.get("role_id") in (1, 2)
     if not is_admin and current_user.get("user_id") != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
-    updates = {}
     from event_planner_api.app.services.role_service import RoleService
-    # Allowed fields
-    for field in ("full_name", "disabled", "password"):
-        if field in body:
-            updates[field] = body[field]
-    # Role assignment can only be done by super‑administrator (role_id == 1)
-    if "role_id" in body:
+    # Allowed fields (only those explicitly sent by the client)
+    updates = body.model_dump(exclude_unset=True, exclude={"role_id"})
+    password = updates.pop("password", None)
+    if password is not None:
+        updates["password"] = body.password.get_secret_value()
+    # Role assignment can only be done by super‑administrator (role_id == 1).
+    # An explicit null counts as a role change too and is then rejected.
+    if "role_id" in body.model_fields_set:
         # Only super‑administrator may change roles
         if current_user.get("role_id") != 1:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the super administrator can change roles")
+        if body.role_id is None:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="role_id cannot be null")
         try:
-            await RoleService.assign_role(user_id, int(body["role_id"]))
+            assigned = await RoleService.assign_role(user_id, body.role_id)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        # If only role changed, assign_role already returned the fresh user
+        if not updates:
+            return assigned
     # If there are other fields to update
     if updates:
         try:
             return await UserService.update_user(user_id, updates)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    # If only role changed, return the user
+    # Nothing to change: return the current user record
     user = await UserService.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
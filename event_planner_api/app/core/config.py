@@ -49,6 +49,24 @@ class Settings:
     # project root by the ``db`` module.
     database_url: str = os.getenv("DATABASE_URL", "event_planner.db")
 
+    # Seconds for which ``get_current_user`` may reuse a user's id, role
+    # and disabled flag without querying the database.  Changes made via
+    # the API invalidate the cache immediately; this TTL only bounds the
+    # staleness of changes made directly in the database.  0 disables it.
+    user_cache_ttl_seconds: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "10"))
+
+    # Seconds for which ``FAQService.list_faqs``/``get_faq`` may serve a
+    # result from the in-process cache.  FAQ writes through the API clear
+    # the cache immediately.  0 disables it.
+    faq_cache_ttl_seconds: float = float(os.getenv("FAQ_CACHE_TTL_SECONDS", "30"))
+
+    # PBKDF2‑HMAC‑SHA256 iteration count for newly hashed passwords.  The
+    # count is stored inside each hash, so raising it does not invalidate
+    # existing passwords.  ``hashlib.pbkdf2_hmac`` runs inside OpenSSL
+    # (SHA‑NI accelerated on modern x86 CPUs), so higher values are cheap
+    # there.
+    password_hash_iterations: int = int(os.getenv("PASSWORD_HASH_ITERATIONS", "100000"))
+
 
 # Instantiate settings once so other modules can import it without
 # repeatedly reading environment variables.  Because the dataclass
@@ -7,24 +7,44 @@ This module provides functions for obtaining a database connection
 SQLite as a lightweight embedded database; to switch to another DBMS
 you would replace connection logic and adapt SQL syntax accordingly.
 
+Connections are pooled process‑wide: ``get_connection`` hands out the
+most recently released idle connection when one is available and
+``conn.close()`` returns it to the pool instead of closing it, so the
+existing ``try/finally: conn.close()`` pattern keeps working unchanged.
+New code should prefer ``with acquire_connection() as conn:``;
+``immediate_transaction`` wraps a read‑check‑write sequence in a
+transaction that holds SQLite's write lock from the start.
+Read‑only queries can use ``get_read_connection``, which draws from a
+separate pool of ``query_only`` connections.  A single long‑running
+consumer (the audit log writer) can instead keep the process‑wide
+connection from ``get_shared_connection``.  Call ``close_all`` on
+application shutdown to really close them.
+
 The migration mechanism stores applied migration versions in the
 ``migrations`` table and executes new migrations in order.
 """
 
+import itertools
 import os
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, List, Optional, Union
 
 from .config import settings
 
 
+@lru_cache(maxsize=1)
 def get_database_path() -> str:
     """Compute the path to the SQLite database file.
 
     If ``settings.database_url`` is an absolute path, use it directly.
-    Otherwise resolve it relative to the project root.
+    Otherwise resolve it relative to the project root.  The result is
+    cached: settings do not change at runtime and resolving the path
+    costs filesystem syscalls on every new connection.
     """
     db_url = settings.database_url
     # If an absolute path is provided, return as is
@@ -35,17 +55,99 @@ def get_database_path() -> str:
     return str((base_dir / db_url).resolve())
 
 
-def get_connection() -> sqlite3.Connection:
-    """Create and return a new SQLite connection.
+# Maximum number of idle connections kept per kind (writers, readers).
+# Connections are shared by all threads (one user at a time); anything
+# beyond this limit is really closed on release.
+POOL_MAX_IDLE = 8
 
-    The connection uses a row factory to access columns by name.  No
-    type detection/parsing is enabled because some ISO timestamps (e.g.
-    ``2025-09-01T09:00:00Z``) cannot be parsed by SQLite's built‑in
-    converters.  All values will be returned as they are stored in the
-    database (typically strings or numbers).
+# Size of the per-connection prepared statement cache (sqlite3 default is
+# 128).  Pooled connections live for the whole process and the services use
+# a few hundred distinct parameterized statements, so a larger cache lets
+# repeated queries skip SQLite's parse/prepare step.
+STATEMENT_CACHE_SIZE = 256
+
+# WAL lets readers run concurrently with a writer.  The journal mode is
+# persistent (stored in the database file), so it is only set by the first
+# connection opened in the process rather than by every new connection.
+JOURNAL_MODE_PRAGMA = "PRAGMA journal_mode = WAL"
+
+# Applied once to every pooled connection when it is opened (reused pooled
+# connections skip them).  NORMAL sync is safe in WAL mode; reads go
+# through a 128 MiB memory map and each connection keeps up to 64 MiB of
+# page cache.  Writers wait up to 5 s for a lock instead of failing with
+# "database is locked".
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 134217728",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# ``PRAGMA optimize`` is run on a writer connection every this many
+# releases (and on every writer in ``close_all``), so planner statistics
+# keep up with the growing tables.  It only re-analyzes tables whose stats
+# are stale and is a no-op most of the time.
+OPTIMIZE_EVERY = 1000
+
+# Idle connections by ``read_only`` flag, used as LIFO stacks so the
+# warmest connection (hot page cache) is reused first.
+_idle: "dict[bool, List[PooledConnection]]" = {False: [], True: []}
+_pool_lock = threading.Lock()
+# Every pooled connection ever opened (idle, borrowed or shared), so
+# ``close_all`` can reach all of them.
+_all_connections: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+_all_connections_lock = threading.Lock()
+_shared_connection: Optional["PooledConnection"] = None
+_shared_connection_lock = threading.Lock()
+# Whether ``JOURNAL_MODE_PRAGMA`` has been applied in this process.
+_journal_mode_set = False
+# ``get_table_columns`` cache: table name -> column names.  Cleared by
+# ``init_db`` after migrations run and by ``close_all``.
+_table_columns: "dict[str, frozenset[str]]" = {}
+# Counts writer releases for ``OPTIMIZE_EVERY`` (``next`` is atomic).
+_writer_releases = itertools.count(1)
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that returns itself to the pool on ``close()``.
+
+    Any transaction left open by the caller is rolled back before the
+    connection is reused.  ``close_physically`` really closes it.
+    Reader connections (``read_only``) have ``PRAGMA query_only`` set
+    and live in a separate pool from writer connections.  The ``shared``
+    connection is never pooled and stays open until ``close_all``.
     """
+
+    in_pool: bool = False
+    closed: bool = False
+    read_only: bool = False
+    shared: bool = False
+
+    def close(self) -> None:  # type: ignore[override]
+        _release(self)
+
+    def close_physically(self) -> None:
+        self.closed = True
+        self.in_pool = False
+        super().close()
+
+
+def _open_connection(read_only: bool = False) -> PooledConnection:
+    global _journal_mode_set
     db_path = get_database_path()
-    conn = sqlite3.connect(db_path)
+    # Pooled connections move between threads (one user at a time), hence
+    # ``check_same_thread=False``.  No declared-type converters
+    # (``detect_types=0``): columns come back as stored and the services
+    # convert the few that need it themselves (``bool(is_paid)``, JSON
+    # columns, timestamps), so plain fetches skip converter lookups.
+    conn = sqlite3.connect(
+        db_path,
+        factory=PooledConnection,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        detect_types=0,
+    )
     # Return rows as dict‑like objects keyed by column name
     conn.row_factory = sqlite3.Row
     # Enable foreign key constraints for the lifetime of the connection.  In SQLite
@@ -59,12 +161,198 @@ def get_connection() -> sqlite3.Connection:
         # be enforced, which could lead to orphaned records.  See README for
         # more details on enabling FK enforcement in production.
         pass
+    if not _journal_mode_set:
+        try:
+            _journal_mode_set = conn.execute(JOURNAL_MODE_PRAGMA).fetchone()[0] == "wal"
+        except sqlite3.Error:
+            pass
+    for pragma in CONNECTION_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+    if read_only:
+        # Must come last: setting journal_mode above is a write.
+        conn.execute("PRAGMA query_only = ON")
+        conn.read_only = True
+    with _all_connections_lock:
+        _all_connections.add(conn)
     return conn
 
 
+def _optimize(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` on a writer connection, ignoring errors."""
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+
+
+def _release(conn: PooledConnection) -> None:
+    """Return ``conn`` to the pool (or close it)."""
+    if conn.closed or conn.in_pool:
+        return
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        conn.close_physically()
+        return
+    if conn.shared:
+        return
+    if not conn.read_only and next(_writer_releases) % OPTIMIZE_EVERY == 0:
+        _optimize(conn)
+    # Callers may have swapped the row factory; restore the default.
+    conn.row_factory = sqlite3.Row
+    with _pool_lock:
+        idle = _idle[conn.read_only]
+        if len(idle) < POOL_MAX_IDLE:
+            conn.in_pool = True
+            idle.append(conn)
+            return
+    conn.close_physically()
+
+
+def _acquire(read_only: bool) -> PooledConnection:
+    with _pool_lock:
+        idle = _idle[read_only]
+        while idle:
+            conn = idle.pop()
+            if not conn.closed:
+                conn.in_pool = False
+                return conn
+    return _open_connection(read_only)
+
+
+def get_connection() -> sqlite3.Connection:
+    """Return a pooled SQLite (writer) connection.
+
+    The connection uses a row factory to access columns by name.  No
+    type detection/parsing is enabled because some ISO timestamps (e.g.
+    ``2025-09-01T09:00:00Z``) cannot be parsed by SQLite's built‑in
+    converters.  All values will be returned as they are stored in the
+    database (typically strings or numbers).
+
+    Calling ``close()`` on the returned connection releases it back to
+    the pool; uncommitted changes are rolled back at that point.  This
+    is a writer connection; see ``get_read_connection`` for queries
+    that never modify the database.
+
+    New connections are configured once when opened: WAL journal
+    (``JOURNAL_MODE_PRAGMA``, first connection of the process only),
+    ``synchronous = NORMAL``, ``busy_timeout``, in‑memory temp storage and
+    the cache sizes from ``CONNECTION_PRAGMAS``.  Connections reused from
+    the pool are not configured again.
+    """
+    return _acquire(read_only=False)
+
+
+def get_write_connection() -> sqlite3.Connection:
+    """Return a pooled writer connection (same as ``get_connection``)."""
+    return _acquire(read_only=False)
+
+
+def get_read_connection() -> sqlite3.Connection:
+    """Return a pooled reader connection (``PRAGMA query_only = ON``).
+
+    Readers come from their own pool, so read‑only queries never take a
+    writer connection.  In WAL mode they run concurrently with the
+    writer; any attempt to modify the database raises
+    ``sqlite3.OperationalError``.  Release with ``close()`` as usual.
+    """
+    return _acquire(read_only=True)
+
+
+def get_shared_connection() -> sqlite3.Connection:
+    """Return the process‑wide long‑lived writer connection.
+
+    Meant for one long‑running consumer that would otherwise acquire and
+    release a pooled connection for every unit of work (the audit log
+    writer).  The caller is responsible for serialising its use.
+    ``close()`` only rolls back an open transaction; the connection is
+    really closed by ``close_all`` and reopened on the next call.
+    """
+    global _shared_connection
+    with _shared_connection_lock:
+        conn = _shared_connection
+        if conn is None or conn.closed:
+            conn = _open_connection()
+            conn.shared = True
+            _shared_connection = conn
+        return conn
+
+
+@contextmanager
+def acquire_connection(read_only: bool = False) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection for the duration of a ``with`` block.
+
+    The connection goes back to the pool when the block exits, also on
+    error; anything not committed by then is rolled back.  Pass
+    ``read_only=True`` to get a reader (see ``get_read_connection``).
+    """
+    conn = _acquire(read_only)
+    try:
+        yield conn
+    finally:
+        _release(conn)
+
+
+def get_table_columns(table: str) -> "frozenset[str]":
+    """Return the column names of ``table`` (empty if it does not exist).
+
+    ``PRAGMA table_info`` runs once per table and process; the result is
+    cached until the next migration (``init_db``), the only place the
+    schema changes.  ``table`` must be a trusted identifier, not user
+    input.
+    """
+    columns = _table_columns.get(table)
+    if columns is None:
+        with acquire_connection(read_only=True) as conn:
+            columns = frozenset(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+        # A missing table is not cached: it may be created later
+        if columns:
+            _table_columns[table] = columns
+    return columns
+
+
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    """Run a ``with`` block inside a ``BEGIN IMMEDIATE`` transaction.
+
+    The write lock is taken up front, so read‑check‑write sequences (e.g.
+    counting free seats before inserting a booking) cannot interleave with
+    another writer, and a busy database is waited for (``busy_timeout``) at
+    ``BEGIN`` instead of failing half‑way when a deferred transaction tries
+    to upgrade its read lock.  Yields a cursor; whatever is still
+    uncommitted is committed when the block exits normally and rolled back
+    on error.  The block may also call ``conn.commit()`` itself.
+
+    There is no in‑process writer lock: SQLite's database lock and
+    ``busy_timeout`` arbitrate between writers.  The services run the block
+    synchronously on the event‑loop thread, so the block must not contain
+    an ``await`` that yields (``AuditService.log(..., cursor=cursor)`` does
+    not).  Otherwise another coroutine could start its own ``BEGIN
+    IMMEDIATE`` meanwhile and block the loop for up to ``busy_timeout``
+    waiting on this transaction.
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        yield cursor
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    if conn.in_transaction:
+        conn.commit()
+
+
 @contextmanager
 def get_cursor() -> Iterator[sqlite3.Cursor]:
-    """Context manager that yields a cursor and closes the connection on exit."""
+    """Context manager that yields a cursor and commits on success.
+
+    The connection is released back to the pool on exit (not closed).
+    """
     conn = get_connection()
     try:
         yield conn.cursor()
@@ -73,15 +361,293 @@ def get_cursor() -> Iterator[sqlite3.Cursor]:
         conn.close()
 
 
+def close_all() -> None:
+    """Close every pooled connection.  Intended for application shutdown.
+
+    Writer connections run ``PRAGMA optimize`` first, as SQLite recommends
+    before closing a connection.
+    """
+    global _journal_mode_set
+    with _all_connections_lock:
+        connections = list(_all_connections)
+        _all_connections.clear()
+    for conn in connections:
+        if not conn.closed and not conn.read_only:
+            _optimize(conn)
+        try:
+            conn.close_physically()
+        except sqlite3.Error:
+            pass
+    with _pool_lock:
+        _idle[False].clear()
+        _idle[True].clear()
+    _table_columns.clear()
+    # The database file may be replaced before connections are reopened
+    _journal_mode_set = False
+
+
+# Final schema produced by migrations 1..CONSOLIDATED_SCHEMA_VERSION, used to
+# create a fresh (empty) database in one step instead of replaying every
+# migration and its ALTER TABLE statements.  Columns added by later
+# migrations are appended in the same order, so the result is identical to
+# an incrementally migrated database.  Whenever a migration is added to
+# ``init_db``, update this schema and bump the version; until then fresh
+# databases fall back to the incremental path.
+CONSOLIDATED_SCHEMA_VERSION = 18
+CONSOLIDATED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    permissions TEXT
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    full_name TEXT,
+    password TEXT,
+    role_id INTEGER,
+    balance REAL DEFAULT 0,
+    disabled INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    social_provider TEXT DEFAULT 'internal',
+    social_id TEXT,
+    FOREIGN KEY(role_id) REFERENCES roles(id)
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    start_time TIMESTAMP NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    max_participants INTEGER NOT NULL,
+    is_paid INTEGER NOT NULL DEFAULT 0,
+    price REAL,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(created_by) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS payments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    event_id INTEGER,
+    amount REAL NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'RUB',
+    payment_method TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    provider TEXT,
+    external_id TEXT,
+    confirmed_by INTEGER,
+    confirmed_at TIMESTAMP,
+    notes TEXT,
+    FOREIGN KEY(user_id) REFERENCES users(id),
+    FOREIGN KEY(event_id) REFERENCES events(id)
+);
+
+CREATE TABLE IF NOT EXISTS bookings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    group_size INTEGER DEFAULT 1,
+    payment_id INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_paid INTEGER NOT NULL DEFAULT 0,
+    is_attended INTEGER NOT NULL DEFAULT 0,
+    group_names TEXT,
+    FOREIGN KEY(user_id) REFERENCES users(id),
+    FOREIGN KEY(event_id) REFERENCES events(id),
+    FOREIGN KEY(payment_id) REFERENCES payments(id)
+);
+
+CREATE TABLE IF NOT EXISTS waitlist (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(event_id) REFERENCES events(id),
+    FOREIGN KEY(user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS support_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    admin_id INTEGER,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ticket_id INTEGER,
+    sender_role TEXT,
+    attachments TEXT,
+    content_escaped TEXT,
+    FOREIGN KEY(user_id) REFERENCES users(id),
+    FOREIGN KEY(admin_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    rating INTEGER NOT NULL,
+    comment TEXT,
+    approved INTEGER DEFAULT 0,
+    moderated_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(user_id) REFERENCES users(id),
+    FOREIGN KEY(event_id) REFERENCES events(id),
+    FOREIGN KEY(moderated_by) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS mailings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_by INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    filters TEXT,
+    scheduled_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    messengers TEXT,
+    FOREIGN KEY(created_by) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    type TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    action TEXT NOT NULL,
+    object_type TEXT,
+    object_id INTEGER,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    details TEXT,
+    FOREIGN KEY(user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS bot_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    content TEXT NOT NULL,
+    buttons TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS faqs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question_short TEXT NOT NULL,
+    question_full TEXT,
+    answer TEXT NOT NULL,
+    attachments TEXT,
+    position INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    question_short_escaped TEXT,
+    question_full_escaped TEXT,
+    answer_escaped TEXT
+);
+
+CREATE TABLE IF NOT EXISTS mailing_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mailing_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(mailing_id) REFERENCES mailings(id),
+    FOREIGN KEY(user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    message_id INTEGER,
+    content TEXT NOT NULL,
+    context TEXT,
+    status TEXT NOT NULL DEFAULT 'sent',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS support_tickets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    subject TEXT,
+    status TEXT NOT NULL DEFAULT 'open',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(user_id) REFERENCES users(id)
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    object_id INTEGER NOT NULL,
+    messenger TEXT NOT NULL,
+    scheduled_at TIMESTAMP,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_support_messages_ticket ON support_messages(ticket_id);
+CREATE INDEX IF NOT EXISTS idx_bookings_user_id ON bookings(user_id);
+CREATE INDEX IF NOT EXISTS idx_waitlist_user_id ON waitlist(user_id);
+CREATE INDEX IF NOT EXISTS idx_support_tickets_user_id ON support_tickets(user_id);
+CREATE INDEX IF NOT EXISTS idx_support_messages_user_id ON support_messages(user_id);
+CREATE INDEX IF NOT EXISTS idx_support_messages_admin_id ON support_messages(admin_id);
+CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews(user_id);
+CREATE INDEX IF NOT EXISTS idx_payments_user_id ON payments(user_id);
+CREATE INDEX IF NOT EXISTS idx_mailing_logs_user_id ON mailing_logs(user_id);
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
+CREATE INDEX IF NOT EXISTS idx_users_email_covering ON users(email, id, role_id, disabled);
+CREATE INDEX IF NOT EXISTS idx_bookings_event ON bookings(event_id, status);
+CREATE INDEX IF NOT EXISTS idx_waitlist_event_pos_user ON waitlist(event_id, position, id, user_id);
+CREATE INDEX IF NOT EXISTS idx_payments_event ON payments(event_id);
+CREATE INDEX IF NOT EXISTS idx_reviews_event ON reviews(event_id);
+CREATE INDEX IF NOT EXISTS idx_events_start_time ON events(start_time);
+CREATE INDEX IF NOT EXISTS idx_mailings_created_at ON mailings(created_at);
+CREATE INDEX IF NOT EXISTS idx_mailing_logs_mailing_sent ON mailing_logs(mailing_id, sent_at);
+"""
+
+
+def _add_bookings_group_names(cursor: sqlite3.Cursor) -> str:
+    """SQL for migration 13: add ``bookings.group_names`` unless present.
+
+    Before this migration BookingService added the column lazily on the
+    first booking, so existing databases may already have it and a plain
+    ``ALTER TABLE`` would fail there.
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(bookings)")}
+    if "group_names" in columns:
+        return ""
+    return "ALTER TABLE bookings ADD COLUMN group_names TEXT;"
+
+
 def init_db() -> None:
     """Initialise the database and apply pending migrations.
 
     Creates the ``migrations`` table if it does not exist, checks the
     current schema version, and applies any new migrations defined in
-    the ``MIGRATIONS`` list.  If you add a new migration, append it
-    with an incremented version number.
+    the ``MIGRATIONS`` list in a single transaction.  If you add a new
+    migration, append it with an incremented version number.  A migration
+    is normally an SQL script; it may instead be a function that receives
+    a cursor and returns the script, for changes that depend on the
+    current schema.
     """
-    migrations: list[tuple[int, str]] = [
+    migrations: list[tuple[int, Union[str, Callable[[sqlite3.Cursor], str]]]] = [
         # Migration 1: Initial schema
         (
             1,
@@ -374,9 +940,119 @@ def init_db() -> None:
             ALTER TABLE mailings ADD COLUMN messengers TEXT;
             """,
         ),
+
+        # Migration 11: store HTML-escaped support message content
+        (
+            11,
+            """
+            -- Support message content is served HTML-escaped.  Escaping is done once
+            -- when a message is written (SupportService) instead of on every read; the
+            -- raw ``content`` is kept for auditing.  Existing rows are backfilled with
+            -- the same replacements as Python's ``html.escape(s, quote=True)``.
+            ALTER TABLE support_messages ADD COLUMN content_escaped TEXT;
+            UPDATE support_messages
+            SET content_escaped = replace(replace(replace(replace(replace(
+                content, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#x27;');
+            """,
+        ),
+
+        # Migration 12: covering index for the authentication lookup
+        (
+            12,
+            """
+            -- ``get_current_user`` runs ``SELECT id, role_id, disabled FROM users WHERE
+            -- email = ?``.  The implicit UNIQUE index on email does not contain the other
+            -- columns; this one does, so the query is answered from the index alone.
+            -- The planner prefers the UNIQUE index, hence ``INDEXED BY`` in the query
+            -- (which falls back to the plain query if this index is missing).
+            CREATE INDEX IF NOT EXISTS idx_users_email_covering ON users(email, id, role_id, disabled);
+            """,
+        ),
+
+        # Migration 13: names of group booking participants (JSON list)
+        (13, _add_bookings_group_names),
+
+        # Migration 14: per-event indices for bookings and the waitlist
+        (
+            14,
+            """
+            -- Bookings are listed and their seats summed per event, and the waitlist
+            -- is read per event in ``position`` order; both were full table scans.
+            CREATE INDEX IF NOT EXISTS idx_bookings_event ON bookings(event_id, status);
+            CREATE INDEX IF NOT EXISTS idx_waitlist_event_pos ON waitlist(event_id, position);
+            """,
+        ),
+
+        # Migration 15: make the per-event waitlist index covering
+        (
+            15,
+            """
+            -- Waitlist promotion reads ``id`` and ``user_id`` ordered by ``position, id``
+            -- for one event.  With both in the index the scan needs no sort and
+            -- never touches the table rows.  (A WITHOUT ROWID table keyed on
+            -- (event_id, position) does not fit: entries are referenced by ``id`` and
+            -- position shifts would collide with the primary key mid-UPDATE.)
+            DROP INDEX IF EXISTS idx_waitlist_event_pos;
+            CREATE INDEX IF NOT EXISTS idx_waitlist_event_pos_user ON waitlist(event_id, position, id, user_id);
+            """,
+        ),
+
+        # Migration 16: remaining per-event lookups and the event date filter
+        (
+            16,
+            """
+            -- ``delete_event`` removes an event's payments and reviews by ``event_id``;
+            -- ``list_events`` filters (and may sort) by ``start_time``.  Bookings and
+            -- the waitlist are already indexed by event (migrations 14 and 15).
+            CREATE INDEX IF NOT EXISTS idx_payments_event ON payments(event_id);
+            CREATE INDEX IF NOT EXISTS idx_reviews_event ON reviews(event_id);
+            CREATE INDEX IF NOT EXISTS idx_events_start_time ON events(start_time);
+            """,
+        ),
+
+        # Migration 17: store HTML-escaped FAQ text
+        (
+            17,
+            """
+            -- FAQ text is served HTML-escaped.  As for support messages (migration 11)
+            -- escaping is done once when an entry is written (FAQService) instead of
+            -- on every read; the raw columns are kept for editing.  Existing rows are
+            -- backfilled with the same replacements as ``html.escape(s, quote=True)``.
+            ALTER TABLE faqs ADD COLUMN question_short_escaped TEXT;
+            ALTER TABLE faqs ADD COLUMN question_full_escaped TEXT;
+            ALTER TABLE faqs ADD COLUMN answer_escaped TEXT;
+            UPDATE faqs
+            SET question_short_escaped = replace(replace(replace(replace(replace(
+                    question_short, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#x27;'),
+                question_full_escaped = replace(replace(replace(replace(replace(
+                    question_full, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#x27;'),
+                answer_escaped = replace(replace(replace(replace(replace(
+                    answer, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#x27;');
+            """,
+        ),
+
+        # Migration 18: keyset pagination of mailings and mailing logs
+        (
+            18,
+            """
+            -- ``list_mailings`` and ``list_logs`` page with ``(sort_key, id) < (?, ?)``
+            -- seeks instead of OFFSET.  Every index ends with the rowid, so these
+            -- cover ``ORDER BY created_at, id`` and ``ORDER BY sent_at, id`` within
+            -- a mailing; the second one also serves ``delete_mailing``.
+            CREATE INDEX IF NOT EXISTS idx_mailings_created_at ON mailings(created_at);
+            CREATE INDEX IF NOT EXISTS idx_mailing_logs_mailing_sent ON mailing_logs(mailing_id, sent_at);
+            """,
+        ),
     ]
 
+    latest_version = migrations[-1][0]
     with get_cursor() as cursor:
+        # Fast path: the schema version is mirrored into the database header
+        # (``user_version``), a single page read.  The ``migrations`` table
+        # remains the record of applied migrations.
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= latest_version:
+            _optimize(cursor.connection)
+            return
         # Ensure migrations table exists
         cursor.execute(
             "CREATE TABLE IF NOT EXISTS migrations (version INTEGER PRIMARY KEY)"
@@ -385,23 +1061,63 @@ def init_db() -> None:
         cursor.execute("SELECT MAX(version) as version FROM migrations")
         row = cursor.fetchone()
         current_version = row["version"] if row and row["version"] is not None else 0
+        if current_version >= latest_version:
+            # Nothing to do on a warm start.  Databases migrated before the
+            # schema version was mirrored into ``user_version`` get it here.
+            if cursor.execute("PRAGMA user_version").fetchone()[0] != current_version:
+                cursor.execute(f"PRAGMA user_version = {int(current_version)}")
+            _optimize(cursor.connection)
+            return
+        is_fresh_database = current_version == 0
+        has_tables = cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND name != 'migrations'"
+        ).fetchone()[0]
 
-        # Apply new migrations
-        for version, sql in migrations:
-            if version > current_version:
-                cursor.executescript(sql)
-                cursor.execute(
-                    "INSERT INTO migrations (version) VALUES (?)", (version,)
-                )
-                current_version = version
+        # Apply all pending migrations as one script inside a single
+        # transaction: one commit (and journal sync) instead of one per
+        # migration, and a failing migration leaves the schema untouched.
+        # ``executescript`` commits any open transaction before it runs, so
+        # BEGIN/COMMIT have to be part of the script itself.
+        # An empty database gets the consolidated final schema in one go
+        # (recording every migration as applied) instead of the full chain.
+        pending = [(version, sql) for version, sql in migrations if version > current_version]
+        if is_fresh_database and not has_tables and latest_version == CONSOLIDATED_SCHEMA_VERSION:
+            pending = [(latest_version, CONSOLIDATED_SCHEMA)]
+            applied_versions = [version for version, _ in migrations]
+        else:
+            applied_versions = [version for version, _ in pending]
+        if pending:
+            script = ["BEGIN IMMEDIATE;"]
+            for version, sql in pending:
+                script.append(sql(cursor) if callable(sql) else sql)
+            script.append(
+                "INSERT INTO migrations (version) VALUES "
+                + ", ".join(f"({int(version)})" for version in applied_versions)
+                + ";"
+            )
+            # Mirror the schema version into the database header as well
+            script.append(f"PRAGMA user_version = {int(pending[-1][0])};")
+            script.append("COMMIT;")
+            try:
+                cursor.executescript("\n".join(script))
+            except sqlite3.Error:
+                if cursor.connection.in_transaction:
+                    cursor.connection.rollback()
+                raise
+            finally:
+                # The schema may have changed (even partially)
+                _table_columns.clear()
+            current_version = pending[-1][0]
 
-        # Ensure default roles exist: super_admin (id=1), admin (2) and user (3)
-        cursor.execute(
-            "INSERT OR IGNORE INTO roles (id, name, permissions) VALUES (1, 'super_admin', '[]')"
-        )
-        cursor.execute(
-            "INSERT OR IGNORE INTO roles (id, name, permissions) VALUES (2, 'admin', '[]')"
-        )
-        cursor.execute(
-            "INSERT OR IGNORE INTO roles (id, name, permissions) VALUES (3, 'user', '[]')"
-        )
+        # Seed default roles on a fresh database: super_admin (id=1), admin (2)
+        # and user (3)
+        if is_fresh_database:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO roles (id, name, permissions) VALUES (?, ?, ?)",
+                [(1, "super_admin", "[]"), (2, "admin", "[]"), (3, "user", "[]")],
+            )
+
+        # Refresh planner statistics so new indices are picked up.  On a warm
+        # start (returned above) ``PRAGMA optimize`` refreshes only stale ones.
+        cursor.execute("ANALYZE")
@@ -0,0 +1,52 @@
+"""
+JSON encoding helpers shared by the core and service layers.
+
+``orjson`` (a Rust implementation) is used when it is installed; the
+standard library ``json`` module is the fallback so the application keeps
+working without it.  Both paths produce compact output and accept ``str``
+or ``bytes`` on input.
+
+* :func:`dumps` returns ``str`` — use it for values stored in TEXT
+  columns;
+* :func:`dumpb` returns UTF‑8 ``bytes`` — use it where bytes are needed
+  anyway (e.g. token payloads before base64 encoding);
+* :func:`loads` parses ``str`` or ``bytes``.
+
+Decoding errors are instances of :class:`json.JSONDecodeError` in both
+cases (``orjson.JSONDecodeError`` subclasses it), so callers can keep
+catching the standard exception.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    # Non-string dict keys (e.g. integer IDs) are accepted by ``json.dumps``;
+    # keep that behaviour with orjson.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumpb(obj) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def dumps(obj) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    loads = orjson.loads
+else:
+
+    def dumpb(obj) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
+    def dumps(obj) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, separators=(',', ':'))
+
+    loads = json.loads
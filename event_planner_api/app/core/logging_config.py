@@ -4,21 +4,109 @@ Basic logging configuration for the application.
 The ``setup_logging`` function configures the root logger with a
 console and file handler.  Log format includes the timestamp, logger
 name, log level and message.  In production, you may wish to adjust
-handlers (for example, sending logs to an external system) or rotate
-log files.  This module ensures that logging is set up exactly once.
+handlers (for example, sending logs to an external system).  The log
+file is rotated at 50 MB and written through a buffer.  This module
+ensures that logging is set up exactly once.
+
+Request threads never write to the console or the log file directly:
+the root logger only has a ``QueueHandler`` and a background
+``QueueListener`` thread performs the actual I/O.
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 
+# Background listener writing queued records to the real handlers.
+_listener: Optional[QueueListener] = None
+# Set once ``setup_logging`` has run; later calls return immediately.
+_configured = False
+
+# Log file rotation: up to 5 backups of 50 MB each.
+LOG_FILE_MAX_BYTES = 50_000_000
+LOG_FILE_BACKUP_COUNT = 5
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` that buffers writes and flushes periodically.
+
+    The stock handler flushes after every record and ``shouldRollover``
+    seeks to the end of the file (which flushes as well), i.e. one write
+    syscall per log line.  This handler keeps track of the file size
+    itself, writes through a large buffer and flushes it from a
+    background thread every ``flush_interval`` seconds.  Records of level
+    WARNING and above are flushed immediately.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        flush_interval: float = 1.0,
+        buffer_size: int = 65536,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._size = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True)
+        self.flush_interval = flush_interval
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-file-flush", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self._buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self) -> None:
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._closing.set()
+        super().close()
+
+
 def setup_logging(level: str = "INFO", logfile: Optional[str] = None) -> None:
     """Configure root logger.
 
     If no handlers are attached to the root logger, attach a
-    console handler and optionally a file handler.  The root
-    logger's level is set based on the provided ``level``.
+    queue handler feeding a console handler and optionally a file
+    handler, which run in a background thread.  The root logger's
+    level is set based on the provided ``level``.
 
     Parameters
     ----------
@@ -30,10 +118,15 @@ def setup_logging(level: str = "INFO", logfile: Optional[str] = None) -> None:
         handler is added.  Paths are resolved relative to the
         current working directory.
     """
+    global _listener, _configured
+    if _configured:
+        # Repeated ``create_app`` calls (tests, workers) end here
+        return
     logger = logging.getLogger()
     if logger.handlers:
-        # Avoid configuring logging multiple times.  This can happen when
-        # running tests or when ``create_app`` is called repeatedly.
+        # Logging was configured elsewhere (e.g. by uvicorn or a test
+        # runner); leave it alone.
+        _configured = True
         return
 
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -44,12 +137,26 @@ def setup_logging(level: str = "INFO", logfile: Optional[str] = None) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    handlers: list[logging.Handler] = []
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     if logfile:
         log_path = Path(logfile).resolve()
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        file_handler = BufferedRotatingFileHandler(
+            str(log_path),
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
\ No newline at end of file
+        handlers.append(file_handler)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # Flush records still in the queue when the interpreter exits
+    atexit.register(_listener.stop)
+    _configured = True
@@ -15,17 +15,21 @@ hashing.
 """
 
 import base64
-import json
 import time
 import hmac
 import hashlib
 import os
-from typing import Optional, Dict
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from typing import Iterable, Callable
+from typing import Awaitable, Callable, Iterable
 
+from . import json_utils
 from .config import settings
 
 
@@ -40,9 +44,20 @@ def _b64_url_decode(data: str) -> bytes:
     return base64.urlsafe_b64decode(data + padding)
 
 
-def _sign(message: bytes, secret: str) -> bytes:
-    """Compute HMAC‑SHA256 signature of a message using the given secret."""
-    return hmac.new(secret.encode("utf-8"), message, hashlib.sha256).digest()
+# HMAC keyed with ``settings.secret_key``.  The key schedule (ipad/opad
+# setup) is done once here; ``_sign`` works on cheap copies of it.
+_HMAC_TEMPLATE = hmac.new(settings.secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _sign(message: bytes) -> bytes:
+    """Compute HMAC‑SHA256 signature of a message using the application secret."""
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(message)
+    return mac.digest()
+
+
+# The JWT header never changes, so it is serialised and encoded only once.
+_JWT_HEADER_B64 = _b64_url_encode(b'{"alg":"HS256","typ":"JWT"}')
 
 
 def create_access_token(data: Dict[str, str], expires_delta: Optional[int] = None) -> str:
@@ -71,13 +86,18 @@ def create_access_token(data: Dict[str, str], expires_delta: Optional[int] = Non
     to_encode = data.copy()
     exp_seconds = expires_delta or settings.access_token_expire_minutes * 60
     to_encode["exp"] = int(time.time()) + exp_seconds
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = _b64_url_encode(json.dumps(header, separators=(',', ':')).encode("utf-8"))
-    payload_b64 = _b64_url_encode(json.dumps(to_encode, separators=(',', ':')).encode("utf-8"))
-    signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
-    signature = _sign(signing_input, settings.secret_key)
+    payload_b64 = _b64_url_encode(json_utils.dumpb(to_encode))
+    signing_input = f"{_JWT_HEADER_B64}.{payload_b64}"
+    signature = _sign(signing_input.encode("utf-8"))
     signature_b64 = _b64_url_encode(signature)
-    return f"{header_b64}.{payload_b64}.{signature_b64}"
+    return f"{signing_input}.{signature_b64}"
+
+
+# Tokens that already passed signature verification, kept until they
+# expire: raw token -> (exp, payload).  Bounded LRU.
+TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: "OrderedDict[str, Tuple[int, Dict[str, str]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def decode_access_token(token: str) -> Optional[Dict[str, str]]:
@@ -86,7 +106,9 @@ def decode_access_token(token: str) -> Optional[Dict[str, str]]:
     Splits the token into header, payload and signature, verifies the
     HMAC signature and checks the ``exp`` field.  If validation
     succeeds, returns the payload dictionary; otherwise returns
-    ``None``.
+    ``None``.  Verified tokens are cached until they expire, so repeated
+    requests with the same token skip the HMAC and JSON parsing.  A
+    fresh copy of the payload is returned on every call.
 
     Parameters
     ----------
@@ -98,37 +120,138 @@ def decode_access_token(token: str) -> Optional[Dict[str, str]]:
     Optional[dict]
         The decoded payload if valid, else ``None``.
     """
+    now = int(time.time())
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            if cached[0] >= now:
+                _token_cache.move_to_end(token)
+                return dict(cached[1])
+            del _token_cache[token]
     try:
         parts = token.split('.')
         if len(parts) != 3:
             return None
         header_b64, payload_b64, signature_b64 = parts
         signing_input = f"{header_b64}.{payload_b64}".encode("utf-8")
-        expected_sig = _sign(signing_input, settings.secret_key)
+        expected_sig = _sign(signing_input)
         actual_sig = _b64_url_decode(signature_b64)
         # Constant‑time comparison to prevent timing attacks
         if not hmac.compare_digest(expected_sig, actual_sig):
             return None
         payload_json = _b64_url_decode(payload_b64)
-        data = json.loads(payload_json.decode("utf-8"))
-        if data.get("exp") is None or int(data["exp"]) < int(time.time()):
+        data = json_utils.loads(payload_json)
+        if data.get("exp") is None or int(data["exp"]) < now:
             return None
-        return data
     except Exception:
         return None
+    with _token_cache_lock:
+        _token_cache[token] = (int(data["exp"]), dict(data))
+        while len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    return data
 
 
 security = HTTPBearer(auto_error=False)
 
+# Trusted bot tokens from ``BOT_TOKENS``, parsed once at import time.
+_BOT_TOKENS: frozenset = frozenset(
+    t.strip() for t in (settings.bot_tokens or "").split(",") if t.strip()
+)
+
+
+# ---------------------------------------------------------------------------
+# Short‑lived cache of user rows used by ``get_current_user``
+# ---------------------------------------------------------------------------
+
+# Upper bound on cached users; the least recently used entry is evicted.
+USER_CACHE_MAX_SIZE = 1024
+
+# email -> (time cached, {"id", "role_id", "disabled"})
+_user_cache: "OrderedDict[str, Tuple[float, Dict[str, int]]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, str]:
+
+def _get_cached_user(email: str) -> Optional[Dict[str, int]]:
+    ttl = settings.user_cache_ttl_seconds
+    if ttl <= 0:
+        return None
+    with _user_cache_lock:
+        entry = _user_cache.get(email)
+        if entry is None:
+            return None
+        cached_at, user = entry
+        if time.monotonic() - cached_at > ttl:
+            del _user_cache[email]
+            return None
+        _user_cache.move_to_end(email)
+        return user
+
+
+def _cache_user(email: str, user: Dict[str, int]) -> None:
+    if settings.user_cache_ttl_seconds <= 0:
+        return
+    with _user_cache_lock:
+        _user_cache[email] = (time.monotonic(), user)
+        _user_cache.move_to_end(email)
+        while len(_user_cache) > USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
+
+
+def bump_user_cache(email: Optional[str] = None) -> None:
+    """Drop the cached user record for ``email`` (or all, if ``None``).
+
+    Call this whenever a user's role, disabled flag or existence changes
+    so that ``get_current_user`` sees the change on the next request.
+    """
+    with _user_cache_lock:
+        if email is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(email, None)
+
+
+_LOAD_USER_SQL = "SELECT id, role_id, disabled FROM users WHERE email = ?"
+# SQLite prefers the UNIQUE(email) index on its own (even with ANALYZE
+# statistics), which still needs a table lookup; the covering index
+# (migration 12) does not.
+_LOAD_USER_COVERING_SQL = (
+    "SELECT id, role_id, disabled FROM users INDEXED BY idx_users_email_covering WHERE email = ?"
+)
+
+
+def _load_user(email: str) -> Optional[Dict[str, int]]:
+    """Fetch the id, role and disabled flag of the user with ``email``."""
+    from event_planner_api.app.core.db import get_read_connection
+    conn = get_read_connection()
+    try:
+        try:
+            row = conn.execute(_LOAD_USER_COVERING_SQL, (email,)).fetchone()
+        except sqlite3.OperationalError:
+            # ``INDEXED BY`` fails with "no such index" when the index is
+            # missing (e.g. a database restored from an old dump); fall back
+            # to whatever index the planner picks.
+            row = conn.execute(_LOAD_USER_SQL, (email,)).fetchone()
+    finally:
+        # Releases the connection back to the pool
+        conn.close()
+    if not row:
+        return None
+    return {"id": row["id"], "role_id": row["role_id"], "disabled": row["disabled"]}
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, str]:
     """Dependency that retrieves the current authenticated user.
 
     If the request does not contain an ``Authorization`` header or the
     token is invalid/expired, an HTTP 401 error is raised.  On
-    success, returns the decoded token payload.  In a real
-    application you would map the token subject (``sub``) to a
-    database record and return a user model.
+    success, returns the decoded token payload extended with the
+    user's ``user_id`` and ``role_id``.
+
+    The dependency is ``async`` so that the common path (bot/static
+    token, cached JWT and cached user) runs on the event loop without a
+    threadpool hop; only a user cache miss queries the database, in the
+    threadpool.
     """
     if credentials is None:
         raise HTTPException(
@@ -145,21 +268,26 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     # settings.bot_role_id, and user_id is left unspecified.  This allows
     # bots to interact with the API without a user account while still
     # respecting RBAC.
-    if settings.bot_tokens:
-        tokens_list = [t.strip() for t in settings.bot_tokens.split(',') if t.strip()]
-        if token in tokens_list:
-            return {
-                "sub": "bot",
-                "user_id": None,
-                "role_id": settings.bot_role_id,
-            }
+    if token in _BOT_TOKENS:
+        return {
+            "sub": "bot",
+            "user_id": None,
+            "role_id": settings.bot_role_id,
+        }
 
     # Support for a static super administrator token defined via SUPER_ADMIN_TOKEN.
     # If present and matches the provided token, bypass JWT decoding and return
     # a user context with super_admin privileges.  The default user_id is 1 (the
     # first created super admin).  This mechanism allows integrations to
     # authenticate via a single long‑lived token instead of per‑user logins.
-    if settings.super_admin_static_token and token == settings.super_admin_static_token:
+    # The comparison is constant‑time; the length check only skips it for
+    # tokens that cannot match (the token length is not secret).
+    static_token = settings.super_admin_static_token
+    if (
+        static_token
+        and len(token) == len(static_token)
+        and hmac.compare_digest(token.encode("utf-8"), static_token.encode("utf-8"))
+    ):
         return {
             "sub": "static_super_admin",
             "user_id": 1,
@@ -174,34 +302,29 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         )
     # Lookup user details (e.g., role) from the database.  If the
     # subject no longer exists (e.g., user was deleted), raise 401.
-    try:
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
-        user_row = cursor.execute(
-            "SELECT id, role_id, disabled FROM users WHERE email = ?",
-            (payload.get("sub"),),
-        ).fetchone()
-        if not user_row:
+    # Recently seen users are served from a short‑lived cache.
+    email = payload.get("sub")
+    user_row = _get_cached_user(email)
+    if user_row is None:
+        # Only cache misses touch SQLite; the blocking query runs in the
+        # threadpool so it does not stall the event loop.
+        user_row = await run_in_threadpool(_load_user, email)
+        if user_row is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User no longer exists",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        if user_row["disabled"]:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User account disabled",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        # Attach user_id and role_id to the token payload for convenience
-        payload["user_id"] = user_row["id"]
-        payload["role_id"] = user_row["role_id"]
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _cache_user(email, user_row)
+    if user_row["disabled"]:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User account disabled",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    # Attach user_id and role_id to the token payload for convenience
+    payload["user_id"] = user_row["id"]
+    payload["role_id"] = user_row["role_id"]
     return payload
 
 
@@ -209,7 +332,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 # Role-based access control (RBAC) helpers
 # ---------------------------------------------------------------------------
 
-def require_roles(*role_ids: int) -> Callable[[Dict[str, str]], Dict[str, str]]:
+def require_roles(*role_ids: int) -> Callable[[Dict[str, str]], Awaitable[Dict[str, str]]]:
     """Dependency factory to enforce that the current user has one of the specified roles.
 
     Use this in FastAPI endpoints via ``Depends(require_roles(1, 2))`` to allow only
@@ -230,8 +353,16 @@ def require_roles(*role_ids: int) -> Callable[[Dict[str, str]], Dict[str, str]]:
         returns the user payload on success.
     """
 
-    def _role_dependency(current_user: Dict[str, str] = Depends(get_current_user)) -> Dict[str, str]:
-        if current_user.get("role_id") not in role_ids:
+    # Built once per ``require_roles(...)`` call (i.e. at import time of the
+    # router), not per request.
+    allowed = frozenset(role_ids)
+
+    # ``async def`` so FastAPI runs the check inline on the event loop
+    # instead of dispatching this trivial function to the threadpool.
+    async def _role_dependency(current_user: Dict[str, str] = Depends(get_current_user)) -> Dict[str, str]:
+        role_id = current_user.get("role_id")
+        # Tokens without a resolved role (e.g. misconfigured bots) never pass
+        if role_id is None or role_id not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
@@ -242,14 +373,23 @@ def require_roles(*role_ids: int) -> Callable[[Dict[str, str]], Dict[str, str]]:
 
 
 
+# Iteration count of hashes stored before the count was embedded in the
+# hash string (legacy ``salt$hash`` format).
+_LEGACY_PBKDF2_ITERATIONS = 100_000
+# Hex lengths of the 16‑byte salt and the 32‑byte SHA‑256 digest.
+_SALT_HEX_LEN = 32
+_HASH_HEX_LEN = 64
+
+
 def hash_password(password: str) -> str:
     """Hash a password using PBKDF2‑HMAC with SHA‑256.
 
     A 16‑byte random salt is generated for each password.  The
-    resulting string contains the salt and hash separated by a
-    ``$`` (salt in hex, then hash in hex).  This format allows
-    verifying the password later.  Increase the iterations for
-    stronger security at the cost of performance.
+    resulting string contains the iteration count, the salt and the
+    hash separated by ``$`` (``iterations$salt_hex$hash_hex``).  This
+    format allows verifying the password later even after
+    ``settings.password_hash_iterations`` has been changed.  The KDF
+    itself runs in OpenSSL, which uses SHA‑NI where the CPU supports it.
 
     Parameters
     ----------
@@ -259,26 +399,28 @@ def hash_password(password: str) -> str:
     Returns
     -------
     str
-        Salt and hash concatenated with ``$``.
+        Iterations, salt and hash concatenated with ``$``.
     """
     salt = os.urandom(16)
-    iterations = 100_000
+    iterations = settings.password_hash_iterations
     dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
-    return f"{salt.hex()}${dk.hex()}"
+    return f"{iterations}${salt.hex()}${dk.hex()}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a stored salt+hash string.
 
-    Splits the stored string into salt and hash, recomputes the
-    PBKDF2‑HMAC digest and compares it using constant‑time comparison.
+    Splits the stored string into iterations, salt and hash, recomputes
+    the PBKDF2‑HMAC digest and compares it using constant‑time
+    comparison.  Legacy ``salt$hash`` strings use 100 000 iterations.
+    Malformed strings are rejected before running the (expensive) KDF.
 
     Parameters
     ----------
     plain_password : str
         The password provided by the user.
     hashed_password : str
-        The stored salt and hash separated by ``$``.
+        The stored iterations, salt and hash separated by ``$``.
 
     Returns
     -------
@@ -286,10 +428,19 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if the password matches, otherwise False.
     """
     try:
-        salt_hex, hash_hex = hashed_password.split('$', 1)
+        parts = hashed_password.split('$')
+        if len(parts) == 3:
+            iterations = int(parts[0])
+            salt_hex, hash_hex = parts[1], parts[2]
+        elif len(parts) == 2:
+            iterations = _LEGACY_PBKDF2_ITERATIONS
+            salt_hex, hash_hex = parts
+        else:
+            return False
+        if len(salt_hex) != _SALT_HEX_LEN or len(hash_hex) != _HASH_HEX_LEN or iterations <= 0:
+            return False
         salt = bytes.fromhex(salt_hex)
         stored_hash = bytes.fromhex(hash_hex)
-        iterations = 100_000
         dk = hashlib.pbkdf2_hmac('sha256', plain_password.encode('utf-8'), salt, iterations)
         return hmac.compare_digest(dk, stored_hash)
     except Exception:
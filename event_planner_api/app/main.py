@@ -3,9 +3,9 @@ Main entrypoint for the Event Planner API.
 
 This module assembles the FastAPI application, sets up logging and
 includes versioned routers.  The ``create_app`` function builds
-and configures the app, which is then instantiated at module
-import time as ``app``.  Importing the app here makes it easy to
-run with uvicorn or another ASGI server, e.g.::
+and configures the app, which is instantiated on first access to the
+module attribute ``app`` (see ``__getattr__`` below).  ASGI servers
+resolve it the usual way, e.g.::
 
     uvicorn event_planner_api.app.main:app --reload
 
@@ -13,12 +13,49 @@ The application title and version are provided via ``Settings`` from
 ``core.config``.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
 
 from .core.config import settings
 from .core.logging_config import setup_logging
-from .api.v1.router import router as v1_router
-from .core.db import init_db
+
+
+# Path prefix of the bot polling endpoints (see ``api/v1/endpoints/tasks.py``).
+TASKS_PATH_PREFIX = "/api/v1/tasks"
+
+
+def _tasks_allowed_methods(path: str) -> Optional[str]:
+    """``Allow`` header value for a tasks endpoint, or ``None``.
+
+    Only ``GET /tasks`` and ``POST /tasks/{task_id}/complete`` exist; any
+    other path (including siblings such as ``/api/v1/tasks-archive``) is
+    left to the router.
+    """
+    if path == TASKS_PATH_PREFIX:
+        return "GET, OPTIONS"
+    if path.startswith(TASKS_PATH_PREFIX + "/"):
+        task_id, sep, action = path[len(TASKS_PATH_PREFIX) + 1:].partition("/")
+        if sep and action == "complete" and task_id.isdigit():
+            return "POST, OPTIONS"
+    return None
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan: database setup on startup, cleanup on shutdown."""
+    from .core.db import close_all, init_db
+    from .services.audit_service import AuditService
+
+    # Apply migrations at startup.  This will create the database
+    # file if it does not exist and ensure all tables are up to date.
+    init_db()
+    yield
+    # Write queued audit records, then close pooled SQLite connections
+    await AuditService.shutdown()
+    close_all()
 
 
 def create_app() -> FastAPI:
@@ -38,23 +75,48 @@ def create_app() -> FastAPI:
     # desired log level from settings.
     setup_logging(settings.log_level)
 
-    app = FastAPI(title=settings.project_name, version=settings.api_version)
+    # Imported here rather than at module level: the router pulls in every
+    # endpoint, service and the database layer, which only a process that
+    # actually builds the application needs.
+    from .api.v1.router import router as v1_router
+
+    app = FastAPI(title=settings.project_name, version=settings.api_version, lifespan=lifespan)
 
     # Mount versioned routes under /api/v1.  Additional versions can be
     # added later by including their respective routers with a
     # different prefix.
     app.include_router(v1_router, prefix="/api/v1")
 
-    # Register startup event to initialise the database and apply migrations.
-    @app.on_event("startup")
-    async def startup_event() -> None:
-        # Apply migrations at startup.  This will create the database
-        # file if it does not exist and ensure all tables are up to date.
-        init_db()
+    # Bots poll ``/api/v1/tasks`` every minute.  Requests that can never
+    # succeed are answered here, before routing, so they do not pay for
+    # the ``require_roles`` dependency (JWT decoding and a user lookup).
+    @app.middleware("http")
+    async def tasks_short_circuit(request: Request, call_next):
+        allowed = _tasks_allowed_methods(request.url.path)
+        if allowed is not None:
+            if request.method == "OPTIONS":
+                return Response(status_code=204, headers={"Allow": allowed})
+            if request.method == "HEAD" and "authorization" not in request.headers:
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "Not authenticated"},
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+        return await call_next(request)
 
     return app
 
 
-# Create the application instance at import time so that tools such as
-# uvicorn can discover it without calling create_app manually.
-app = create_app()
\ No newline at end of file
+def __getattr__(name: str):
+    """Build the module-level ``app`` on first access.
+
+    Importing this module does not configure logging or construct
+    FastAPI; ``uvicorn event_planner_api.app.main:app`` still works because
+    it fetches the attribute, which creates the instance once and caches it
+    in the module globals.
+    """
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
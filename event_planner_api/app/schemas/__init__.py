@@ -4,4 +4,112 @@ Pydantic schema definitions for API payloads.
 Each domain (users, events, payments, etc.) defines its own Pydantic
 models for request and response bodies.  Schemas are separated from
 database models to decouple API representation from persistence.
-"""
\ No newline at end of file
+
+Every root model uses :data:`BASE_CONFIG`.  ``defer_build`` postpones
+building the validator/serializer of a schema until its first use, so
+importing the package (and starting the API) does not pay for schemas
+that a given process never touches.  ``cache_strings="all"`` lets the
+JSON parser reuse repeated strings (e.g. the same ISO ``start_time`` or
+``scheduled_at`` across bulk requests) instead of allocating each one.
+
+Schema classes can be imported from the package itself (``from
+event_planner_api.app.schemas import EventRead``); they are resolved
+lazily, so only the submodule that defines the requested class is
+imported.
+"""
+
+import importlib
+
+from pydantic import ConfigDict
+
+
+BASE_CONFIG = ConfigDict(defer_build=True, from_attributes=True, cache_strings="all")
+
+
+def example_config(example: dict, **config) -> ConfigDict:
+    """Return :data:`BASE_CONFIG` plus a model‑level OpenAPI ``example``.
+
+    Examples are declared once per model instead of via ``example=`` on
+    every ``Field``; extra ``config`` keys (e.g. ``extra="forbid"``) are
+    merged in as well.
+    """
+    return ConfigDict(**BASE_CONFIG, json_schema_extra={"example": example}, **config)
+
+
+class FromRowMixin:
+    """Build ``*Read`` schemas from database rows without validation.
+
+    Rows coming out of our own tables are already well-typed, so
+    :meth:`from_row` uses ``model_construct`` and skips pydantic-core
+    entirely.  Use it only for trusted data; request bodies must still go
+    through normal validation.
+    """
+
+    @classmethod
+    def from_row(cls, row, **overrides):
+        """Construct an instance from a ``sqlite3.Row`` or a mapping.
+
+        Columns that are not fields of the model are ignored; missing
+        fields take their defaults.  ``overrides`` replace column values
+        (e.g. a decoded JSON column).
+        """
+        keys = set(row.keys())
+        data = {name: row[name] for name in cls.model_fields if name in keys}
+        data.update(overrides)
+        return cls.model_construct(**data)
+
+
+# Public schema name -> submodule that defines it (see ``__getattr__``).
+_LAZY_EXPORTS = {
+    "AuditLogRead": "audit",
+    "BookingBase": "booking",
+    "BookingCreate": "booking",
+    "BookingUpdate": "booking",
+    "WaitlistUpdate": "booking",
+    "BookingRead": "booking",
+    "EventBase": "event",
+    "EventCreate": "event",
+    "EventRead": "event",
+    "EventUpdate": "event",
+    "EventDuplicate": "event",
+    "FAQCreate": "faq",
+    "FAQUpdate": "faq",
+    "FAQRead": "faq",
+    "MailingCreate": "mailing",
+    "MailingRead": "mailing",
+    "MailingUpdate": "mailing",
+    "MailingLogRead": "mailing",
+    "PaymentBase": "payment",
+    "PaymentCreate": "payment",
+    "PaymentRead": "payment",
+    "ReviewCreate": "review",
+    "ReviewModerate": "review",
+    "ReviewRead": "review",
+    "SupportMessageCreate": "support",
+    "SupportMessageRead": "support",
+    "SupportTicketCreate": "support",
+    "SupportTicketUpdate": "support",
+    "SupportTicketRead": "support",
+    "TicketWithMessages": "support",
+    "TaskRead": "task",
+    "UserBase": "user",
+    "UserCreate": "user",
+    "UserRead": "user",
+    "UserUpdate": "user",
+}
+
+__all__ = ("BASE_CONFIG", "FromRowMixin", "example_config") + tuple(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache in the module namespace so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,29 @@
+"""
+Pydantic schemas for audit log entries.
+
+Audit records are written by :class:`AuditService` and are only ever
+read back by super‑administrators, so there is no create schema: the
+API exposes them read‑only.
+"""
+
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from . import BASE_CONFIG, FromRowMixin
+
+
+class AuditLogRead(FromRowMixin, BaseModel):
+    """Schema for reading a single audit log entry."""
+
+    id: int
+    user_id: Optional[int] = None
+    action: str
+    object_type: Optional[str] = None
+    object_id: Optional[int] = None
+    timestamp: Optional[str] = None
+    # Decoded JSON from the ``details`` column; the raw string is returned
+    # when it is not valid JSON.
+    details: Optional[Any] = None
+
+    model_config = BASE_CONFIG
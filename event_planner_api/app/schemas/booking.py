@@ -9,14 +9,18 @@ associated with events.  Bookings allow multiple participants via the
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from . import BASE_CONFIG, FromRowMixin, example_config
+
 
 class BookingBase(BaseModel):
-    group_size: int = Field(1, ge=1, example=1)
+    group_size: int = Field(1, ge=1)
     # Optional list of participant names for group bookings.  A user can
     # specify names of group members when creating a booking.  This
     # field is not required and may be ``None`` or an empty list.
     group_names: list[str] | None = Field(default=None, description="Names of participants in the group")
 
+    model_config = example_config({"group_size": 1})
+
 
 class BookingCreate(BookingBase):
     """Schema for creating a booking."""
@@ -44,6 +48,8 @@ class BookingUpdate(BaseModel):
     # supplied names.
     group_names: list[str] | None = Field(default=None, description="Updated names of participants in the group")
 
+    model_config = BASE_CONFIG
+
 
 class WaitlistUpdate(BaseModel):
     """Schema for updating a waitlist entry.
@@ -55,19 +61,20 @@ class WaitlistUpdate(BaseModel):
 
     position: int = Field(..., ge=1, description="New position for the waitlist entry (1‑based)")
 
+    model_config = BASE_CONFIG
+
 
-class BookingRead(BaseModel):
+class BookingRead(FromRowMixin, BaseModel):
     id: int
     user_id: int
     event_id: int
     group_size: int
     status: str
     created_at: datetime
-    is_paid: bool | None = False
-    is_attended: bool | None = False
+    # NOT NULL DEFAULT 0 in the table; services pass bool(row[...])
+    is_paid: bool = False
+    is_attended: bool = False
     # Return the names of group members if provided.  This field is optional.
     group_names: list[str] | None = None
 
-    model_config = {
-        "from_attributes": True,
-    }
\ No newline at end of file
+    model_config = BASE_CONFIG
\ No newline at end of file
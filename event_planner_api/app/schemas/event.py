@@ -11,16 +11,27 @@ requirements evolve.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from . import BASE_CONFIG, FromRowMixin, example_config
 
 
 class EventBase(BaseModel):
-    title: str = Field(..., example="Yoga Class")
-    description: Optional[str] = Field(None, example="A relaxing yoga session")
-    start_time: datetime = Field(..., example="2025-09-01T10:00:00Z")
-    duration_minutes: int = Field(..., example=60)
-    max_participants: int = Field(..., example=15)
-    is_paid: bool = Field(False, example=False)
+    title: str
+    description: Optional[str] = None
+    start_time: datetime
+    duration_minutes: int
+    max_participants: int
+    is_paid: bool = False
+
+    model_config = example_config({
+        "title": "Yoga Class",
+        "description": "A relaxing yoga session",
+        "start_time": "2025-09-01T10:00:00Z",
+        "duration_minutes": 60,
+        "max_participants": 15,
+        "is_paid": False,
+    })
 
 
 class EventCreate(EventBase):
@@ -28,14 +39,11 @@ class EventCreate(EventBase):
     pass
 
 
-class EventRead(EventBase):
+class EventRead(FromRowMixin, EventBase):
     """Schema for reading an event from the API."""
 
     id: int
-    # For pydantic v2, enable constructing from ORM models
-    model_config = {
-        "from_attributes": True,
-    }
+    model_config = BASE_CONFIG
 
 
 class EventUpdate(BaseModel):
@@ -51,9 +59,7 @@ class EventUpdate(BaseModel):
     is_paid: bool | None = None
     price: float | None = None
 
-    model_config = {
-        "from_attributes": True,
-    }
+    model_config = BASE_CONFIG
 
 
 class EventDuplicate(BaseModel):
@@ -62,4 +68,6 @@ class EventDuplicate(BaseModel):
     Requires a new start time for the duplicated event.  Other fields
     will be copied from the source event.
     """
-    start_time: datetime = Field(..., example="2025-09-15T10:00:00Z")
\ No newline at end of file
+    start_time: datetime
+
+    model_config = example_config({"start_time": "2025-09-15T10:00:00Z"})
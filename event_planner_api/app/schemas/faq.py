@@ -8,30 +8,21 @@ images or documents).  An integer ``position`` field allows
 ordering of FAQ items for display.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
-import json
+from pydantic import BaseModel, Field
+
+from . import BASE_CONFIG, FromRowMixin
 
 
 class FAQCreate(BaseModel):
     """Schema for creating a new FAQ entry."""
 
     question_short: str = Field(..., description="Short question text displayed on the FAQ button")
-    question_full: Optional[str] = Field(None, description="Full question text")
+    question_full: str | None = Field(None, description="Full question text")
     answer: str = Field(..., description="Answer text for the FAQ")
-    attachments: Optional[List[str]] = Field(None, description="List of attachment URLs or identifiers")
-    position: Optional[int] = Field(0, description="Ordering position for display; lower numbers appear first")
+    attachments: list[str] | None = Field(None, description="List of attachment URLs or identifiers")
+    position: int | None = Field(0, description="Ordering position for display; lower numbers appear first")
 
-    @validator("attachments")
-    def validate_attachments(cls, v):
-        if v is None:
-            return None
-        if not isinstance(v, list):
-            raise ValueError("Attachments must be a list of strings")
-        for item in v:
-            if not isinstance(item, str):
-                raise ValueError("Each attachment must be a string")
-        return v
+    model_config = BASE_CONFIG
 
 
 class FAQUpdate(BaseModel):
@@ -40,24 +31,25 @@ class FAQUpdate(BaseModel):
     All fields are optional; only provided values will be updated.
     """
 
-    question_short: Optional[str] = None
-    question_full: Optional[str] = None
-    answer: Optional[str] = None
-    attachments: Optional[List[str]] = None
-    position: Optional[int] = None
+    question_short: str | None = None
+    question_full: str | None = None
+    answer: str | None = None
+    attachments: list[str] | None = None
+    position: int | None = None
+
+    model_config = BASE_CONFIG
 
 
-class FAQRead(BaseModel):
+class FAQRead(FromRowMixin, BaseModel):
     """Schema for reading an FAQ entry."""
 
     id: int
     question_short: str
-    question_full: Optional[str]
+    question_full: str | None
     answer: str
-    attachments: Optional[List[str]]
+    attachments: list[str] | None
     position: int
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = BASE_CONFIG
\ No newline at end of file
@@ -7,17 +7,29 @@ additional metadata (transaction IDs, payment status, user ID, etc.).
 """
 
 from datetime import datetime
-from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from . import FromRowMixin, example_config
+
+
+_PAYMENT_EXAMPLE = {
+    "amount": 1000.0,
+    "currency": "RUB",
+    "description": "Оплата участия в мероприятии",
+    "event_id": 1,
+    "provider": "yookassa",
+}
+
 
 class PaymentBase(BaseModel):
-    amount: float = Field(..., example=1000.0)
-    currency: str = Field("RUB", example="RUB")
-    description: Optional[str] = Field(None, example="Оплата участия в мероприятии")
-    event_id: Optional[int] = Field(None, example=1, description="ID мероприятия, если платеж связан с событием")
-    provider: Optional[str] = Field(None, example="yookassa", description="Источник платежа: yookassa, support или cash")
+    amount: float
+    currency: str = "RUB"
+    description: str | None = None
+    event_id: int | None = Field(None, description="ID мероприятия, если платеж связан с событием")
+    provider: str | None = Field(None, description="Источник платежа: yookassa, support или cash")
+
+    model_config = example_config(_PAYMENT_EXAMPLE)
 
 
 class PaymentCreate(PaymentBase):
@@ -25,16 +37,14 @@ class PaymentCreate(PaymentBase):
     pass
 
 
-class PaymentRead(PaymentBase):
+class PaymentRead(FromRowMixin, PaymentBase):
     """Schema for reading a payment."""
 
     id: int
     created_at: datetime
-    status: Optional[str] = Field(None, example="pending")
-    external_id: Optional[str] = Field(None, example="2bcd42fa")
-    confirmed_by: Optional[int] = None
-    confirmed_at: Optional[datetime] = None
+    status: str | None = None
+    external_id: str | None = None
+    confirmed_by: int | None = None
+    confirmed_at: datetime | None = None
     
-    model_config = {
-        "from_attributes": True,
-    }
\ No newline at end of file
+    model_config = example_config({**_PAYMENT_EXAMPLE, "status": "pending", "external_id": "2bcd42fa"})
\ No newline at end of file
@@ -7,8 +7,11 @@ published.  These schemas define the payloads and response shapes
 used in the API.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints
+
+from . import BASE_CONFIG, FromRowMixin
 
 
 class ReviewCreate(BaseModel):
@@ -16,17 +19,13 @@ class ReviewCreate(BaseModel):
 
     event_id: int = Field(..., description="Identifier of the event being reviewed")
     rating: int = Field(..., ge=1, le=5, description="Rating from 1 to 5")
-    comment: Optional[str] = Field(None, description="Optional textual comment")
+    # Whitespace is trimmed first, then at most 1000 characters are allowed;
+    # both happen in pydantic-core while the payload is parsed.
+    comment: Annotated[str, StringConstraints(strip_whitespace=True, max_length=1000)] | None = Field(
+        None, description="Optional textual comment"
+    )
 
-    @validator("comment")
-    def sanitize_comment(cls, v: Optional[str]) -> Optional[str]:
-        """Trim whitespace from the comment and enforce a maximum length."""
-        if v is None:
-            return None
-        v = v.strip()
-        if len(v) > 1000:
-            raise ValueError("Comment must be 1000 characters or fewer")
-        return v
+    model_config = BASE_CONFIG
 
 
 class ReviewModerate(BaseModel):
@@ -34,18 +33,19 @@ class ReviewModerate(BaseModel):
 
     approved: bool = Field(..., description="Whether to approve the review")
 
+    model_config = BASE_CONFIG
+
 
-class ReviewRead(BaseModel):
+class ReviewRead(FromRowMixin, BaseModel):
     """Schema for reading a review from the API."""
 
     id: int
     user_id: int
     event_id: int
     rating: int
-    comment: Optional[str]
+    comment: str | None
     approved: bool
-    moderated_by: Optional[int]
+    moderated_by: int | None
     created_at: str
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = BASE_CONFIG
\ No newline at end of file
@@ -12,7 +12,13 @@ In a more advanced implementation you might convert these to
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
+
+from . import BASE_CONFIG, FromRowMixin
+
+
+# Ticket lifecycle states accepted by ``SupportTicketUpdate``.
+TicketStatus = Literal["open", "in_progress", "resolved", "closed"]
 
 
 class SupportMessageCreate(BaseModel):
@@ -26,8 +32,10 @@ class SupportMessageCreate(BaseModel):
     content: str = Field(..., description="Text content of the message")
     attachments: Optional[List[str]] = Field(None, description="Optional list of attachment identifiers")
 
+    model_config = BASE_CONFIG
+
 
-class SupportMessageRead(BaseModel):
+class SupportMessageRead(FromRowMixin, BaseModel):
     """Schema for reading a support message from the API.
 
     Includes the ID, associated ticket, sender role and creation
@@ -47,8 +55,7 @@ class SupportMessageRead(BaseModel):
 
     attachments: Optional[List[str]] = None
 
-    class Config:
-        orm_mode = True
+    model_config = BASE_CONFIG
 
 
 class SupportTicketCreate(BaseModel):
@@ -61,20 +68,23 @@ class SupportTicketCreate(BaseModel):
     subject: str = Field(..., description="Subject or title of the support request")
     content: str = Field(..., description="Initial message content")
 
+    model_config = BASE_CONFIG
+
 
 class SupportTicketUpdate(BaseModel):
     """Schema for updating the status of an existing support ticket.
 
-    Only the ``status`` field may be updated.  Valid statuses include
-    ``open``, ``in_progress``, ``resolved`` and ``closed``.  Validation
-    of allowed values should be performed at the service or endpoint
-    level.
+    Only the ``status`` field may be updated.  Valid statuses are
+    ``open``, ``in_progress``, ``resolved`` and ``closed``; any other
+    value is rejected with 422 during request validation.
     """
 
-    status: str = Field(..., description="New status for the ticket")
+    status: TicketStatus = Field(..., description="New status for the ticket")
+
+    model_config = BASE_CONFIG
 
 
-class SupportTicketRead(BaseModel):
+class SupportTicketRead(FromRowMixin, BaseModel):
     """Schema for reading a support ticket.
 
     This schema represents a ticket without its messages.  When
@@ -89,8 +99,7 @@ class SupportTicketRead(BaseModel):
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
+    model_config = BASE_CONFIG
 
 
 class TicketWithMessages(BaseModel):
@@ -98,3 +107,5 @@ class TicketWithMessages(BaseModel):
 
     ticket: SupportTicketRead
     messages: List[SupportMessageRead]
+
+    model_config = BASE_CONFIG
@@ -10,12 +10,13 @@ compatibility.
 """
 
 from datetime import datetime
-from typing import Optional
 
 from pydantic import BaseModel
 
+from . import BASE_CONFIG, FromRowMixin
 
-class TaskRead(BaseModel):
+
+class TaskRead(FromRowMixin, BaseModel):
     """Schema for a task returned by the tasks API.
 
     A task represents some action that an external client (such as a
@@ -36,10 +37,8 @@ class TaskRead(BaseModel):
 
     id: int
     type: str
-    title: Optional[str] = None
-    description: Optional[str] = None
-    scheduled_at: Optional[datetime] = None
+    title: str | None = None
+    description: str | None = None
+    scheduled_at: datetime | None = None
 
-    model_config = {
-        "from_attributes": True,
-    }
\ No newline at end of file
+    model_config = BASE_CONFIG
\ No newline at end of file
@@ -7,9 +7,12 @@ through the API.  To support future extensions (e.g. roles), fields
 can be added to these schemas and corresponding service logic.
 """
 
-from typing import Optional
+from pydantic import BaseModel, Field, SecretStr
 
-from pydantic import BaseModel, Field
+from . import BASE_CONFIG, FromRowMixin, example_config
+
+
+_USER_EXAMPLE = {"email": "user@example.com", "full_name": "Иван Иванов", "disabled": False}
 
 
 class UserBase(BaseModel):
@@ -17,9 +20,11 @@ class UserBase(BaseModel):
     # администратора обязательно указание email.  При отсутствии email
     # для клиента будет сгенерирован surrogate-адрес вида
     # ``telegram:12345`` (см. UserService.create_user).
-    email: Optional[str] = Field(None, example="user@example.com")
-    full_name: Optional[str] = Field(None, example="Иван Иванов")
-    disabled: bool = Field(False, example=False)
+    email: str | None = None
+    full_name: str | None = None
+    disabled: bool = False
+
+    model_config = example_config(_USER_EXAMPLE)
 
 
 class UserCreate(UserBase):
@@ -37,18 +42,37 @@ class UserCreate(UserBase):
     уровне сервисов.
     """
 
-    password: Optional[str] = Field(None, example="strongpassword")
-    social_provider: Optional[str] = Field(None, example="telegram", description="Краткий код социальной сети (telegram, vk, etc.)")
-    social_id: Optional[str] = Field(None, example="123456789", description="Идентификатор пользователя в социальной сети")
+    password: str | None = None
+    social_provider: str | None = Field(None, description="Краткий код социальной сети (telegram, vk, etc.)")
+    social_id: str | None = Field(None, description="Идентификатор пользователя в социальной сети")
 
+    model_config = example_config(
+        {**_USER_EXAMPLE, "password": "strongpassword", "social_provider": "telegram", "social_id": "123456789"}
+    )
 
-class UserRead(UserBase):
+
+class UserRead(FromRowMixin, UserBase):
     """Schema for reading a user from the API."""
 
     id: int
     
-    # For pydantic v2, set from_attributes to True so models can be
-    # constructed from ORM objects.  For v1 this will be ignored.
-    model_config = {
-        "from_attributes": True,
-    }
\ No newline at end of file
+    model_config = BASE_CONFIG
+
+
+class UserUpdate(BaseModel):
+    """Schema for partially updating a user (``PUT /users/{id}``).
+
+    Все поля необязательны; изменяются только переданные.  ``role_id``
+    может менять только супер‑администратор (проверяется в эндпоинте),
+    в том числе при передаче ``null``.  Прочие поля (например, ``email``,
+    который отправляет форма админ‑панели) игнорируются.
+    """
+
+    full_name: str | None = None
+    disabled: bool | None = None
+    password: SecretStr | None = None
+    role_id: int | None = None
+
+    model_config = example_config(
+        {"full_name": "Иван Иванов", "disabled": False, "password": "newstrongpassword", "role_id": 3}
+    )
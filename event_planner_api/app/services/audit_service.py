@@ -6,14 +6,157 @@ This module provides a centralized API for writing audit events to the
 Use this service to record significant actions (create, update,
 delete) performed by users or the system.  Only administrators
 should have access to read audit logs.
+
+Writes are asynchronous: :meth:`AuditService.log` only puts the record on
+an in-process queue, and a background task started on first use inserts
+queued records in batches with a single commit.  :meth:`AuditService.flush`
+waits for the queue to drain; it is called before reading logs and on
+application shutdown.  Queue records after the caller's own transaction
+has committed and its connection has been released, so the request
+never holds the writer while auditing.  A caller that is writing in a
+transaction anyway can pass its ``cursor`` instead, so the audit record
+is inserted and committed together with the change it describes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Optional, List, Dict, Any
+import logging
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Optional, List, Any, Sequence, Tuple
+
+from event_planner_api.app.core import json_utils
+from event_planner_api.app.core.db import get_read_connection, get_shared_connection
+from event_planner_api.app.schemas.audit import AuditLogRead
+
+
+# Maximum number of queued records written in one transaction.
+AUDIT_BATCH_SIZE = 100
+
+_INSERT_SQL = """
+    INSERT INTO audit_logs (user_id, action, object_type, object_id, details, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# WHERE conditions of ``list_logs``, in the order of its filter arguments.
+# Bit ``i`` of a filter mask selects ``_LIST_FILTERS[i]``.
+_LIST_FILTERS = (
+    "user_id = ?",
+    "object_type = ?",
+    "action = ?",
+    "timestamp >= ?",
+    "timestamp <= ?",
+)
+
+
+@lru_cache(maxsize=1 << len(_LIST_FILTERS))
+def _build_list_query(mask: int) -> str:
+    """Return the ``list_logs`` SQL for the given filter mask.
+
+    There are only 32 possible shapes, so each SQL string is built once and
+    reused; identical strings also hit sqlite3's per-connection statement
+    cache instead of being parsed again.
+    """
+    query = "SELECT id, user_id, action, object_type, object_id, timestamp, details FROM audit_logs"
+    clauses = [clause for bit, clause in enumerate(_LIST_FILTERS) if mask & (1 << bit)]
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    return query + " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+
+
+def _fetch_log_rows(
+    user_id: Optional[int],
+    object_type: Optional[str],
+    action: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    limit: int,
+    offset: int,
+) -> List[sqlite3.Row]:
+    conn = get_read_connection()
+    try:
+        # Empty strings do not filter, same as ``None`` (except user_id)
+        filters = (user_id, object_type or None, action or None, start_date or None, end_date or None)
+        mask = 0
+        params: List[Any] = []
+        for bit, value in enumerate(filters):
+            if value is not None:
+                mask |= 1 << bit
+                params.append(value)
+        params.extend([limit, offset])
+        return conn.execute(_build_list_query(mask), params).fetchall()
+    finally:
+        conn.close()
+
+
+def _decode_details(raw: Optional[str]) -> Any:
+    """Decode the ``details`` column; invalid JSON is returned as is."""
+    if not raw:
+        return None
+    try:
+        return json_utils.loads(raw)
+    except json.JSONDecodeError:
+        return raw
+
+
+_queue: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
+
+
+def _write_batch(rows: Sequence[Tuple]) -> None:
+    # The writer task is the only user of the shared connection, so no
+    # locking is needed; it is kept open between batches.
+    conn = get_shared_connection()
+    try:
+        try:
+            conn.executemany(_INSERT_SQL, rows)
+        except sqlite3.IntegrityError:
+            # One bad record (e.g. a user deleted in the meantime) must not
+            # discard the whole batch: retry row by row and skip failures.
+            conn.rollback()
+            logger = logging.getLogger(__name__)
+            for row in rows:
+                try:
+                    conn.execute(_INSERT_SQL, row)
+                except sqlite3.IntegrityError as e:
+                    logger.warning("Skipping audit record %r: %s", row[:4], e)
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+
+async def _writer(queue: asyncio.Queue) -> None:
+    """Drain ``queue`` forever, inserting up to ``AUDIT_BATCH_SIZE`` rows per commit."""
+    logger = logging.getLogger(__name__)
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception:
+            # Audit failures must never break the request that produced them
+            logger.exception("Failed to write %d audit records", len(batch))
+        finally:
+            for _ in batch:
+                queue.task_done()
+
 
-from event_planner_api.app.core.db import get_connection
+def _ensure_writer() -> asyncio.Queue:
+    """Return the audit queue, starting the writer task on the running loop."""
+    global _queue, _writer_task
+    loop = asyncio.get_running_loop()
+    if _writer_task is None or _writer_task.done() or _writer_task.get_loop() is not loop:
+        _queue = asyncio.Queue()
+        _writer_task = loop.create_task(_writer(_queue))
+    return _queue
 
 
 class AuditService:
@@ -27,8 +170,9 @@ class AuditService:
         object_type: str,
         object_id: Optional[int] = None,
         details: Optional[dict] = None,
+        cursor: Optional[sqlite3.Cursor] = None,
     ) -> None:
-        """Insert a new audit record.
+        """Queue a new audit record for insertion.
 
         Parameters
         ----------
@@ -43,21 +187,39 @@ class AuditService:
             Primary key of the affected object, if applicable.
         details : Optional[dict]
             Additional structured data about the action, stored as JSON.
+        cursor : Optional[sqlite3.Cursor]
+            Cursor of an open transaction.  If given, the record is inserted
+            on it right away (not queued) and is committed or rolled back
+            with the caller's transaction.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            details_json = json.dumps(details) if details else None
-            cursor.execute(
-                """
-                INSERT INTO audit_logs (user_id, action, object_type, object_id, details)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (user_id, action, object_type, object_id, details_json),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        details_json = json_utils.dumps(details) if details else None
+        # The timestamp is taken now rather than at insert time; same
+        # format and timezone (UTC) as SQLite's CURRENT_TIMESTAMP.
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        row = (user_id, action, object_type, object_id, details_json, timestamp)
+        if cursor is not None:
+            cursor.execute(_INSERT_SQL, row)
+            return
+        _ensure_writer().put_nowait(row)
+
+    @classmethod
+    async def flush(cls) -> None:
+        """Wait until every queued audit record has been written."""
+        if _queue is not None and _writer_task is not None and not _writer_task.done():
+            await _queue.join()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Flush pending records and stop the background writer."""
+        global _writer_task
+        await cls.flush()
+        if _writer_task is not None:
+            _writer_task.cancel()
+            try:
+                await _writer_task
+            except asyncio.CancelledError:
+                pass
+            _writer_task = None
 
     @classmethod
     async def list_logs(
@@ -69,60 +231,43 @@ class AuditService:
         end_date: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[AuditLogRead]:
         """Retrieve audit records with optional filters and pagination.
 
         Only super‑admins should call this method.  Filtering by
         user_id, object_type or action reduces the result set.  Date
         filters accept ISO date strings ("YYYY-MM-DD") and apply to
         the ``timestamp`` column.  Sorting is always by ``timestamp"
-        descending.
+        descending.  Rows are converted with ``AuditLogRead.from_row``
+        (no validation: the data comes from our own table).  Pending
+        records are flushed first so a caller sees its own writes.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            where_clauses: List[str] = []
-            params: List[Any] = []
-            if user_id is not None:
-                where_clauses.append("user_id = ?")
-                params.append(user_id)
-            if object_type:
-                where_clauses.append("object_type = ?")
-                params.append(object_type)
-            if action:
-                where_clauses.append("action = ?")
-                params.append(action)
-            if start_date:
-                where_clauses.append("timestamp >= ?")
-                params.append(start_date)
-            if end_date:
-                where_clauses.append("timestamp <= ?")
-                params.append(end_date)
-            query = "SELECT id, user_id, action, object_type, object_id, timestamp, details FROM audit_logs"
-            if where_clauses:
-                query += " WHERE " + " AND ".join(where_clauses)
-            query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-            rows = cursor.execute(query, tuple(params)).fetchall()
-            logs = []
-            for row in rows:
-                details_data = None
-                if row["details"]:
-                    try:
-                        details_data = json.loads(row["details"])
-                    except json.JSONDecodeError:
-                        details_data = row["details"]
-                logs.append(
-                    {
-                        "id": row["id"],
-                        "user_id": row["user_id"],
-                        "action": row["action"],
-                        "object_type": row["object_type"],
-                        "object_id": row["object_id"],
-                        "timestamp": row["timestamp"],
-                        "details": details_data,
-                    }
-                )
-            return logs
-        finally:
-            conn.close()
\ No newline at end of file
+        await cls.flush()
+        rows = _fetch_log_rows(user_id, object_type, action, start_date, end_date, limit, offset)
+        return [AuditLogRead.from_row(row, details=_decode_details(row["details"])) for row in rows]
+
+    @classmethod
+    async def list_logs_json(
+        cls,
+        user_id: Optional[int] = None,
+        object_type: Optional[str] = None,
+        action: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> bytes:
+        """Same as :meth:`list_logs`, but return the encoded JSON array.
+
+        Used by the audit endpoint: the rows are serialized straight from
+        plain dicts, so no model instances are created and FastAPI's
+        response validation/serialization is skipped entirely.
+        """
+        await cls.flush()
+        rows = _fetch_log_rows(user_id, object_type, action, start_date, end_date, limit, offset)
+        logs = []
+        for row in rows:
+            log = dict(row)
+            log["details"] = _decode_details(log["details"])
+            logs.append(log)
+        return json_utils.dumpb(logs)
\ No newline at end of file
@@ -4,18 +4,91 @@ Business logic for bookings and waitlist management.
 The ``BookingService`` encapsulates operations for creating bookings,
 listing bookings for an event, and handling waitlists when events are
 fully booked.  It also provides methods for marking payment and
-attendance status on a booking.  In a production system, these
-operations should run within database transactions to ensure
-consistency when multiple users attempt to book simultaneously.
+attendance status on a booking.  Operations that check free seats
+and then write (creating bookings, confirming or promoting from the
+waitlist) run in ``BEGIN IMMEDIATE`` transactions, so concurrent
+requests cannot oversell an event.
 """
 
+import json
 import logging
 import sqlite3
 from datetime import datetime
 from typing import List, Optional
 
 from event_planner_api.app.schemas.booking import BookingCreate, BookingRead
-from event_planner_api.app.core.db import get_connection
+from event_planner_api.app.core.db import acquire_connection, get_table_columns, immediate_transaction
+from event_planner_api.app.services.audit_service import AuditService
+from event_planner_api.app.services.settings_service import SettingsService
+from event_planner_api.app.services.task_service import TaskService
+
+
+def _parse_created_at(value):
+    """Parse a stored ``created_at`` into a ``datetime``.
+
+    ``BookingRead.from_row`` skips validation, so the conversion pydantic
+    would otherwise do has to happen here.  SQLite's ``CURRENT_TIMESTAMP``
+    format is ISO 8601 with a space; anything unparsable is returned as is.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _decode_group_names(raw: Optional[str]) -> Optional[list]:
+    """Decode the ``group_names`` JSON column (``None`` if empty/invalid)."""
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except Exception:
+        return None
+
+
+# Columns of ``BookingRead`` in the order ``_booking_from_values`` unpacks
+# them.  ``{group_names}`` is the column itself or ``NULL`` on databases
+# without it, so every query returns the same shape.
+_BOOKING_COLUMNS = "id, user_id, event_id, group_size, status, created_at, is_paid, is_attended, {group_names}"
+
+
+def _booking_columns(include_group_names: bool) -> str:
+    return _BOOKING_COLUMNS.format(group_names="group_names" if include_group_names else "NULL AS group_names")
+
+
+def _booking_select(include_group_names: bool) -> str:
+    return f"SELECT {_booking_columns(include_group_names)} FROM bookings"
+
+
+# Lookups by id, built once so every call passes the same string to the
+# connection's statement cache.  Bookings are keyed by whether the
+# ``group_names`` column exists.
+_GET_BOOKING_SQL = {flag: _booking_select(flag) + " WHERE id = ?" for flag in (False, True)}
+_GET_WAITLIST_ENTRY_SQL = "SELECT id, event_id, user_id, position, created_at FROM waitlist WHERE id = ?"
+
+
+def _booking_from_values(values: tuple) -> BookingRead:
+    """Build a ``BookingRead`` from a plain row tuple of ``_BOOKING_COLUMNS``.
+
+    The tuple is unpacked once by position instead of looking up every
+    column by name, and the model is built without validation (the data
+    comes from our own table); only the columns whose stored type differs
+    from the schema are converted.
+    """
+    booking_id, user_id, event_id, group_size, status, created_at, is_paid, is_attended, group_names = values
+    return BookingRead.model_construct(
+        id=booking_id,
+        user_id=user_id,
+        event_id=event_id,
+        group_size=group_size,
+        status=status,
+        created_at=_parse_created_at(created_at),
+        is_paid=bool(is_paid),
+        is_attended=bool(is_attended),
+        group_names=_decode_group_names(group_names),
+    )
 
 
 class BookingService:
@@ -32,17 +105,24 @@ class BookingService:
         an exception if the user is already booked or waitlisted.
         """
         logger = logging.getLogger(__name__)
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Resolve user ID
-            user_row = cursor.execute(
-                "SELECT id FROM users WHERE email = ?",
-                (user_email,),
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Resolve the user, the event capacity and the seats already taken
+            # (confirmed or pending bookings) in one query.  The LEFT JOIN
+            # always yields a row, so a missing user/event shows up as NULL.
+            info = cursor.execute(
+                """
+                SELECT
+                    (SELECT id FROM users WHERE email = ?) AS user_id,
+                    e.id AS event_id,
+                    e.max_participants,
+                    (SELECT COALESCE(SUM(group_size), 0) FROM bookings WHERE event_id = e.id) AS total
+                FROM (SELECT 1) LEFT JOIN events e ON e.id = ?
+                """,
+                (user_email, event_id),
             ).fetchone()
-            if not user_row:
+            if info["user_id"] is None:
                 raise ValueError(f"User {user_email} does not exist")
-            user_id = user_row["id"]
+            user_id = info["user_id"]
 
             # Unlike earlier versions of the service, we no longer prevent a
             # single user from creating multiple bookings for the same event.
@@ -51,41 +131,13 @@ class BookingService:
             # participants.  Therefore, we intentionally do not check
             # existing bookings or waitlist entries for this user/event pair.
 
-            # Get event capacity and current bookings (confirmed or pending count as occupying spots)
-            event = cursor.execute(
-                "SELECT max_participants FROM events WHERE id = ?",
-                (event_id,),
-            ).fetchone()
-            if not event:
+            if info["event_id"] is None:
                 raise ValueError(f"Event {event_id} does not exist")
-            capacity = event["max_participants"]
-            count_row = cursor.execute(
-                "SELECT COALESCE(SUM(group_size), 0) as total FROM bookings WHERE event_id = ?",
-                (event_id,),
-            ).fetchone()
-            current_booked = count_row["total"] if count_row else 0
+            capacity = info["max_participants"]
+            current_booked = info["total"]
 
             if current_booked + booking.group_size <= capacity:
                 # Insert booking with status pending (awaiting payment/confirmation).
-                # Ensure the "group_names" column exists.  When deploying to an existing
-                # database, the column may not be present.  If missing, add it
-                # dynamically on first use.  SQLite prior to version 3.35 does not
-                # support "ALTER TABLE ... ADD COLUMN IF NOT EXISTS", so we check
-                # via PRAGMA.
-                import json
-                # Check for group_names column
-                try:
-                    cols = cursor.execute("PRAGMA table_info(bookings)").fetchall()
-                    if not any(col[1] == "group_names" for col in cols):
-                        # Column does not exist; attempt to add it
-                        try:
-                            cursor.execute("ALTER TABLE bookings ADD COLUMN group_names TEXT")
-                        except Exception:
-                            # If another process added it concurrently, ignore error
-                            pass
-                except Exception:
-                    # PRAGMA or ALTER may fail if database is busy; we ignore
-                    pass
                 group_names_json = json.dumps(booking.group_names) if booking.group_names else None
                 cursor.execute(
                     """
@@ -95,11 +147,9 @@ class BookingService:
                     (user_id, event_id, booking.group_size, "pending", group_names_json),
                 )
                 booking_id = cursor.lastrowid
-                conn.commit()
                 created_at = datetime.utcnow().isoformat()
-                # Record audit log for booking creation
+                # Record audit log for booking creation in the same transaction
                 try:
-                    from event_planner_api.app.services.audit_service import AuditService
                     details = {"event_id": event_id, "group_size": booking.group_size}
                     if booking.group_names:
                         details["group_names"] = booking.group_names
@@ -109,9 +159,11 @@ class BookingService:
                         object_type="booking",
                         object_id=booking_id,
                         details=details,
+                        cursor=cursor,
                     )
                 except Exception:
                     pass
+                conn.commit()
                 return BookingRead(
                     id=booking_id,
                     user_id=user_id,
@@ -122,24 +174,22 @@ class BookingService:
                     group_names=booking.group_names,
                 )
             else:
-                # Add user to waitlist
-                # Determine next position
-                pos_row = cursor.execute(
-                    "SELECT COALESCE(MAX(position), 0) + 1 as next_pos FROM waitlist WHERE event_id = ?",
-                    (event_id,),
-                ).fetchone()
-                position = pos_row["next_pos"] if pos_row else 1
-                cursor.execute(
-                    "INSERT INTO waitlist (event_id, user_id, position) VALUES (?, ?, ?)",
-                    (event_id, user_id, position),
-                )
+                # Add user to waitlist at the next position.  MAX(position)
+                # is a single seek on idx_waitlist_event_pos_user, and computing it
+                # inside the INSERT saves the separate SELECT round trip.
+                position = cursor.execute(
+                    """
+                    INSERT INTO waitlist (event_id, user_id, position)
+                    SELECT ?, ?, COALESCE(MAX(position), 0) + 1 FROM waitlist WHERE event_id = ?
+                    RETURNING position
+                    """,
+                    (event_id, user_id, event_id),
+                ).fetchone()["position"]
                 conn.commit()
                 logger.info(
                     "User %s added to waitlist for event %s at position %s", user_email, event_id, position
                 )
                 raise ValueError("Event is full. You have been added to the waitlist.")
-        finally:
-            conn.close()
 
     @classmethod
     async def list_bookings(
@@ -157,31 +207,17 @@ class BookingService:
         ``asc`` или ``desc`` (по умолчанию desc).  ``limit`` и ``offset``
         управляют пагинацией.
         """
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
             params: list = [event_id]
             # Determine whether the "group_names" column exists.  If it does not,
-            # exclude it from the SELECT clause.  Otherwise include it.  This
-            # dynamic check allows the service to operate on databases created
-            # prior to the addition of the column.
-            include_group_names = True
-            try:
-                col_rows = cursor.execute("PRAGMA table_info(bookings)").fetchall()
-                include_group_names = any(col[1] == "group_names" for col in col_rows)
-            except Exception:
-                include_group_names = False
+            # select NULL in its place.  This allows the service to operate on
+            # databases created prior to the addition of the column (migration
+            # 13).  ``get_table_columns`` caches the column set until the next
+            # migration, so this costs no query.
+            include_group_names = "group_names" in get_table_columns("bookings")
 
-            if include_group_names:
-                query = (
-                    "SELECT id, user_id, event_id, group_size, status, created_at, is_paid, is_attended, group_names "
-                    "FROM bookings WHERE event_id = ?"
-                )
-            else:
-                query = (
-                    "SELECT id, user_id, event_id, group_size, status, created_at, is_paid, is_attended "
-                    "FROM bookings WHERE event_id = ?"
-                )
+            query = _booking_select(include_group_names) + " WHERE event_id = ?"
 
             # Sorting
             sort_field = sort_by if sort_by in {"created_at", "user_id", "is_paid", "is_attended"} else "created_at"
@@ -195,117 +231,72 @@ class BookingService:
                     query += " OFFSET ?"
                     params.append(offset)
 
-            rows = cursor.execute(query, tuple(params)).fetchall()
-            bookings: List[BookingRead] = []
-            import json
-            for row in rows:
-                # Deserialize group_names JSON if the column is present
-                group_names_list = None
-                if include_group_names:
-                    group_names_raw = row["group_names"]
-                    if group_names_raw:
-                        try:
-                            group_names_list = json.loads(group_names_raw)
-                        except Exception:
-                            group_names_list = None
-                bookings.append(
-                    BookingRead(
-                        id=row["id"],
-                        user_id=row["user_id"],
-                        event_id=row["event_id"],
-                        group_size=row["group_size"],
-                        status=row["status"],
-                        created_at=row["created_at"],
-                        is_paid=bool(row["is_paid"]),
-                        is_attended=bool(row["is_attended"]),
-                        group_names=group_names_list,
-                    )
-                )
-            return bookings
-        finally:
-            conn.close()
+            # Plain tuples are unpacked by position (``_booking_from_values``).
+            # The cursor is iterated directly, so the raw rows are never
+            # materialized as a second list next to the result.
+            cursor.row_factory = None
+            return [_booking_from_values(values) for values in cursor.execute(query, tuple(params))]
 
     @classmethod
     async def list_waitlist(cls, event_id: int) -> List[dict]:
         """List waitlist entries for a given event in order."""
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
+            # Plain tuples instead of sqlite3.Row: ``dict(zip(...))`` with the
+            # column names taken once is cheaper than ``dict(row)``,
+            # which goes through Row's mapping protocol for every row.
+            cursor.row_factory = None
             rows = cursor.execute(
                 "SELECT id, user_id, position, created_at FROM waitlist WHERE event_id = ? ORDER BY position ASC",
                 (event_id,),
             ).fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            columns = [col[0] for col in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
 
     @classmethod
     async def mark_booking_status(cls, booking_id: int, status: str) -> None:
         """Update the status of a booking (e.g., to 'paid' or 'attended')."""
-        conn = get_connection()
-        try:
+        with acquire_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE bookings SET status = ? WHERE id = ?",
                 (status, booking_id),
             )
             conn.commit()
-        finally:
-            conn.close()
 
     @classmethod
     async def toggle_payment(cls, booking_id: int) -> None:
         """Toggle the payment flag for a booking.
 
-        Retrieves the current ``is_paid`` value, flips it and
-        persists the update.  In a production system this should be
-        wrapped in a transaction to avoid race conditions.
+        The flag is flipped in place by a single ``UPDATE``, so there
+        is no read‑then‑write race between concurrent toggles.
         """
-        conn = get_connection()
-        try:
+        with acquire_connection() as conn:
             cursor = conn.cursor()
-            row = cursor.execute(
-                "SELECT is_paid FROM bookings WHERE id = ?",
-                (booking_id,),
-            ).fetchone()
-            if not row:
-                raise ValueError(f"Booking {booking_id} not found")
-            current = row["is_paid"] or 0
-            new_value = 0 if current else 1
             cursor.execute(
-                "UPDATE bookings SET is_paid = ? WHERE id = ?",
-                (new_value, booking_id),
+                "UPDATE bookings SET is_paid = NOT COALESCE(is_paid, 0) WHERE id = ?",
+                (booking_id,),
             )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Booking {booking_id} not found")
             conn.commit()
-        finally:
-            conn.close()
 
     @classmethod
     async def toggle_attendance(cls, booking_id: int) -> None:
         """Toggle the attendance flag for a booking.
 
-        Retrieves the current ``is_attended`` value, flips it and
-        persists the update.  Use database transactions in a real
-        implementation to guarantee consistency.
+        Like :meth:`toggle_payment`, a single ``UPDATE`` flips the flag
+        and ``rowcount`` tells whether the booking exists.
         """
-        conn = get_connection()
-        try:
+        with acquire_connection() as conn:
             cursor = conn.cursor()
-            row = cursor.execute(
-                "SELECT is_attended FROM bookings WHERE id = ?",
-                (booking_id,),
-            ).fetchone()
-            if not row:
-                raise ValueError(f"Booking {booking_id} not found")
-            current = row["is_attended"] or 0
-            new_value = 0 if current else 1
             cursor.execute(
-                "UPDATE bookings SET is_attended = ? WHERE id = ?",
-                (new_value, booking_id),
+                "UPDATE bookings SET is_attended = NOT COALESCE(is_attended, 0) WHERE id = ?",
+                (booking_id,),
             )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Booking {booking_id} not found")
             conn.commit()
-        finally:
-            conn.close()
 
     @classmethod
     async def delete_booking_with_promotion(cls, booking_id: int, promote_waitlist: bool = True) -> None:
@@ -325,20 +316,30 @@ class BookingService:
         ValueError
             If the booking does not exist.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Determine event_id before deletion
-            row = cursor.execute(
-                "SELECT event_id FROM bookings WHERE id = ?",
-                (booking_id,),
-            ).fetchone()
-            if not row:
-                raise ValueError(f"Booking {booking_id} not found")
-            event_id = row["event_id"]
-            # Delete booking
-            cursor.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
-            conn.commit()
+        with acquire_connection() as conn:
+            with immediate_transaction(conn) as cursor:
+                # Determine event_id before deletion
+                row = cursor.execute(
+                    "SELECT event_id FROM bookings WHERE id = ?",
+                    (booking_id,),
+                ).fetchone()
+                if not row:
+                    raise ValueError(f"Booking {booking_id} not found")
+                event_id = row["event_id"]
+                # Delete booking
+                cursor.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
+                # Audit log, committed together with the deletion
+                try:
+                    await AuditService.log(
+                        user_id=None,
+                        action="delete",
+                        object_type="booking",
+                        object_id=booking_id,
+                        details={"event_id": event_id},
+                        cursor=cursor,
+                    )
+                except Exception:
+                    pass
             # Promote from waitlist if required
             if promote_waitlist:
                 # Determine promotion mode from settings.  By default
@@ -351,7 +352,6 @@ class BookingService:
                 # messenger bots to allow users to confirm their
                 # booking.
                 try:
-                    from event_planner_api.app.services.settings_service import SettingsService
                     setting = await SettingsService.get_setting("waitlist_auto_promote")
                     auto = setting["value"] if setting else True
                 except Exception:
@@ -360,68 +360,51 @@ class BookingService:
                     await cls._promote_from_waitlist(event_id)
                 else:
                     await cls.notify_waitlist_users(event_id)
-        finally:
-            conn.close()
-        # Write audit log outside of transaction
-        try:
-            from event_planner_api.app.services.audit_service import AuditService
-            await AuditService.log(
-                user_id=None,
-                action="delete",
-                object_type="booking",
-                object_id=booking_id,
-                details={"event_id": event_id},
-            )
-        except Exception:
-            pass
 
     @classmethod
     async def _promote_from_waitlist(cls, event_id: int) -> None:
         """Internal helper to promote waitlisted users to bookings.
 
-        Calculates available seats for the event and iteratively moves
-        users from the waitlist to the bookings table until места
-        закончатся или waitlist опустеет.  Each promoted user gets a
-        booking with ``group_size = 1`` and ``status = 'pending'``.
+        Calculates available seats for the event and moves users from the
+        waitlist to the bookings table until места закончатся или waitlist
+        опустеет.  Each promoted user gets a booking with ``group_size = 1``
+        and ``status = 'pending'``.  As many entries as there are free seats
+        (in waitlist order) are moved with one ``INSERT ... SELECT`` and one
+        ``DELETE`` instead of a round trip per entry.
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Fetch event capacity
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Fetch event capacity and the seats already booked
             evt = cursor.execute(
-                "SELECT max_participants FROM events WHERE id = ?",
+                """
+                SELECT e.max_participants,
+                       (SELECT COALESCE(SUM(group_size), 0) FROM bookings WHERE event_id = e.id) AS total
+                FROM events e WHERE e.id = ?
+                """,
                 (event_id,),
             ).fetchone()
             if not evt:
                 return
-            capacity = evt["max_participants"]
-            # Count seats already booked
-            seats = cursor.execute(
-                "SELECT COALESCE(SUM(group_size),0) as total FROM bookings WHERE event_id = ?",
-                (event_id,),
-            ).fetchone()["total"]
-            # Move users while there is space
-            while seats < capacity:
-                wait_row = cursor.execute(
-                    "SELECT id, user_id FROM waitlist WHERE event_id = ? ORDER BY position ASC LIMIT 1",
-                    (event_id,),
-                ).fetchone()
-                if not wait_row:
-                    break
-                wid = wait_row["id"]
-                uid = wait_row["user_id"]
-                # Remove from waitlist
-                cursor.execute("DELETE FROM waitlist WHERE id = ?", (wid,))
-                # Create new booking
-                cursor.execute(
-                    "INSERT INTO bookings (user_id, event_id, group_size, status) VALUES (?, ?, 1, 'pending')",
-                    (uid, event_id),
+            free = evt["max_participants"] - evt["total"]
+            if free <= 0:
+                return
+            # Both statements select the same entries: ``id`` breaks ties
+            # between equal positions.
+            cursor.execute(
+                """
+                INSERT INTO bookings (user_id, event_id, group_size, status)
+                SELECT user_id, event_id, 1, 'pending' FROM waitlist
+                WHERE event_id = ? ORDER BY position ASC, id ASC LIMIT ?
+                """,
+                (event_id, free),
+            )
+            cursor.execute(
+                """
+                DELETE FROM waitlist WHERE id IN (
+                    SELECT id FROM waitlist WHERE event_id = ? ORDER BY position ASC, id ASC LIMIT ?
                 )
-                seats += 1
-            conn.commit()
-        finally:
-            conn.close()
+                """,
+                (event_id, free),
+            )
 
     # To maintain backwards compatibility, provide a ``delete_booking`` alias
     # that automatically promotes users from the waitlist.  Endpoints should
@@ -452,10 +435,6 @@ class BookingService:
         event_id : int
             Identifier of the event for which a seat has become available.
         """
-        try:
-            from event_planner_api.app.services.task_service import TaskService
-        except Exception:
-            return
         # Fetch all waitlist entries for the event
         entries = await cls.list_waitlist(event_id)
         if not entries:
@@ -466,11 +445,11 @@ class BookingService:
         # messenger (telegram, vk, max) so that bots can deliver the
         # notification to their respective platforms.
         messengers = ["telegram", "vk", "max"]
-        for entry in entries:
-            entry_id = entry.get("id")
-            # Use TaskService to insert tasks.  It is idempotent and
-            # ensures the tasks table exists.
-            await TaskService.create_waitlist_tasks(entry_id=entry_id, messengers=messengers)
+        # All tasks are inserted in one batch (one commit).  TaskService
+        # ensures the tasks table exists.
+        await TaskService.create_waitlist_tasks_bulk(
+            [entry["id"] for entry in entries], messengers=messengers
+        )
 
     @classmethod
     async def confirm_waitlist(cls, entry_id: int, user_email: str) -> BookingRead:
@@ -503,38 +482,33 @@ class BookingService:
             If the entry does not exist, does not belong to the
             authenticated user or if no seats are available.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Fetch waitlist entry
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Fetch the waitlist entry together with the caller's user ID, the
+            # event capacity and the seats already booked in one query
             wl = cursor.execute(
-                "SELECT id, event_id, user_id, position FROM waitlist WHERE id = ?",
-                (entry_id,),
+                """
+                SELECT
+                    w.id, w.event_id, w.user_id, w.position,
+                    (SELECT id FROM users WHERE email = ?) AS caller_id,
+                    e.id AS event_exists,
+                    e.max_participants,
+                    (SELECT COALESCE(SUM(group_size), 0) FROM bookings WHERE event_id = w.event_id) AS total
+                FROM waitlist w LEFT JOIN events e ON e.id = w.event_id
+                WHERE w.id = ?
+                """,
+                (user_email, entry_id),
             ).fetchone()
             if not wl:
                 raise ValueError(f"Waitlist entry {entry_id} not found")
             event_id = wl["event_id"]
             user_id = wl["user_id"]
             # Verify that the email corresponds to the user_id
-            user_row = cursor.execute(
-                "SELECT id FROM users WHERE email = ?",
-                (user_email,),
-            ).fetchone()
-            if not user_row or user_row["id"] != user_id:
+            if wl["caller_id"] is None or wl["caller_id"] != user_id:
                 raise ValueError("You are not authorized to claim this waitlist entry")
-            # Determine capacity and current bookings
-            event_row = cursor.execute(
-                "SELECT max_participants FROM events WHERE id = ?",
-                (event_id,),
-            ).fetchone()
-            if not event_row:
+            if wl["event_exists"] is None:
                 raise ValueError(f"Event {event_id} does not exist")
-            capacity = event_row["max_participants"]
-            count_row = cursor.execute(
-                "SELECT COALESCE(SUM(group_size),0) AS total FROM bookings WHERE event_id = ?",
-                (event_id,),
-            ).fetchone()
-            booked = count_row["total"] if count_row else 0
+            capacity = wl["max_participants"]
+            booked = wl["total"]
             if booked >= capacity:
                 raise ValueError("No seats are currently available for this event")
             # Remove from waitlist
@@ -544,41 +518,30 @@ class BookingService:
                 "UPDATE waitlist SET position = position - 1 WHERE event_id = ? AND position > ?",
                 (event_id, wl["position"]),
             )
-            # Ensure group_names column exists for bookings
-            try:
-                cols = cursor.execute("PRAGMA table_info(bookings)").fetchall()
-                if not any(col[1] == "group_names" for col in cols):
-                    try:
-                        cursor.execute("ALTER TABLE bookings ADD COLUMN group_names TEXT")
-                    except Exception:
-                        pass
-            except Exception:
-                pass
             # Insert booking with group_size=1, status pending
             cursor.execute(
                 "INSERT INTO bookings (user_id, event_id, group_size, status) VALUES (?, ?, 1, 'pending')",
                 (user_id, event_id),
             )
             booking_id = cursor.lastrowid
-            conn.commit()
-            # Mark associated tasks as completed
-            try:
-                from event_planner_api.app.services.task_service import TaskService
-                await TaskService.complete_waitlist_tasks(entry_id)
-            except Exception:
-                pass
-            # Audit log
+            # Audit log, committed together with the booking
             try:
-                from event_planner_api.app.services.audit_service import AuditService
                 await AuditService.log(
                     user_id=user_id,
                     action="create",
                     object_type="booking",
                     object_id=booking_id,
                     details={"event_id": event_id, "from_waitlist": entry_id},
+                    cursor=cursor,
                 )
             except Exception:
                 pass
+            conn.commit()
+            # Mark associated tasks as completed
+            try:
+                await TaskService.complete_waitlist_tasks(entry_id)
+            except Exception:
+                pass
             # Build and return booking
             created_at = datetime.utcnow().isoformat()
             return BookingRead(
@@ -592,8 +555,6 @@ class BookingService:
                 is_attended=False,
                 group_names=None,
             )
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
     # Additional CRUD operations
@@ -618,53 +579,15 @@ class BookingService:
         ValueError
             If the booking does not exist.
         """
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
             # Check if group_names column exists
-            include_group_names = True
-            try:
-                cols = cursor.execute("PRAGMA table_info(bookings)").fetchall()
-                include_group_names = any(col[1] == "group_names" for col in cols)
-            except Exception:
-                include_group_names = False
-            if include_group_names:
-                row = cursor.execute(
-                    "SELECT id, user_id, event_id, group_size, status, created_at, is_paid, is_attended, group_names"
-                    " FROM bookings WHERE id = ?",
-                    (booking_id,),
-                ).fetchone()
-            else:
-                row = cursor.execute(
-                    "SELECT id, user_id, event_id, group_size, status, created_at, is_paid, is_attended"
-                    " FROM bookings WHERE id = ?",
-                    (booking_id,),
-                ).fetchone()
+            include_group_names = "group_names" in get_table_columns("bookings")
+            cursor.row_factory = None
+            row = cursor.execute(_GET_BOOKING_SQL[include_group_names], (booking_id,)).fetchone()
             if not row:
                 raise ValueError(f"Booking {booking_id} not found")
-            # Deserialize group_names
-            import json
-            group_names_list = None
-            if include_group_names:
-                raw = row[8]  # group_names column
-                if raw:
-                    try:
-                        group_names_list = json.loads(raw)
-                    except Exception:
-                        group_names_list = None
-            return BookingRead(
-                id=row[0],
-                user_id=row[1],
-                event_id=row[2],
-                group_size=row[3],
-                status=row[4],
-                created_at=row[5],
-                is_paid=bool(row[6]),
-                is_attended=bool(row[7]),
-                group_names=group_names_list,
-            )
-        finally:
-            conn.close()
+            return _booking_from_values(row)
 
     @classmethod
     async def update_booking(cls, booking_id: int, updates: dict) -> BookingRead:
@@ -688,13 +611,7 @@ class BookingService:
         BookingRead
             The updated booking.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Ensure booking exists
-            row = cursor.execute("SELECT id FROM bookings WHERE id = ?", (booking_id,)).fetchone()
-            if not row:
-                raise ValueError(f"Booking {booking_id} not found")
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             # Determine columns to update
             set_clauses = []
             params: list = []
@@ -702,52 +619,47 @@ class BookingService:
             if "group_size" in updates and updates["group_size"] is not None:
                 set_clauses.append("group_size = ?")
                 params.append(int(updates["group_size"]))
-            # Update group_names (ensure column exists)
+            # Update group_names
             if "group_names" in updates:
                 # Convert list to JSON or set NULL
-                import json
                 names = updates["group_names"]
                 if names:
                     group_names_json = json.dumps(names)
                 else:
                     group_names_json = None
-                # Ensure column exists by attempting to add if missing
-                try:
-                    cols = cursor.execute("PRAGMA table_info(bookings)").fetchall()
-                    if not any(col[1] == "group_names" for col in cols):
-                        try:
-                            cursor.execute("ALTER TABLE bookings ADD COLUMN group_names TEXT")
-                        except Exception:
-                            pass
-                except Exception:
-                    # Unable to check or add column; proceed
-                    pass
                 set_clauses.append("group_names = ?")
                 params.append(group_names_json)
-            # If nothing to update, return existing booking
+            include_group_names = "group_names" in get_table_columns("bookings")
+            cursor.row_factory = None
+            # If nothing to update, return the existing booking
             if not set_clauses:
-                return await cls.get_booking(booking_id)
-            # Compose update statement
+                row = cursor.execute(_GET_BOOKING_SQL[include_group_names], (booking_id,)).fetchone()
+                if row is None:
+                    raise ValueError(f"Booking {booking_id} not found")
+                return _booking_from_values(row)
+            # Compose update statement; RETURNING yields the updated booking
+            # (or tells that it does not exist) on this same connection
             set_stmt = ", ".join(set_clauses)
             params.append(booking_id)
-            cursor.execute(f"UPDATE bookings SET {set_stmt} WHERE id = ?", tuple(params))
+            row = cursor.execute(
+                f"UPDATE bookings SET {set_stmt} WHERE id = ? RETURNING {_booking_columns(include_group_names)}",
+                tuple(params),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Booking {booking_id} not found")
             conn.commit()
-            # Audit log
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=None,
-                    action="update",
-                    object_type="booking",
-                    object_id=booking_id,
-                    details=updates,
-                )
-            except Exception:
-                pass
-            # Return updated booking
-            return await cls.get_booking(booking_id)
-        finally:
-            conn.close()
+        # Audit log (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=None,
+                action="update",
+                object_type="booking",
+                object_id=booking_id,
+                details=updates,
+            )
+        except Exception:
+            pass
+        return _booking_from_values(row)
 
     @classmethod
     async def get_waitlist_entry(cls, entry_id: int) -> dict:
@@ -769,18 +681,12 @@ class BookingService:
         ValueError
             If the entry does not exist.
         """
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            row = cursor.execute(
-                "SELECT id, event_id, user_id, position, created_at FROM waitlist WHERE id = ?",
-                (entry_id,),
-            ).fetchone()
+            row = cursor.execute(_GET_WAITLIST_ENTRY_SQL, (entry_id,)).fetchone()
             if not row:
                 raise ValueError(f"Waitlist entry {entry_id} not found")
             return dict(row)
-        finally:
-            conn.close()
 
     @classmethod
     async def update_waitlist_entry(cls, entry_id: int, new_position: int) -> dict:
@@ -808,55 +714,50 @@ class BookingService:
         ValueError
             If the entry does not exist.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Fetch current entry and event
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Fetch current entry, its event and the number of entries in
+            # one statement.  The count is a correlated subquery answered from
+            # idx_waitlist_event_pos_user; ``COUNT(*) OVER (PARTITION BY
+            # event_id)`` would not do here, since the window only sees the
+            # rows left by ``WHERE id = ?`` (always 1).
             current = cursor.execute(
-                "SELECT event_id, position FROM waitlist WHERE id = ?",
+                """
+                SELECT w.event_id, w.position,
+                       (SELECT COUNT(*) FROM waitlist WHERE event_id = w.event_id) AS total
+                FROM waitlist w WHERE w.id = ?
+                """,
                 (entry_id,),
             ).fetchone()
             if not current:
                 raise ValueError(f"Waitlist entry {entry_id} not found")
-            event_id, cur_pos = current["event_id"], current["position"]
-            # Determine bounds
-            total_row = cursor.execute(
-                "SELECT COUNT(*) AS total FROM waitlist WHERE event_id = ?",
-                (event_id,),
-            ).fetchone()
-            max_pos = total_row["total"] if total_row else 1
+            event_id, cur_pos, max_pos = current["event_id"], current["position"], current["total"]
             # Clamp new_position
             if new_position < 1:
                 new_position = 1
             if new_position > max_pos:
                 new_position = max_pos
-            # Adjust other entries
-            if new_position < cur_pos:
-                # Move up: shift down intervening entries
-                cursor.execute(
-                    "UPDATE waitlist SET position = position + 1 WHERE event_id = ? AND position >= ? AND position < ?",
-                    (event_id, new_position, cur_pos),
-                )
-            elif new_position > cur_pos:
-                # Move down: shift up intervening entries
-                cursor.execute(
-                    "UPDATE waitlist SET position = position - 1 WHERE event_id = ? AND position <= ? AND position > ?",
-                    (event_id, new_position, cur_pos),
+            # Move the entry and shift the intervening entries in one
+            # statement: moving up shifts them down (+1), moving down shifts
+            # them up (-1).  Only rows between the old and new position are
+            # touched.
+            rows = cursor.execute(
+                """
+                UPDATE waitlist SET position = CASE
+                    WHEN id = :entry_id THEN :new_pos
+                    WHEN position >= :new_pos AND position < :cur_pos THEN position + 1
+                    WHEN position <= :new_pos AND position > :cur_pos THEN position - 1
+                    ELSE position
+                END
+                WHERE event_id = :event_id AND (
+                    id = :entry_id OR position BETWEEN MIN(:new_pos, :cur_pos) AND MAX(:new_pos, :cur_pos)
                 )
-            # Update entry
-            cursor.execute(
-                "UPDATE waitlist SET position = ? WHERE id = ?",
-                (new_position, entry_id),
-            )
+                RETURNING id, event_id, user_id, position, created_at
+                """,
+                {"entry_id": entry_id, "new_pos": new_position, "cur_pos": cur_pos, "event_id": event_id},
+            ).fetchall()
             conn.commit()
             # Return updated entry
-            row = cursor.execute(
-                "SELECT id, event_id, user_id, position, created_at FROM waitlist WHERE id = ?",
-                (entry_id,),
-            ).fetchone()
-            return dict(row)
-        finally:
-            conn.close()
+            return next(dict(row) for row in rows if row["id"] == entry_id)
 
     @classmethod
     async def delete_waitlist_entry(cls, entry_id: int) -> None:
@@ -871,24 +772,18 @@ class BookingService:
         entry_id : int
             Identifier of the waitlist entry to remove.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Fetch entry to get event and position
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Delete entry; RETURNING gives its event and position
             current = cursor.execute(
-                "SELECT event_id, position FROM waitlist WHERE id = ?",
+                "DELETE FROM waitlist WHERE id = ? RETURNING event_id, position",
                 (entry_id,),
             ).fetchone()
             if not current:
                 raise ValueError(f"Waitlist entry {entry_id} not found")
             event_id, cur_pos = current["event_id"], current["position"]
-            # Delete entry
-            cursor.execute("DELETE FROM waitlist WHERE id = ?", (entry_id,))
             # Update positions of remaining entries (compact)
             cursor.execute(
                 "UPDATE waitlist SET position = position - 1 WHERE event_id = ? AND position > ?",
                 (event_id, cur_pos),
             )
-            conn.commit()
-        finally:
-            conn.close()
\ No newline at end of file
+            conn.commit()
\ No newline at end of file
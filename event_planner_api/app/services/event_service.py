@@ -7,9 +7,70 @@ persistent storage and handle concurrency appropriately.
 """
 
 import logging
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
+from ..core.db import acquire_connection, immediate_transaction
 from ..schemas.event import EventCreate, EventRead
+from .audit_service import AuditService
+
+
+# Columns unpacked by ``_event_from_values``, in order.
+_EVENT_COLS = "id, title, description, start_time, duration_minutes, max_participants, is_paid"
+# Lookup by id, built once so every call passes the same string to the
+# connection's statement cache.
+_GET_EVENT_SQL = f"SELECT {_EVENT_COLS} FROM events WHERE id = ?"
+
+# WHERE conditions of ``list_events``, in the order of its filter arguments
+# (``is_paid``, ``date_from``, ``date_to``).  Bit ``i`` of a filter mask
+# selects ``_LIST_FILTERS[i]``.
+_LIST_FILTERS = ("is_paid = ?", "start_time >= ?", "start_time <= ?")
+_LIST_SORT_FIELDS = frozenset({"id", "title", "start_time", "duration_minutes", "max_participants"})
+
+# Tables whose rows refer to an event and are removed with it by
+# ``delete_event``; each has an index on ``event_id``.
+_CASCADE_TABLES = ("bookings", "waitlist", "payments", "reviews")
+_CASCADE_SQL = tuple(f"DELETE FROM {table} WHERE event_id = ?" for table in _CASCADE_TABLES)
+
+
+@lru_cache(maxsize=(1 << len(_LIST_FILTERS)) * len(_LIST_SORT_FIELDS) * 2)
+def _build_list_query(mask: int, sort_by: str, order: str) -> str:
+    """Return the ``list_events`` SQL for a filter mask and a (validated) sort.
+
+    There are only 80 possible shapes, so each SQL string is built once and
+    reused, and identical strings hit sqlite3's statement cache.
+    """
+    query = f"SELECT {_EVENT_COLS} FROM events"
+    clauses = [clause for bit, clause in enumerate(_LIST_FILTERS) if mask & (1 << bit)]
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    return query + f" ORDER BY {sort_by} {order} LIMIT ? OFFSET ?"
+
+
+def _event_from_values(values) -> EventRead:
+    """Build an ``EventRead`` from a plain row tuple without validation.
+
+    ``values`` are ``id, title, description, start_time, duration_minutes,
+    max_participants, is_paid`` in that order.  ``start_time`` is parsed
+    here since ``model_construct`` does not convert it; unparsable values
+    are passed through as stored.
+    """
+    event_id, title, description, start_time, duration_minutes, max_participants, is_paid = values
+    if isinstance(start_time, str):
+        try:
+            start_time = datetime.fromisoformat(start_time)
+        except ValueError:
+            pass
+    return EventRead.model_construct(
+        id=event_id,
+        title=title,
+        description=description,
+        start_time=start_time,
+        duration_minutes=duration_minutes,
+        max_participants=max_participants,
+        is_paid=bool(is_paid),
+    )
 
 
 class EventService:
@@ -33,10 +94,7 @@ class EventService:
         """
         logger = logging.getLogger(__name__)
         logger.info("User %s is creating event '%s'", current_user.get("sub"), data.title)
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             cursor.execute(
                 """
                 INSERT INTO events (title, description, start_time, duration_minutes, max_participants, is_paid)
@@ -53,22 +111,19 @@ class EventService:
             )
             event_id = cursor.lastrowid
             conn.commit()
-            # Write audit log
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=current_user.get("user_id"),
-                    action="create",
-                    object_type="event",
-                    object_id=event_id,
-                    details={"title": data.title},
-                )
-            except Exception:
-                # Logging failures should not prevent event creation
-                pass
-            return EventRead(id=event_id, **data.dict())
-        finally:
-            conn.close()
+        # Write audit log (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=current_user.get("user_id"),
+                action="create",
+                object_type="event",
+                object_id=event_id,
+                details={"title": data.title},
+            )
+        except Exception:
+            # Logging failures should not prevent event creation
+            pass
+        return EventRead(id=event_id, **data.dict())
 
     @classmethod
     async def list_events(
@@ -89,91 +144,63 @@ class EventService:
         - ``is_paid``: фильтр по платности (True/False) или None (без фильтра).
         - ``date_from`` и ``date_to``: диапазон дат начала (в формате ISO‑строки) для фильтрации.
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            query = "SELECT id, title, description, start_time, duration_minutes, max_participants, is_paid FROM events"
+            # Plain tuples: rows are unpacked positionally below
+            cursor.row_factory = None
             params: list = []
-            where_clauses: list[str] = []
+            mask = 0
             if is_paid is not None:
-                where_clauses.append("is_paid = ?")
+                mask |= 1
                 params.append(1 if is_paid else 0)
             if date_from:
-                where_clauses.append("start_time >= ?")
+                mask |= 2
                 params.append(date_from)
             if date_to:
-                where_clauses.append("start_time <= ?")
+                mask |= 4
                 params.append(date_to)
-            if where_clauses:
-                query += " WHERE " + " AND ".join(where_clauses)
             # Validate sort_by
-            allowed_sorts = {"id", "title", "start_time", "duration_minutes", "max_participants"}
-            if sort_by not in allowed_sorts:
+            if sort_by not in _LIST_SORT_FIELDS:
                 sort_by = "id"
             order = order.lower()
             if order not in {"asc", "desc"}:
                 order = "asc"
-            query += f" ORDER BY {sort_by} {order}"
-            query += " LIMIT ? OFFSET ?"
             params.extend([limit, offset])
-            rows = cursor.execute(query, tuple(params)).fetchall()
-            events: List[EventRead] = []
-            for row in rows:
-                events.append(
-                    EventRead(
-                        id=row["id"],
-                        title=row["title"],
-                        description=row["description"],
-                        start_time=row["start_time"],
-                        duration_minutes=row["duration_minutes"],
-                        max_participants=row["max_participants"],
-                        is_paid=bool(row["is_paid"]),
-                    )
-                )
-            return events
-        finally:
-            conn.close()
+            query = _build_list_query(mask, sort_by, order)
+            return [_event_from_values(row) for row in cursor.execute(query, tuple(params))]
 
     @classmethod
     async def delete_event(cls, event_id: int) -> None:
         """Удалить мероприятие.
 
-        Удаляет запись из таблицы events.  В реальном
-        приложении следует также удалять связанные бронирования,
-        платежи, отзывы и элементы листа ожидания.  Если
-        мероприятие не найдено, возбуждает ``ValueError``.
+        Удаляет запись из таблицы events вместе со связанными
+        бронированиями, элементами листа ожидания, платежами и отзывами
+        в одной транзакции.  Если мероприятие не найдено, возбуждает
+        ``ValueError`` (ничего не удаляется).
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # First check event exists
-            exists = cursor.execute("SELECT id FROM events WHERE id = ?", (event_id,)).fetchone()
-            if not exists:
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Cascade delete dependent records first: foreign keys are
+            # enforced, so the event row can only go once nothing refers to it
+            params = (event_id,)
+            for sql in _CASCADE_SQL:
+                cursor.execute(sql, params)
+            # Remove the event itself.  RETURNING replaces a separate existence
+            # check; for a missing event the transaction is rolled back.
+            deleted = cursor.execute("DELETE FROM events WHERE id = ? RETURNING id", (event_id,)).fetchone()
+            if not deleted:
                 raise ValueError(f"Event {event_id} not found")
-            # Cascade delete dependent records
-            cursor.execute("DELETE FROM bookings WHERE event_id = ?", (event_id,))
-            cursor.execute("DELETE FROM waitlist WHERE event_id = ?", (event_id,))
-            cursor.execute("DELETE FROM payments WHERE event_id = ?", (event_id,))
-            cursor.execute("DELETE FROM reviews WHERE event_id = ?", (event_id,))
-            # Remove the event itself
-            cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
             conn.commit()
-            # Record audit log
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=None,
-                    action="delete",
-                    object_type="event",
-                    object_id=event_id,
-                    details=None,
-                )
-            except Exception:
-                pass
-        finally:
-            conn.close()
+        # Record audit log (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=None,
+                action="delete",
+                object_type="event",
+                object_id=event_id,
+                details=None,
+            )
+        except Exception:
+            pass
 
     @classmethod
     async def get_event(cls, event_id: int) -> EventRead:
@@ -184,27 +211,13 @@ class EventService:
         iterations this method should include related data (e.g.,
         number of bookings) and enforce authorization rules.
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            row = cursor.execute(
-                "SELECT id, title, description, start_time, duration_minutes, max_participants, is_paid, price FROM events WHERE id = ?",
-                (event_id,),
-            ).fetchone()
+            cursor.row_factory = None
+            row = cursor.execute(_GET_EVENT_SQL, (event_id,)).fetchone()
             if not row:
                 raise ValueError(f"Event {event_id} not found")
-            return EventRead(
-                id=row["id"],
-                title=row["title"],
-                description=row["description"],
-                start_time=row["start_time"],
-                duration_minutes=row["duration_minutes"],
-                max_participants=row["max_participants"],
-                is_paid=bool(row["is_paid"]),
-            )
-        finally:
-            conn.close()
+            return _event_from_values(row)
 
     @classmethod
     async def update_event(cls, event_id: int, updates: dict) -> EventRead:
@@ -212,18 +225,13 @@ class EventService:
 
         Only fields provided in the ``updates`` dict will be set.  If
         the event does not exist, raises ``ValueError``.  Returns the
-        updated event as ``EventRead``.  Use transactions in a real
-        implementation to ensure atomicity.
+        updated event as ``EventRead``.  The update runs in a
+        ``BEGIN IMMEDIATE`` transaction and returns the row itself
+        (``RETURNING``), which also serves as the existence check.
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Validate event exists
-            row = cursor.execute("SELECT id FROM events WHERE id = ?", (event_id,)).fetchone()
-            if not row:
-                raise ValueError(f"Event {event_id} not found")
-            # Build dynamic update
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Build dynamic update; RETURNING yields the updated event (or
+            # nothing if it does not exist) without extra SELECTs
             if updates:
                 fields = []
                 values = []
@@ -235,37 +243,28 @@ class EventService:
                     else:
                         values.append(value)
                 values.append(event_id)
-                sql = f"UPDATE events SET {', '.join(fields)}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-                cursor.execute(sql, tuple(values))
-                conn.commit()
-            # Return updated event
-            event_row = cursor.execute(
-                "SELECT id, title, description, start_time, duration_minutes, max_participants, is_paid, price FROM events WHERE id = ?",
-                (event_id,),
-            ).fetchone()
-            # Record audit log for update
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=None,
-                    action="update",
-                    object_type="event",
-                    object_id=event_id,
-                    details=updates,
+                sql = (
+                    f"UPDATE events SET {', '.join(fields)}, updated_at = CURRENT_TIMESTAMP"
+                    f" WHERE id = ? RETURNING {_EVENT_COLS}"
                 )
-            except Exception:
-                pass
-            return EventRead(
-                id=event_row["id"],
-                title=event_row["title"],
-                description=event_row["description"],
-                start_time=event_row["start_time"],
-                duration_minutes=event_row["duration_minutes"],
-                max_participants=event_row["max_participants"],
-                is_paid=bool(event_row["is_paid"]),
+                event_row = cursor.execute(sql, tuple(values)).fetchone()
+            else:
+                event_row = cursor.execute(_GET_EVENT_SQL, (event_id,)).fetchone()
+            if not event_row:
+                raise ValueError(f"Event {event_id} not found")
+            conn.commit()
+        # Record audit log (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=None,
+                action="update",
+                object_type="event",
+                object_id=event_id,
+                details=updates,
             )
-        finally:
-            conn.close()
+        except Exception:
+            pass
+        return _event_from_values(event_row)
 
     @classmethod
     async def duplicate_event(cls, event_id: int, new_start_time) -> EventRead:
@@ -277,43 +276,20 @@ class EventService:
         if the source event does not exist.  Future versions should
         handle duplication of related data (e.g., pricing options).
         """
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            # Copy the source row in one INSERT ... SELECT; RETURNING yields
+            # the new event, or nothing if the source does not exist
             row = cursor.execute(
-                "SELECT title, description, duration_minutes, max_participants, is_paid, price FROM events WHERE id = ?",
-                (event_id,),
+                f"""
+                INSERT INTO events (title, description, start_time, duration_minutes, max_participants, is_paid, price, created_by)
+                SELECT title, description, ?, duration_minutes, max_participants, is_paid, price, NULL
+                FROM events WHERE id = ?
+                RETURNING {_EVENT_COLS}
+                """,
+                (new_start_time, event_id),
             ).fetchone()
             if not row:
                 raise ValueError(f"Event {event_id} not found")
-            # Insert duplicate with new start time
-            cursor.execute(
-                """
-                INSERT INTO events (title, description, start_time, duration_minutes, max_participants, is_paid, price, created_by)
-                VALUES (?, ?, ?, ?, ?, ?, ?, NULL)
-                """,
-                (
-                    row["title"],
-                    row["description"],
-                    new_start_time,
-                    row["duration_minutes"],
-                    row["max_participants"],
-                    row["is_paid"],
-                    row["price"],
-                ),
-            )
-            new_id = cursor.lastrowid
             conn.commit()
             # Return new event
-            return EventRead(
-                id=new_id,
-                title=row["title"],
-                description=row["description"],
-                start_time=new_start_time,
-                duration_minutes=row["duration_minutes"],
-                max_participants=row["max_participants"],
-                is_paid=bool(row["is_paid"]),
-            )
-        finally:
-            conn.close()
\ No newline at end of file
+            return _event_from_values(row)
\ No newline at end of file
@@ -12,8 +12,9 @@ Only administrators should be allowed to create, update or delete
 FAQ entries; listing and retrieving entries is open to all users.
 
 All queries use parameterized statements to avoid SQL injection
-vulnerabilities.  Returned values are sanitized where appropriate
-before being passed to the API layer.
+vulnerabilities.  Text fields are HTML‑escaped once when an entry is
+written (stored in ``*_escaped`` columns next to the raw text, which
+is kept for editing) and served escaped to the API layer.
 """
 
 from __future__ import annotations
@@ -22,56 +23,146 @@ import json
 import logging
 import sqlite3
 import html
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
 
-from event_planner_api.app.core.db import get_connection
+from event_planner_api.app.core import json_utils
+from event_planner_api.app.core.config import settings
+from event_planner_api.app.core.db import acquire_connection, immediate_transaction
 from event_planner_api.app.schemas.faq import FAQCreate, FAQUpdate, FAQRead
+from event_planner_api.app.services.audit_service import AuditService
+
+
+# Columns read by ``_row_to_faq_read`` (instead of ``SELECT *``); the text
+# fields are the pre-escaped copies.
+_FAQ_COLS = (
+    "id, question_short_escaped, question_full_escaped, answer_escaped,"
+    " attachments, position, created_at, updated_at"
+)
+
+# Every ``list_faqs`` query shape, built once: (sort field, order) -> SQL.
+_LIST_SORT_FIELDS = ("id", "position", "question_short", "created_at")
+_LIST_QUERIES = {
+    (field, order): f"SELECT {_FAQ_COLS} FROM faqs ORDER BY {field} {order} LIMIT ? OFFSET ?"
+    for field in _LIST_SORT_FIELDS
+    for order in ("ASC", "DESC")
+}
+_LIST_DEFAULT_QUERY = f"SELECT {_FAQ_COLS} FROM faqs ORDER BY position ASC, id ASC LIMIT ? OFFSET ?"
+_GET_FAQ_SQL = f"SELECT {_FAQ_COLS} FROM faqs WHERE id = ?"
+
+
+# ---------------------------------------------------------------------------
+# Short‑lived cache of built FAQRead results
+# ---------------------------------------------------------------------------
+
+# Upper bound on cached results; the least recently used entry is evicted.
+FAQ_CACHE_MAX_SIZE = 256
+
+# ("list", query, limit, offset) or ("get", faq_id) -> (time cached, result)
+_faq_cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+_faq_cache_lock = threading.Lock()
+# Bumped on every invalidation so that a read which started before a
+# write cannot store its (stale) result afterwards.
+_faq_cache_generation = 0
+
+
+def _get_cached(key: Tuple) -> Tuple[bool, Any]:
+    ttl = settings.faq_cache_ttl_seconds
+    if ttl <= 0:
+        return False, None
+    with _faq_cache_lock:
+        entry = _faq_cache.get(key)
+        if entry is None:
+            return False, None
+        cached_at, value = entry
+        if time.monotonic() - cached_at > ttl:
+            del _faq_cache[key]
+            return False, None
+        _faq_cache.move_to_end(key)
+        return True, value
+
+
+def _cache(key: Tuple, value: Any, generation: int) -> None:
+    if settings.faq_cache_ttl_seconds <= 0:
+        return
+    with _faq_cache_lock:
+        if generation != _faq_cache_generation:
+            return
+        _faq_cache[key] = (time.monotonic(), value)
+        _faq_cache.move_to_end(key)
+        while len(_faq_cache) > FAQ_CACHE_MAX_SIZE:
+            _faq_cache.popitem(last=False)
+
+
+def bump_faq_cache() -> None:
+    """Drop every cached FAQ result.
+
+    Called after each committed FAQ write so that the next
+    ``list_faqs``/``get_faq`` call reads the table again.
+    """
+    global _faq_cache_generation
+    with _faq_cache_lock:
+        _faq_cache_generation += 1
+        _faq_cache.clear()
 
 
 class FAQService:
     """Service class for managing FAQ entries."""
 
+    @staticmethod
+    def _escape(value: Optional[str]) -> Optional[str]:
+        """HTML-escape ``value`` for the ``*_escaped`` columns (``None`` stays ``None``)."""
+        return html.escape(value) if value is not None else None
+
     @classmethod
     async def create_faq(cls, data: FAQCreate) -> FAQRead:
         """Insert a new FAQ entry and return the created record.
 
         The ``attachments`` field is stored as a JSON string.  The
-        ``position`` field defaults to 0 if not provided.
+        ``position`` field defaults to 0 if not provided.  Text fields
+        are stored both as given and HTML‑escaped.
         """
         logger = logging.getLogger(__name__)
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            attachments_json = json.dumps(data.attachments) if data.attachments is not None else None
-            cursor.execute(
-                """
-                INSERT INTO faqs (question_short, question_full, answer, attachments, position)
-                VALUES (?, ?, ?, ?, ?)
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            attachments_json = json_utils.dumps(data.attachments) if data.attachments is not None else None
+            row = cursor.execute(
+                f"""
+                INSERT INTO faqs (
+                    question_short, question_full, answer, attachments, position,
+                    question_short_escaped, question_full_escaped, answer_escaped
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING {_FAQ_COLS}
                 """,
-                (data.question_short, data.question_full, data.answer, attachments_json, data.position or 0),
-            )
-            faq_id = cursor.lastrowid
+                (
+                    data.question_short,
+                    data.question_full,
+                    data.answer,
+                    attachments_json,
+                    data.position or 0,
+                    cls._escape(data.question_short),
+                    cls._escape(data.question_full),
+                    cls._escape(data.answer),
+                ),
+            ).fetchone()
+            faq_id = row[0]
             conn.commit()
+            bump_faq_cache()
             logger.info("Created FAQ %s", faq_id)
-            # Audit log for FAQ creation
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=None,
-                    action="create",
-                    object_type="faq",
-                    object_id=faq_id,
-                    details={"question_short": data.question_short},
-                )
-            except Exception:
-                pass
-            row = cursor.execute(
-                "SELECT * FROM faqs WHERE id = ?",
-                (faq_id,),
-            ).fetchone()
-            return cls._row_to_faq_read(row)
-        finally:
-            conn.close()
+        # Audit log for FAQ creation (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=None,
+                action="create",
+                object_type="faq",
+                object_id=faq_id,
+                details={"question_short": data.question_short},
+            )
+        except Exception:
+            pass
+        return cls._row_to_faq_read(row)
 
     @classmethod
     async def list_faqs(
@@ -88,37 +179,44 @@ class FAQService:
         ``order`` может быть ``asc`` или ``desc`` (по умолчанию asc для
         ``position`` и ``question_short``).  Некорректные значения
         сортировки игнорируются.
+
+        Результат кэшируется на ``settings.faq_cache_ttl_seconds`` секунд
+        (ключ — итоговый запрос, ``limit`` и ``offset``); любая запись в
+        FAQ через сервис сбрасывает кэш.
         """
-        conn = get_connection()
-        try:
+        if sort_by in _LIST_SORT_FIELDS:
+            sort_order = order.upper() if order and order.lower() in {"asc", "desc"} else ("ASC" if sort_by in {"position", "question_short"} else "DESC")
+            query = _LIST_QUERIES[(sort_by, sort_order)]
+        else:
+            # default sort by position then id
+            query = _LIST_DEFAULT_QUERY
+        key = ("list", query, limit, offset)
+        hit, faqs = _get_cached(key)
+        if hit:
+            return list(faqs)
+        generation = _faq_cache_generation
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            if sort_by in {"id", "position", "question_short", "created_at"}:
-                sort_field = sort_by
-                sort_order = order.upper() if order and order.lower() in {"asc", "desc"} else ("ASC" if sort_by in {"position", "question_short"} else "DESC")
-                query = f"SELECT * FROM faqs ORDER BY {sort_field} {sort_order} LIMIT ? OFFSET ?"
-            else:
-                # default sort by position then id
-                query = "SELECT * FROM faqs ORDER BY position ASC, id ASC LIMIT ? OFFSET ?"
-            rows = cursor.execute(query, (limit, offset)).fetchall()
-            return [cls._row_to_faq_read(row) for row in rows]
-        finally:
-            conn.close()
+            # Plain tuples: ``_row_to_faq_read`` unpacks rows positionally
+            cursor.row_factory = None
+            faqs = [cls._row_to_faq_read(row) for row in cursor.execute(query, (limit, offset))]
+        _cache(key, faqs, generation)
+        return list(faqs)
 
     @classmethod
     async def get_faq(cls, faq_id: int) -> Optional[FAQRead]:
-        """Retrieve a single FAQ entry by its ID."""
-        conn = get_connection()
-        try:
+        """Retrieve a single FAQ entry by its ID (cached like ``list_faqs``)."""
+        key = ("get", faq_id)
+        hit, faq = _get_cached(key)
+        if hit:
+            return faq
+        generation = _faq_cache_generation
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            row = cursor.execute(
-                "SELECT * FROM faqs WHERE id = ?",
-                (faq_id,),
-            ).fetchone()
-            if not row:
-                return None
-            return cls._row_to_faq_read(row)
-        finally:
-            conn.close()
+            row = cursor.execute(_GET_FAQ_SQL, (faq_id,)).fetchone()
+            faq = cls._row_to_faq_read(row) if row else None
+        _cache(key, faq, generation)
+        return faq
 
     @classmethod
     async def update_faq(cls, faq_id: int, data: FAQUpdate) -> Optional[FAQRead]:
@@ -128,56 +226,56 @@ class FAQService:
         the updated FAQ or ``None`` if the record does not exist.
         """
         logger = logging.getLogger(__name__)
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            # Fetch current record
-            row = cursor.execute("SELECT * FROM faqs WHERE id = ?", (faq_id,)).fetchone()
-            if not row:
-                return None
-            current = dict(row)
-            new_question_short = data.question_short if data.question_short is not None else current["question_short"]
-            new_question_full = data.question_full if data.question_full is not None else current["question_full"]
-            new_answer = data.answer if data.answer is not None else current["answer"]
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             # attachments: if provided, convert to JSON; else keep existing text
-            if data.attachments is not None:
-                new_attachments = json.dumps(data.attachments)
-            else:
-                new_attachments = current["attachments"]
-            new_position = data.position if data.position is not None else current["position"]
-            cursor.execute(
-                """
+            new_attachments = json_utils.dumps(data.attachments) if data.attachments is not None else None
+            # ``None`` keeps the stored value (COALESCE), so no read of the
+            # current record is needed; RETURNING yields the updated row, or
+            # nothing if the record does not exist.
+            row = cursor.execute(
+                f"""
                 UPDATE faqs
-                SET question_short = ?, question_full = ?, answer = ?, attachments = ?, position = ?, updated_at = CURRENT_TIMESTAMP
+                SET question_short = COALESCE(?, question_short),
+                    question_full = COALESCE(?, question_full),
+                    answer = COALESCE(?, answer),
+                    attachments = COALESCE(?, attachments),
+                    position = COALESCE(?, position),
+                    question_short_escaped = COALESCE(?, question_short_escaped),
+                    question_full_escaped = COALESCE(?, question_full_escaped),
+                    answer_escaped = COALESCE(?, answer_escaped),
+                    updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
+                RETURNING {_FAQ_COLS}
                 """,
                 (
-                    new_question_short,
-                    new_question_full,
-                    new_answer,
+                    data.question_short,
+                    data.question_full,
+                    data.answer,
                     new_attachments,
-                    new_position,
+                    data.position,
+                    cls._escape(data.question_short),
+                    cls._escape(data.question_full),
+                    cls._escape(data.answer),
                     faq_id,
                 ),
-            )
+            ).fetchone()
+            if not row:
+                return None
             conn.commit()
+            bump_faq_cache()
             logger.info("Updated FAQ %s", faq_id)
-            # Audit log for FAQ update
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=None,
-                    action="update",
-                    object_type="faq",
-                    object_id=faq_id,
-                    details={k: v for k, v in data.dict(exclude_unset=True).items()},
-                )
-            except Exception:
-                pass
-            row = cursor.execute("SELECT * FROM faqs WHERE id = ?", (faq_id,)).fetchone()
-            return cls._row_to_faq_read(row)
-        finally:
-            conn.close()
+        # Audit log for FAQ update (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=None,
+                action="update",
+                object_type="faq",
+                object_id=faq_id,
+                details={k: v for k, v in data.dict(exclude_unset=True).items()},
+            )
+        except Exception:
+            pass
+        return cls._row_to_faq_read(row)
 
     @classmethod
     async def delete_faq(cls, faq_id: int) -> bool:
@@ -186,51 +284,52 @@ class FAQService:
         Returns ``True`` if a record was deleted, ``False`` otherwise.
         """
         logger = logging.getLogger(__name__)
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             cursor.execute("DELETE FROM faqs WHERE id = ?", (faq_id,))
             affected = cursor.rowcount
             conn.commit()
-            if affected:
-                logger.info("Deleted FAQ %s", faq_id)
-                # Audit log for deletion
-                try:
-                    from event_planner_api.app.services.audit_service import AuditService
-                    await AuditService.log(
-                        user_id=None,
-                        action="delete",
-                        object_type="faq",
-                        object_id=faq_id,
-                        details=None,
-                    )
-                except Exception:
-                    pass
-            return affected > 0
-        finally:
-            conn.close()
+        if affected:
+            bump_faq_cache()
+            logger.info("Deleted FAQ %s", faq_id)
+            # Audit log for deletion (queued) once the writer connection is released
+            try:
+                await AuditService.log(
+                    user_id=None,
+                    action="delete",
+                    object_type="faq",
+                    object_id=faq_id,
+                    details=None,
+                )
+            except Exception:
+                pass
+        return affected > 0
 
     @staticmethod
     def _row_to_faq_read(row: sqlite3.Row) -> FAQRead:
-        """Convert a database row to an FAQRead schema instance."""
+        """Convert a database row to an FAQRead schema instance.
+
+        ``row`` holds the ``_FAQ_COLS`` columns in order (a
+        ``sqlite3.Row`` or a plain tuple).  Stored rows are trusted, so
+        the model is built with ``model_construct`` (no validation).
+        """
+        id_, question_short, question_full, answer, attachments_json, position, created_at, updated_at = row
         attachments = None
-        # row["attachments"] may be stored as JSON text or None
-        if row["attachments"]:
+        # attachments may be stored as JSON text or None (orjson decodes
+        # it when installed, see ``json_utils``)
+        if attachments_json:
             try:
-                attachments = json.loads(row["attachments"])
+                attachments = json_utils.loads(attachments_json)
             except (TypeError, json.JSONDecodeError):
                 attachments = None
-        # Escape text fields to prevent XSS when rendering in clients
-        question_short = html.escape(row["question_short"]) if row["question_short"] is not None else None
-        question_full = html.escape(row["question_full"]) if row["question_full"] is not None else None
-        answer = html.escape(row["answer"]) if row["answer"] is not None else None
-        return FAQRead(
-            id=row["id"],
+        # Text fields were escaped at write time to prevent XSS when
+        # rendering in clients
+        return FAQRead.model_construct(
+            id=id_,
             question_short=question_short,
             question_full=question_full,
             answer=answer,
             attachments=attachments,
-            position=row["position"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            position=position,
+            created_at=created_at,
+            updated_at=updated_at,
         )
\ No newline at end of file
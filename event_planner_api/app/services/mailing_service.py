@@ -9,12 +9,85 @@ abstracted away; this service focuses on selecting recipients and
 recording logs.
 """
 
-import json
 import logging
+import sqlite3
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
+from ..core import json_utils
+from ..core.db import acquire_connection, immediate_transaction
 from ..schemas.mailing import MailingCreate, MailingRead, MailingLogRead, MailingUpdate
+from .audit_service import AuditService
+
+
+_MAILING_COLS = "id, created_by, title, content, filters, scheduled_at, created_at, messengers"
+_LOG_COLS = "id, mailing_id, user_id, status, error_message, sent_at"
+
+_INSERT_LOG_SQL = """
+    INSERT INTO mailing_logs (mailing_id, user_id, status, error_message, sent_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Sort keys accepted by ``list_mailings``.  ``scheduled_at`` may be NULL and a
+# NULL never satisfies a row-value comparison, so it is sorted as ''.  That
+# keeps the order unchanged (NULL and '' both sort before any timestamp) and
+# lets unscheduled mailings be paged through like the rest.
+_MAILING_SORT_KEYS = {
+    "created_at": "created_at",
+    "scheduled_at": "IFNULL(scheduled_at, '')",
+}
+
+
+def _mailing_from_values(values: tuple) -> MailingRead:
+    """Build a ``MailingRead`` from a plain row tuple of ``_MAILING_COLS``.
+
+    The row comes from our own table, so the model is built without
+    validation; only the JSON columns are decoded, and only when they are
+    set (most mailings have no filters or messengers).
+    """
+    mailing_id, created_by, title, content, filters, scheduled_at, created_at, messengers = values
+    return MailingRead.model_construct(
+        id=mailing_id,
+        created_by=created_by,
+        title=title,
+        content=content,
+        filters=json_utils.loads(filters) if filters else None,
+        scheduled_at=scheduled_at,
+        created_at=created_at,
+        messengers=json_utils.loads(messengers) if messengers else None,
+    )
+
+
+def _log_from_values(values: tuple) -> MailingLogRead:
+    """Build a ``MailingLogRead`` from a plain row tuple of ``_LOG_COLS``."""
+    log_id, mailing_id, user_id, status, error_message, sent_at = values
+    return MailingLogRead.model_construct(
+        id=log_id,
+        mailing_id=mailing_id,
+        user_id=user_id,
+        status=status,
+        error_message=error_message,
+        sent_at=sent_at,
+    )
+
+
+# Booking filters understood by ``_select_recipients``, in bit order
+_RECIPIENT_FILTERS = ("event_id = ?", "is_paid = ?", "is_attended = ?")
+
+
+@lru_cache(maxsize=None)
+def _build_recipients_query(mask: int) -> str:
+    """SQL selecting recipients for the set of filters in ``mask``.
+
+    Bit ``i`` of ``mask`` enables ``_RECIPIENT_FILTERS[i]``; there are only
+    eight combinations, so each statement is built once.
+    """
+    clauses = [clause for bit, clause in enumerate(_RECIPIENT_FILTERS) if mask & (1 << bit)]
+    query = "SELECT DISTINCT user_id FROM bookings"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    return query
 
 
 class MailingService:
@@ -36,15 +109,12 @@ class MailingService:
         # Only admin (role_id == 1)
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can create mailings")
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
-            filters_json = json.dumps(data.filters) if data.filters is not None else None
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
+            filters_json = json_utils.dumps(data.filters) if data.filters is not None else None
             scheduled_at_iso = data.scheduled_at.isoformat() if data.scheduled_at else None
             # Persist the messenger list as JSON.  If no messengers were provided
             # (None), leave the column null to indicate no tasks should be created.
-            messengers_json = json.dumps(data.messengers) if data.messengers is not None else None
+            messengers_json = json_utils.dumps(data.messengers) if data.messengers is not None else None
             cursor.execute(
                 """
                 INSERT INTO mailings (created_by, title, content, filters, scheduled_at, messengers)
@@ -65,50 +135,47 @@ class MailingService:
                 "SELECT id, created_by, title, content, filters, scheduled_at, created_at, messengers FROM mailings WHERE id = ?",
                 (mailing_id,),
             ).fetchone()
-            logger.info(
-                "Admin %s created mailing %s",
-                current_user.get("user_id"),
-                mailing_id,
+        logger.info(
+            "Admin %s created mailing %s",
+            current_user.get("user_id"),
+            mailing_id,
+        )
+        # Audit log for mailing creation (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=current_user.get("user_id"),
+                action="create",
+                object_type="mailing",
+                object_id=row["id"],
+                details={"title": data.title},
             )
-            # Audit log for mailing creation
+        except Exception:
+            pass
+
+        # If messenger channels are provided, create scheduled tasks for each messenger.
+        # This ensures bots will be notified when the scheduled time arrives.
+        if data.messengers:
             try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=current_user.get("user_id"),
-                    action="create",
-                    object_type="mailing",
-                    object_id=row["id"],
-                    details={"title": data.title},
+                from event_planner_api.app.services.task_service import TaskService
+                # Use the provided scheduled_at value or None if absent.  TaskService will
+                # treat None as immediate availability.
+                await TaskService.create_tasks_for_mailing(
+                    mailing_id=row["id"],
+                    messengers=data.messengers,
+                    scheduled_at=row["scheduled_at"],
                 )
-            except Exception:
-                pass
-
-            # If messenger channels are provided, create scheduled tasks for each messenger.
-            # This ensures bots will be notified when the scheduled time arrives.
-            if data.messengers:
-                try:
-                    from event_planner_api.app.services.task_service import TaskService
-                    # Use the provided scheduled_at value or None if absent.  TaskService will
-                    # treat None as immediate availability.
-                    await TaskService.create_tasks_for_mailing(
-                        mailing_id=row["id"],
-                        messengers=data.messengers,
-                        scheduled_at=row["scheduled_at"],
-                    )
-                except Exception as e:
-                    logger.error("Failed to create tasks for mailing %s: %s", mailing_id, e)
-            return MailingRead(
-                id=row["id"],
-                created_by=row["created_by"],
-                title=row["title"],
-                content=row["content"],
-                filters=json.loads(row["filters"]) if row["filters"] else None,
-                scheduled_at=row["scheduled_at"],
-                created_at=row["created_at"],
-                messengers=json.loads(row["messengers"]) if row["messengers"] else None,
-            )
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error("Failed to create tasks for mailing %s: %s", mailing_id, e)
+        return MailingRead(
+            id=row["id"],
+            created_by=row["created_by"],
+            title=row["title"],
+            content=row["content"],
+            filters=json_utils.loads(row["filters"]) if row["filters"] else None,
+            scheduled_at=row["scheduled_at"],
+            created_at=row["created_at"],
+            messengers=json_utils.loads(row["messengers"]) if row["messengers"] else None,
+        )
 
     @classmethod
     async def list_mailings(
@@ -118,44 +185,46 @@ class MailingService:
         offset: int = 0,
         sort_by: str | None = None,
         order: str | None = None,
+        after_id: int | None = None,
     ) -> List[MailingRead]:
         """List mailings with sorting and pagination.
 
         Only administrators may list mailings.  Поддерживает
         сортировку по ``created_at`` (по умолчанию) и ``scheduled_at``,
         а также направление ``asc``/``desc``.
+
+        Для постраничного вывода передайте ``after_id`` — идентификатор
+        последней рассылки предыдущей страницы (с теми же ``sort_by`` и
+        ``order``).  Страница тогда начинается сразу после этой строки
+        (keyset-пагинация по индексу), и ``offset`` игнорируется.
+        ``offset`` оставлен для старых клиентов: SQLite пропускает
+        ``offset`` строк при каждом запросе.
         """
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can view mailings")
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            sort_field = sort_by if sort_by in {"created_at", "scheduled_at"} else "created_at"
+            sort_key = _MAILING_SORT_KEYS.get(sort_by, "created_at")
             sort_order = order.upper() if order and order.lower() in {"asc", "desc"} else "DESC"
-            query = (
-                "SELECT id, created_by, title, content, filters, scheduled_at, created_at, messengers "
-                "FROM mailings "
-                f"ORDER BY {sort_field} {sort_order} LIMIT ? OFFSET ?"
-            )
-            rows = cursor.execute(query, (limit, offset)).fetchall()
-            results: List[MailingRead] = []
-            for row in rows:
-                results.append(
-                    MailingRead(
-                        id=row["id"],
-                        created_by=row["created_by"],
-                        title=row["title"],
-                        content=row["content"],
-                        filters=json.loads(row["filters"]) if row["filters"] else None,
-                        scheduled_at=row["scheduled_at"],
-                        created_at=row["created_at"],
-                        messengers=json.loads(row["messengers"]) if row["messengers"] else None,
-                    )
+            # ``id`` breaks ties between equal timestamps so that every row
+            # has a unique position to continue from
+            order_clause = f"ORDER BY {sort_key} {sort_order}, id {sort_order}"
+            if after_id is None:
+                query = f"SELECT {_MAILING_COLS} FROM mailings {order_clause} LIMIT ? OFFSET ?"
+                params: tuple = (limit, offset)
+            else:
+                # The sort key of the last row seen is read by primary key in
+                # the same statement; an unknown ``after_id`` yields an empty page
+                op = "<" if sort_order == "DESC" else ">"
+                query = (
+                    f"SELECT {_MAILING_COLS} FROM mailings WHERE ({sort_key}, id) {op} "
+                    f"(SELECT {sort_key}, id FROM mailings WHERE id = ?) "
+                    f"{order_clause} LIMIT ?"
                 )
-            return results
-        finally:
-            conn.close()
+                params = (after_id, limit)
+            # Plain tuples: columns are unpacked by position
+            cursor.row_factory = None
+            return [_mailing_from_values(row) for row in cursor.execute(query, params)]
 
     @classmethod
     async def delete_mailing(cls, mailing_id: int, current_user: dict) -> None:
@@ -167,10 +236,7 @@ class MailingService:
         """
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can delete mailings")
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             row = cursor.execute("SELECT id FROM mailings WHERE id = ?", (mailing_id,)).fetchone()
             if not row:
                 raise ValueError(f"Mailing {mailing_id} not found")
@@ -183,20 +249,17 @@ class MailingService:
             )
             cursor.execute("DELETE FROM mailings WHERE id = ?", (mailing_id,))
             conn.commit()
-            # Audit log for deletion
-            try:
-                from event_planner_api.app.services.audit_service import AuditService
-                await AuditService.log(
-                    user_id=current_user.get("user_id"),
-                    action="delete",
-                    object_type="mailing",
-                    object_id=mailing_id,
-                    details=None,
-                )
-            except Exception:
-                pass
-        finally:
-            conn.close()
+        # Audit log for deletion (queued) once the writer connection is released
+        try:
+            await AuditService.log(
+                user_id=current_user.get("user_id"),
+                action="delete",
+                object_type="mailing",
+                object_id=mailing_id,
+                details=None,
+            )
+        except Exception:
+            pass
 
     @classmethod
     async def get_mailing(
@@ -210,28 +273,16 @@ class MailingService:
         """
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can view mailing details")
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             row = cursor.execute(
-                "SELECT id, created_by, title, content, filters, scheduled_at, created_at, messengers FROM mailings WHERE id = ?",
+                f"SELECT {_MAILING_COLS} FROM mailings WHERE id = ?",
                 (mailing_id,),
             ).fetchone()
-            if not row:
-                raise ValueError(f"Mailing {mailing_id} not found")
-            return MailingRead(
-                id=row["id"],
-                created_by=row["created_by"],
-                title=row["title"],
-                content=row["content"],
-                filters=json.loads(row["filters"]) if row["filters"] else None,
-                scheduled_at=row["scheduled_at"],
-                created_at=row["created_at"],
-                messengers=json.loads(row["messengers"]) if row["messengers"] else None,
-            )
-        finally:
-            conn.close()
+        if not row:
+            raise ValueError(f"Mailing {mailing_id} not found")
+        return _mailing_from_values(row)
 
     @classmethod
     def _select_recipients(
@@ -249,34 +300,27 @@ class MailingService:
 
         If no filters are provided, all users are selected.
         """
-        # If no filters, select all distinct user IDs
+        # If no filters, select all enabled users
         if not filters:
-            rows = cursor.execute(
-                "SELECT id FROM users WHERE disabled = 0",
-            ).fetchall()
-            return [row["id"] for row in rows]
+            query = "SELECT id FROM users WHERE disabled = 0"
+            return [row[0] for row in cursor.execute(query)]
         event_id = filters.get("event_id")
         is_paid = filters.get("is_paid")
         is_attended = filters.get("is_attended")
-        user_ids: List[int] = []
-        # Start building query
-        query = "SELECT DISTINCT user_id FROM bookings"
-        clauses = []
+        mask = 0
         params: List[Any] = []
         if event_id is not None:
-            clauses.append("event_id = ?")
+            mask |= 1
             params.append(event_id)
         if is_paid is not None:
-            clauses.append("is_paid = ?")
+            mask |= 2
             params.append(1 if is_paid else 0)
         if is_attended is not None:
-            clauses.append("is_attended = ?")
+            mask |= 4
             params.append(1 if is_attended else 0)
-        if clauses:
-            query += " WHERE " + " AND ".join(clauses)
-        rows = cursor.execute(query, tuple(params)).fetchall()
-        user_ids = [row["user_id"] for row in rows]
-        return user_ids
+        # Only the first column is read, so the rows are indexed by position
+        # (this works for both plain tuples and ``sqlite3.Row``)
+        return [row[0] for row in cursor.execute(_build_recipients_query(mask), params)]
 
     @classmethod
     async def send_mailing(
@@ -293,11 +337,7 @@ class MailingService:
         """
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can send mailings")
-        from event_planner_api.app.core.db import get_connection
-        from event_planner_api.app.services.message_service import MessageService
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             # Load mailing
             row = cursor.execute(
                 "SELECT id, filters, content FROM mailings WHERE id = ?",
@@ -307,38 +347,35 @@ class MailingService:
                 raise ValueError(f"Mailing {mailing_id} not found")
             filters_json = row["filters"]
             content = row["content"]
-            filters = json.loads(filters_json) if filters_json else None
+            filters = json_utils.loads(filters_json) if filters_json else None
             # Select recipients
             user_ids = cls._select_recipients(cursor, filters)
             if not user_ids:
                 return 0
-            # Insert log entries
-            sent_count = 0
+            # Insert log entries.  Here you would send the actual message via
+            # bot/email; for this MVP we just record the log, all rows in one
+            # executemany and one commit.
             now = datetime.utcnow().isoformat()
-            for uid in user_ids:
-                try:
-                    # Here you would send the actual message via bot/email
-                    # For this MVP we just record the log.
-                    cursor.execute(
-                        """
-                        INSERT INTO mailing_logs (mailing_id, user_id, status, error_message, sent_at)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (mailing_id, uid, "sent", None, now),
-                    )
-                    sent_count += 1
-                except Exception as e:
-                    cursor.execute(
-                        "INSERT INTO mailing_logs (mailing_id, user_id, status, error_message, sent_at) VALUES (?, ?, ?, ?, ?)",
-                        (mailing_id, uid, "failed", str(e), now),
-                    )
+            rows = [(mailing_id, uid, "sent", None, now) for uid in user_ids]
+            try:
+                cursor.executemany(_INSERT_LOG_SQL, rows)
+                sent_count = len(rows)
+            except sqlite3.Error:
+                # One bad row must not discard the whole batch: retry row by
+                # row and record the failures instead.
+                conn.rollback()
+                sent_count = 0
+                for log_row in rows:
+                    try:
+                        cursor.execute(_INSERT_LOG_SQL, log_row)
+                        sent_count += 1
+                    except Exception as e:
+                        cursor.execute(_INSERT_LOG_SQL, (mailing_id, log_row[1], "failed", str(e), now))
             conn.commit()
             logging.getLogger(__name__).info(
                 "Mailing %s sent to %s recipients", mailing_id, sent_count
             )
             return sent_count
-        finally:
-            conn.close()
 
     @classmethod
     async def list_logs(
@@ -347,43 +384,48 @@ class MailingService:
         current_user: dict,
         limit: int = 50,
         offset: int = 0,
+        after_id: int | None = None,
     ) -> List[MailingLogRead]:
         """List logs for a given mailing.
 
         Only administrators may view logs.  Results are ordered by
-        sent_at descending.
+        sent_at descending (then by id).  Pass the ``id`` of the last log
+        entry received as ``after_id`` to fetch the next page with an
+        index seek; ``offset`` is only used when ``after_id`` is omitted.
+        An ``after_id`` that is not a log entry of this mailing yields an
+        empty page.
         """
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can view mailing logs")
-        from event_planner_api.app.core.db import get_connection
-        conn = get_connection()
-        try:
+        with acquire_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            rows = cursor.execute(
-                """
-                SELECT id, mailing_id, user_id, status, error_message, sent_at
-                FROM mailing_logs
-                WHERE mailing_id = ?
-                ORDER BY sent_at DESC
-                LIMIT ? OFFSET ?
-                """,
-                (mailing_id, limit, offset),
-            ).fetchall()
-            results: List[MailingLogRead] = []
-            for row in rows:
-                results.append(
-                    MailingLogRead(
-                        id=row["id"],
-                        mailing_id=row["mailing_id"],
-                        user_id=row["user_id"],
-                        status=row["status"],
-                        error_message=row["error_message"],
-                        sent_at=row["sent_at"],
-                    )
-                )
-            return results
-        finally:
-            conn.close()
+            cursor.row_factory = None
+            if after_id is None:
+                rows = cursor.execute(
+                    f"""
+                    SELECT {_LOG_COLS}
+                    FROM mailing_logs
+                    WHERE mailing_id = ?
+                    ORDER BY sent_at DESC, id DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    (mailing_id, limit, offset),
+                ).fetchall()
+            else:
+                rows = cursor.execute(
+                    f"""
+                    SELECT {_LOG_COLS}
+                    FROM mailing_logs
+                    WHERE mailing_id = ?
+                      AND (sent_at, id) < (
+                          SELECT sent_at, id FROM mailing_logs WHERE id = ? AND mailing_id = ?
+                      )
+                    ORDER BY sent_at DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (mailing_id, after_id, mailing_id, limit),
+                ).fetchall()
+        return [_log_from_values(row) for row in rows]
 
     @classmethod
     async def update_mailing(
@@ -407,14 +449,11 @@ class MailingService:
             If the mailing does not exist or the user does not have
             permission to update it.
         """
-        from event_planner_api.app.core.db import get_connection
         from event_planner_api.app.services.task_service import TaskService
         # Ensure only super administrators can update
         if current_user.get("role_id") != 1:
             raise ValueError("Only administrators can update mailings")
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with acquire_connection() as conn, immediate_transaction(conn) as cursor:
             # Ensure the mailing exists and capture its current values
             row = cursor.execute(
                 "SELECT id, messengers, scheduled_at FROM mailings WHERE id = ?",
@@ -435,7 +474,7 @@ class MailingService:
             # Filters
             if data.filters is not None:
                 update_fields.append("filters = ?")
-                params.append(json.dumps(data.filters))
+                params.append(json_utils.dumps(data.filters))
             # Scheduled at
             if data.scheduled_at is not None:
                 update_fields.append("scheduled_at = ?")
@@ -443,37 +482,38 @@ class MailingService:
             # Messengers
             if data.messengers is not None:
                 update_fields.append("messengers = ?")
-                params.append(json.dumps(data.messengers))
+                params.append(json_utils.dumps(data.messengers))
             # Perform update if there are fields to change
             if update_fields:
                 query = f"UPDATE mailings SET {', '.join(update_fields)} WHERE id = ?"
                 params.append(mailing_id)
                 cursor.execute(query, tuple(params))
-                conn.commit()
             # Determine if tasks need to be updated.  If messengers or scheduled_at
             # were supplied, or if the existing messengers list is null and the
             # new schedule/time should change tasks, we recreate tasks.
-            if data.messengers is not None or data.scheduled_at is not None:
-                # Remove existing tasks for this mailing
+            recreate_tasks = data.messengers is not None or data.scheduled_at is not None
+            if recreate_tasks:
+                # Remove existing tasks for this mailing (same transaction as
+                # the update above)
                 cursor.execute(
                     "DELETE FROM tasks WHERE type = 'mailing' AND object_id = ?",
                     (mailing_id,),
                 )
-                conn.commit()
-                # Recreate tasks only if a messenger list is provided and not empty
-                if data.messengers:
-                    # Determine the schedule to use: prefer the newly provided
-                    # scheduled_at, otherwise the previously stored value (may be None)
-                    schedule_for_tasks = (
-                        data.scheduled_at.isoformat() if data.scheduled_at else row["scheduled_at"]
-                    )
-                    # Create new tasks asynchronously
-                    await TaskService.create_tasks_for_mailing(
-                        mailing_id=mailing_id,
-                        messengers=data.messengers,
-                        scheduled_at=schedule_for_tasks,
-                    )
-            # Return the updated mailing
-            return await cls.get_mailing(mailing_id, current_user)
-        finally:
-            conn.close()
+            conn.commit()
+        # Recreate tasks only if a messenger list is provided and not empty;
+        # TaskService uses its own connection, so this runs after ours is
+        # released
+        if recreate_tasks and data.messengers:
+            # Determine the schedule to use: prefer the newly provided
+            # scheduled_at, otherwise the previously stored value (may be None)
+            schedule_for_tasks = (
+                data.scheduled_at.isoformat() if data.scheduled_at else row["scheduled_at"]
+            )
+            # Create new tasks asynchronously
+            await TaskService.create_tasks_for_mailing(
+                mailing_id=mailing_id,
+                messengers=data.messengers,
+                scheduled_at=schedule_for_tasks,
+            )
+        # Return the updated mailing
+        return await cls.get_mailing(mailing_id, current_user)
@@ -14,6 +14,8 @@ import logging
 from typing import List, Dict, Any
 
 from event_planner_api.app.core.db import get_connection
+from event_planner_api.app.core.security import bump_user_cache
+from event_planner_api.app.schemas.user import UserRead
 
 
 class RoleService:
@@ -101,8 +103,14 @@ class RoleService:
             conn.close()
 
     @classmethod
-    async def assign_role(cls, user_id: int, role_id: int) -> None:
-        """Assign a role to a user."""
+    async def assign_role(cls, user_id: int, role_id: int) -> UserRead:
+        """Assign a role to a user.
+
+        Returns the updated user so callers (e.g. ``PUT /users/{id}``)
+        do not need a separate lookup.  The role itself is not part of
+        ``UserRead``, so the row fetched for the existence check is
+        already up to date after the UPDATE.
+        """
         logger = logging.getLogger(__name__)
         conn = get_connection()
         try:
@@ -112,11 +120,20 @@ class RoleService:
             if not role_row:
                 raise ValueError(f"Role {role_id} does not exist")
             # Ensure user exists
-            user_row = cursor.execute("SELECT id FROM users WHERE id = ?", (user_id,)).fetchone()
+            user_row = cursor.execute(
+                "SELECT id, email, full_name, disabled FROM users WHERE id = ?", (user_id,)
+            ).fetchone()
             if not user_row:
                 raise ValueError(f"User {user_id} does not exist")
             cursor.execute("UPDATE users SET role_id = ? WHERE id = ?", (role_id, user_id))
             conn.commit()
             logger.info("Assigned role %s to user %s", role_id, user_id)
+            bump_user_cache(user_row["email"])
+            return UserRead(
+                id=user_row["id"],
+                email=user_row["email"],
+                full_name=user_row["full_name"],
+                disabled=bool(user_row["disabled"]),
+            )
         finally:
             conn.close()
\ No newline at end of file
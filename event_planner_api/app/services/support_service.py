@@ -5,8 +5,10 @@ This module implements the support workflow: creating tickets,
 listing tickets, reading ticket details with messages, replying to
 tickets and updating ticket status.  It uses SQLite via the
 ``get_connection`` helper and includes basic role‑based access
-control.  All user‑supplied content is escaped on output to prevent
-cross‑site scripting when consumed by clients.
+control.  All user‑supplied message content is HTML‑escaped once when
+it is written (stored in ``content_escaped`` next to the raw
+``content``) and served escaped to prevent cross‑site scripting when
+consumed by clients.
 
 The service relies on the current user's ID and role, which
 should be provided by the authentication layer.  It logs all
@@ -69,10 +71,10 @@ class SupportService:
             # First message does not use attachments
             cursor.execute(
                 """
-                INSERT INTO support_messages (user_id, admin_id, content, ticket_id, sender_role, attachments)
-                VALUES (?, NULL, ?, ?, 'user', NULL)
+                INSERT INTO support_messages (user_id, admin_id, content, content_escaped, ticket_id, sender_role, attachments)
+                VALUES (?, NULL, ?, ?, ?, 'user', NULL)
                 """,
-                (current_user.get("user_id"), data.content, ticket_id),
+                (current_user.get("user_id"), data.content, html.escape(data.content), ticket_id),
             )
             conn.commit()
             logger.info(
@@ -281,7 +283,7 @@ class SupportService:
             # Fetch messages
             msg_rows = cursor.execute(
                 """
-                SELECT id, ticket_id, user_id, admin_id, content, created_at, sender_role, attachments
+                SELECT id, ticket_id, user_id, admin_id, content, content_escaped, created_at, sender_role, attachments
                 FROM support_messages
                 WHERE ticket_id = ?
                 ORDER BY created_at ASC
@@ -290,8 +292,11 @@ class SupportService:
             ).fetchall()
             messages: List[SupportMessageRead] = []
             for mr in msg_rows:
-                # Escape content for safety
-                safe_content = html.escape(mr["content"]) if mr["content"] is not None else None
+                # Content is escaped at write time; rows without the escaped
+                # copy (written outside SupportService) are escaped here.
+                safe_content = mr["content_escaped"]
+                if safe_content is None and mr["content"] is not None:
+                    safe_content = html.escape(mr["content"])
                 # Deserialize attachments
                 attachments = None
                 if mr["attachments"]:
@@ -334,8 +339,8 @@ class SupportService:
         Determines the sender role (user or admin) based on the current
         user and ensures they have permission to reply to the ticket.
         The ticket's ``updated_at`` timestamp is refreshed.  The
-        content is stored as provided but will be escaped upon
-        retrieval.
+        content is stored as provided together with its HTML‑escaped
+        copy, which is what the API returns.
 
         Parameters
         ----------
@@ -393,10 +398,18 @@ class SupportService:
                 attachments_json = _json.dumps(data.attachments)
             cursor.execute(
                 """
-                INSERT INTO support_messages (user_id, admin_id, content, ticket_id, sender_role, attachments)
-                VALUES (?, ?, ?, ?, ?, ?)
+                INSERT INTO support_messages (user_id, admin_id, content, content_escaped, ticket_id, sender_role, attachments)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                (user_id_insert, admin_id_insert, data.content, ticket_id, sender_role, attachments_json),
+                (
+                    user_id_insert,
+                    admin_id_insert,
+                    data.content,
+                    html.escape(data.content),
+                    ticket_id,
+                    sender_role,
+                    attachments_json,
+                ),
             )
             message_id = cursor.lastrowid
             # Update ticket's updated_at timestamp
@@ -407,10 +420,10 @@ class SupportService:
             conn.commit()
             # Fetch created message row
             msg_row = cursor.execute(
-                "SELECT id, ticket_id, user_id, admin_id, content, created_at, sender_role, attachments FROM support_messages WHERE id = ?",
+                "SELECT id, ticket_id, user_id, admin_id, content_escaped, created_at, sender_role, attachments FROM support_messages WHERE id = ?",
                 (message_id,),
             ).fetchone()
-            safe_content = html.escape(msg_row["content"])
+            safe_content = msg_row["content_escaped"]
             logger.info(
                 "User %s replied to ticket %s as %s",
                 current_user.get("user_id"),
@@ -469,7 +482,7 @@ class SupportService:
         """Update the status of a support ticket.
 
         Only administrators (role_id == 1) may change the status.
-        Supported statuses should be validated at the endpoint level.
+        The status value itself is validated by ``SupportTicketUpdate``.
 
         Parameters
         ----------
@@ -26,9 +26,16 @@ from event_planner_api.app.core.db import get_connection
 class TaskService:
     """Service for creating, listing and completing tasks for bots."""
 
-    @staticmethod
-    def _ensure_table_exists(cursor: sqlite3.Cursor) -> None:
+    # Set once the tasks table is known to exist.  Migration 9 creates it at
+    # startup, so the DDL below normally never runs more than once per
+    # process instead of on every call.
+    _table_checked: bool = False
+
+    @classmethod
+    def _ensure_table_exists(cls, cursor: sqlite3.Cursor) -> None:
         """Ensure that the tasks table exists.  Creates it if missing."""
+        if cls._table_checked:
+            return
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS tasks (
@@ -43,6 +50,7 @@ class TaskService:
             )
             """
         )
+        cls._table_checked = True
 
     # ------------------------------------------------------------------
     # Task creation methods
@@ -118,17 +126,45 @@ class TaskService:
             ISO string for when to deliver the notification.  If None,
             the task is available immediately.
         """
-        if not messengers:
+        await cls.create_waitlist_tasks_bulk([entry_id], messengers, scheduled_at)
+
+    @classmethod
+    async def create_waitlist_tasks_bulk(
+        cls,
+        entry_ids: List[int],
+        messengers: list[str],
+        scheduled_at: Optional[str] = None,
+    ) -> None:
+        """Create notification tasks for several waitlist entries at once.
+
+        Same as :meth:`create_waitlist_tasks` for every entry in
+        ``entry_ids``, but all ``entries × messengers`` tasks are inserted
+        with one ``executemany`` and a single commit.
+
+        Parameters
+        ----------
+        entry_ids : List[int]
+            Identifiers of the waitlist entries to notify.
+        messengers : list[str]
+            List of messenger codes (e.g. ['telegram','vk','max']).
+        scheduled_at : Optional[str], optional
+            ISO string for when to deliver the notifications.  If None,
+            the tasks are available immediately.
+        """
+        if not entry_ids or not messengers:
             return
         conn = get_connection()
         try:
             cursor = conn.cursor()
             cls._ensure_table_exists(cursor)
-            for messenger in messengers:
-                cursor.execute(
-                    "INSERT INTO tasks (type, object_id, messenger, scheduled_at, status) VALUES (?, ?, ?, ?, 'pending')",
-                    ("waitlist", entry_id, messenger, scheduled_at),
-                )
+            cursor.executemany(
+                "INSERT INTO tasks (type, object_id, messenger, scheduled_at, status) VALUES (?, ?, ?, ?, 'pending')",
+                [
+                    ("waitlist", entry_id, messenger, scheduled_at)
+                    for entry_id in entry_ids
+                    for messenger in messengers
+                ],
+            )
             conn.commit()
         finally:
             conn.close()
@@ -268,8 +304,6 @@ class TaskService:
                         TaskRead(
                             id=row["id"],
                             type=task_type,
-                            title=None,
-                            description=None,
                             scheduled_at=scheduled_dt,
                         )
                     )
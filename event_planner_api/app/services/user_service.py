@@ -188,6 +188,9 @@ class UserService:
                 "SELECT id, email, full_name, disabled FROM users WHERE id = ?",
                 (user_id,),
             ).fetchone()
+            # ``disabled`` may have changed; drop the cached auth record
+            from event_planner_api.app.core.security import bump_user_cache
+            bump_user_cache(updated["email"])
             # Record audit log on update
             try:
                 from event_planner_api.app.services.audit_service import AuditService
@@ -247,7 +250,7 @@ class UserService:
         try:
             cursor = conn.cursor()
             # Проверяем существование
-            row = cursor.execute("SELECT id FROM users WHERE id = ?", (user_id,)).fetchone()
+            row = cursor.execute("SELECT id, email FROM users WHERE id = ?", (user_id,)).fetchone()
             if not row:
                 raise ValueError(f"User {user_id} not found")
             # Удаляем связанные записи
@@ -260,6 +263,9 @@ class UserService:
             # Наконец удаляем самого пользователя
             cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
             conn.commit()
+            # Удалённый пользователь не должен проходить аутентификацию из кэша
+            from event_planner_api.app.core.security import bump_user_cache
+            bump_user_cache(row["email"])
             # Record audit log for deletion
             try:
                 from event_planner_api.app.services.audit_service import AuditService